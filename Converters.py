@@ -983,3 +983,21 @@ Speed = Converter({
 })
 
 
+
+# Unit families used by Converter.autoscale to pick a readable unit for a result
+Length.add_family("SI", [
+    "qm", "rm", "ym", "zm", "am", "fm", "pm", "nm", "µm", "mm", "cm", "dm", "m",
+    "dam", "hm", "km", "Mm", "Gm", "Tm", "Pm", "Em", "Zm", "Ym", "Rm", "Qm",
+])
+Weight.add_family("SI", [
+    "qg", "rg", "yg", "zg", "ag", "fg", "pg", "ng", "ug", "mg", "cg", "dg", "g",
+    "dag", "hg", "kg", "Mg", "Gg", "Tg", "Pg", "Eg", "Zg", "Yg", "Rg", "Qg",
+])
+Volume.add_family("SI", [
+    "qL", "rL", "yL", "zL", "aL", "fL", "pL", "nL", "µL", "mL", "cL", "dL", "L",
+    "daL", "hL", "kL", "ML", "GL", "TL", "PL", "EL", "ZL", "YL", "RL", "QL",
+])
+Area.add_family("SI", [
+    "qm²", "rm²", "ym²", "zm²", "am²", "fm²", "pm²", "nm²", "µm²", "mm²", "cm²", "dm²", "m²",
+    "dam²", "hm²", "km²", "Mm²", "Gm²", "Tm²", "Pm²", "Em²", "Zm²", "Ym²", "Rm²", "Qm²",
+])
@@ -0,0 +1,166 @@
+"""
+Unit-Aware Aggregation
+
+Every unit of a Converter is an affine map of the base unit, so the sum, mean,
+minimum and maximum of many values can be computed in their source unit and
+converted once, instead of converting every value first:
+
+    - mean, min and max are converted like a single value; when the pair's scale
+      ratio is negative (e.g. ºC to ºD or ºLi) min and max swap
+    - a sum of n values picks up the target offset n times (none for deltas)
+
+RunningAggregate keeps these statistics incrementally, so aggregates over data that
+does not fit in memory can be fed chunk by chunk.
+
+Example Usage:
+    >>> from Converters import Temperature
+    >>> round(Temperature.aggregate([20, 22, 24], "ºC", "°F", "mean"), 6)
+    71.6
+"""
+
+from collections.abc import Sized
+from itertools import islice
+
+OPERATIONS = ("sum", "mean", "min", "max", "count")
+# Values of an unsized iterable reduced per chunk, bounding memory for long streams
+CHUNK_SIZE = 8192
+
+
+class RunningAggregate:
+    """
+    Streaming count, sum, minimum and maximum of values, reported in a target unit.
+
+    Attributes:
+        count (int): Number of values added
+    """
+
+    def __init__(self, converter, origin_unit, final_unit, delta=False):
+        """
+        Args:
+            converter (Converter): The converter both units belong to
+            origin_unit (str): The unit of the values that will be added
+            final_unit (str): The unit results are reported in
+            delta (bool): Flag indicating whether the values are deltas/intervals
+
+        Raises:
+            ValueError: If either unit is not in the converter's units dictionary
+        """
+        self._converter = converter
+        self._plan = converter._pair_plan(origin_unit, final_unit, delta)
+        origin_offset, origin_scale, final_scale, final_offset = self._plan
+        self._reversed = (final_scale / origin_scale) < 0
+        self.count = 0
+        self._total = 0.0
+        self._minimum = None
+        self._maximum = None
+
+    def add(self, value):
+        """
+        Add one value in the origin unit.
+        """
+        self.count += 1
+        self._total += value
+        if self._minimum is None or value < self._minimum:
+            self._minimum = value
+        if self._maximum is None or value > self._maximum:
+            self._maximum = value
+
+    def extend(self, values):
+        """
+        Add many values in the origin unit.
+
+        Iterators and generators are consumed in chunks of CHUNK_SIZE values, so
+        streams of any length are aggregated in bounded memory.
+        """
+        if isinstance(values, Sized):
+            self._extend_chunk(values)
+            return
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, CHUNK_SIZE))
+            if not chunk:
+                return
+            self._extend_chunk(chunk)
+
+    def _extend_chunk(self, values):
+        """
+        Add a sized collection of values.
+        """
+        if not len(values):
+            return
+        # Built-in reductions run at C speed over the chunk
+        low, high = min(values), max(values)
+        self.count += len(values)
+        self._total += sum(values)
+        if self._minimum is None or low < self._minimum:
+            self._minimum = low
+        if self._maximum is None or high > self._maximum:
+            self._maximum = high
+
+    def merge(self, other):
+        """
+        Add the values of another aggregate over the same unit pair, e.g. from a worker.
+        """
+        if other._plan != self._plan:
+            raise ValueError("Cannot merge aggregates of different unit pairs.")
+        if other.count:
+            self.count += other.count
+            self._total += other._total
+            if self._minimum is None or other._minimum < self._minimum:
+                self._minimum = other._minimum
+            if self._maximum is None or other._maximum > self._maximum:
+                self._maximum = other._maximum
+
+    def sum(self):
+        """
+        Sum of the values in the target unit (equal to summing the converted values).
+        """
+        origin_offset, origin_scale, final_scale, final_offset = self._plan
+        count = self.count
+        return (self._total - count * origin_offset) / origin_scale * final_scale + count * final_offset
+
+    def mean(self):
+        """
+        Mean of the values in the target unit.
+
+        Raises:
+            ValueError: If no values were added
+        """
+        self._require_values("mean")
+        return self._converter._apply_plan(self._total / self.count, self._plan)
+
+    def min(self):
+        """
+        Smallest value in the target unit.
+
+        Raises:
+            ValueError: If no values were added
+        """
+        self._require_values("min")
+        extreme = self._maximum if self._reversed else self._minimum
+        return self._converter._apply_plan(extreme, self._plan)
+
+    def max(self):
+        """
+        Largest value in the target unit.
+
+        Raises:
+            ValueError: If no values were added
+        """
+        self._require_values("max")
+        extreme = self._minimum if self._reversed else self._maximum
+        return self._converter._apply_plan(extreme, self._plan)
+
+    def result(self, op):
+        """
+        Return one statistic by name: "sum", "mean", "min", "max" or "count".
+        """
+        if op not in OPERATIONS:
+            raise ValueError(f"op must be one of {', '.join(OPERATIONS)}, not {op!r}")
+        if op == "count":
+            return self.count
+        return getattr(self, op)()
+
+    def _require_values(self, op):
+        if not self.count:
+            raise ValueError(f"{op} of no values")
@@ -1,6 +1,35 @@
+import hashlib
+import math
+import re
+from bisect import bisect_left
 from numbers import Number
 from typing import Union, Tuple, Dict, List
 from collections.abc import Iterable, MutableMapping,MutableSequence,MutableSet
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+
+# A number (optionally signed, with exponent), optional space and the rest as unit symbol
+_QUANTITY_PATTERN = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$")
+
+
+class InvalidUnitError(ValueError):
+    """
+    Raised when a unit symbol is not in a converter's units dictionary.
+
+    Attributes:
+        suggestions (dict): Each unknown unit mapped to a list of similar valid
+            unit symbols, best first (empty if nothing is close)
+    """
+
+    def __init__(self, message, suggestions):
+        self.suggestions = dict(suggestions)
+        hints = [(unit, names) for unit, names in self.suggestions.items() if names]
+        if hints:
+            parts = [" or ".join(repr(name) for name in names) + (f" for {unit!r}" if len(hints) > 1 else "")
+                     for unit, names in hints]
+            message = f"{message} (did you mean {', '.join(parts)}?)"
+        super().__init__(message)
 
 
 class Converter:
@@ -14,7 +43,15 @@ class Converter:
     Attributes:
         units (Dict[str, Tuple[Number, Number]]): Dictionary of unit symbols mapped to 
             their conversion factors as (scale_factor, offset) tuples.
+        cache_limits (Dict[str, int]): Maximum entries of the pair plan, factor matrix,
+            scale index and compiled expression caches (None for no limit); see
+            `set_cache_limits`.
     """
+
+    cache_limits = {"plans": None, "factor_matrices": 2, "scale_indexes": 64, "expressions": 1024}
+    # Attribute of each cache bounded by `cache_limits`
+    _bounded_caches = {"plans": "_plans", "factor_matrices": "_factor_matrices",
+                       "scale_indexes": "_scale_indexes", "expressions": "_expressions"}
     
     def __init__(self, units: Dict[str, Union[Number, Tuple[Number, Number], List[Number]]]):
         """
@@ -37,19 +74,22 @@ class Converter:
             For simple unit types (length, weight, etc.), offset is typically 0.
             For units with different zero points (like temperature), offset is non-zero.
         """
-        self.units = units
+        self.families = {}
+        self._reset_caches()
+        # Work on a copy so the caller's dictionary is never modified
+        units = dict(units)
 
-        # Iterate over the keys and values in the `self.units` dictionary
-        for unit, value in self.units.items():
+        # Iterate over the keys and values in the `units` dictionary
+        for unit, value in units.items():
             # Check if the value is a single number
             if isinstance(value, Number):
                 # If it's a number, convert it to a tuple (value, 1)
-                self.units[unit] = (value, 1)
+                units[unit] = (value, 1)
             # Check if the value is a list with exactly two numbers
             elif isinstance(value, list):
                 if len(value) == 2 and all(isinstance(i, Number) for i in value):
                     # Convert the list to a tuple
-                    self.units[unit] = tuple(value)
+                    units[unit] = tuple(value)
                 else:
                     raise ValueError(f"The value for '{unit}' must be a list with exactly two numbers.")
             # Check if the value is already a tuple with exactly two numbers
@@ -60,55 +100,509 @@ class Converter:
                     raise ValueError(f"The value for '{unit}' must be a tuple with exactly two numbers.")
             else:
                 raise TypeError(f"The value for '{unit}' must be a valid number, list of two numbers, or a tuple of two numbers.")
+        self.units = units
+
+    @property
+    def units(self):
+        """
+        The unit table. Any change to it drops the cached pair plans and scale indexes.
+        """
+        return self._units
+
+    @units.setter
+    def units(self, units):
+        self._units = UnitTable(units, self.invalidate_caches)
+        self.invalidate_caches()
+
+    def __getstate__(self):
+        # Caches and the change hook are rebuilt on unpickling
+        state = {"units": dict(self.units), "families": dict(self.families)}
+        if "cache_limits" in self.__dict__:
+            state["cache_limits"] = self.cache_limits
+        return state
 
-    def convert(self, value, origin_unit, final_unit, delta=False, inplace=False):
+    def __setstate__(self, state):
+        if "cache_limits" in state:
+            self.cache_limits = state["cache_limits"]
+        self._reset_caches()
+        self.units = state["units"]
+        self.families = state["families"]
+
+    def _reset_caches(self):
+        """
+        Create empty caches, bounded by `cache_limits`.
+        """
+        for name, attribute in self._bounded_caches.items():
+            setattr(self, attribute, _bounded_cache(self.cache_limits[name]))
+        self._equivalence = {}
+        self._suggestion_index = None
+
+    def set_cache_limits(self, **limits):
+        """
+        Set the maximum number of entries of this converter's caches.
+
+        When a cache is full, its least recently used entry is evicted. Cached
+        entries are kept up to the new limit.
+
+        Args:
+            plans (int): Pair plans (one per unit pair and delta flag); None for no limit
+            factor_matrices (int): Factor matrices (one per delta flag); None for no limit
+            scale_indexes (int): Scale indexes of `autoscale` (one per family); None for no limit
+            expressions (int): Compiled expressions of `evaluate`; None for no limit
+
+        Raises:
+            ValueError: If a cache name or limit is invalid
+        """
+        for name, limit in limits.items():
+            if name not in self.cache_limits:
+                raise ValueError(f"Unknown cache: {name} (choose from {', '.join(self.cache_limits)})")
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ValueError(f"Cache limit must be a positive integer or None, not {limit!r}")
+        self.cache_limits = dict(self.cache_limits, **limits)
+        for name in limits:
+            attribute = self._bounded_caches[name]
+            setattr(self, attribute, _bounded_cache(self.cache_limits[name], getattr(self, attribute)))
+
+    def memory_report(self):
+        """
+        Estimate the memory held by this converter's unit table, families and caches.
+
+        Sizes are `sys.getsizeof` walks of each part (see `memory.deep_sizeof`);
+        objects shared between parts are counted once, in the first part listed.
+
+        Returns:
+            dict: Bytes per part ("units", "families", "plans", "scale_indexes",
+            "factor_matrices", "equivalence", "suggestion_index", "expressions"), the
+            "total", and the number of "entries" and "evictions" of each cache
+        """
+        from memory import deep_sizeof
+        parts = {
+            "units": self.units,
+            "families": self.families,
+            "plans": self._plans,
+            "scale_indexes": self._scale_indexes,
+            "factor_matrices": self._factor_matrices,
+            "equivalence": self._equivalence,
+            "suggestion_index": self._suggestion_index,
+            "expressions": self._expressions,
+        }
+        seen = set()
+        report = {name: deep_sizeof(part, seen) for name, part in parts.items()}
+        report["total"] = sum(report.values())
+        caches = {name: getattr(self, attribute) for name, attribute in self._bounded_caches.items()}
+        report["entries"] = {name: len(cache) for name, cache in caches.items()}
+        report["evictions"] = {name: getattr(cache, "evictions", 0) for name, cache in caches.items()}
+        return report
+
+    @classmethod
+    def _from_validated(cls, units, families=None):
+        """
+        Build a converter from a table already normalized to (scale_factor, offset)
+        tuples, e.g. one loaded from a snapshot, without re-running validation.
+        """
+        converter = cls.__new__(cls)
+        converter._reset_caches()
+        converter.units = units
+        converter.families = dict(families or {})
+        return converter
+
+    def freeze(self):
+        """
+        Return an immutable copy of this converter.
+
+        Returns:
+            FrozenConverter: A converter whose units and families cannot change, so its
+                cached plans can be shared between threads without locking
+        """
+        return FrozenConverter._from_validated(self.units, self.families)
+
+    @classmethod
+    def from_file(cls, path, cache_dir=None):
+        """
+        Create a converter from a JSON, TOML or CSV unit definition file.
+
+        Args:
+            path (str): The unit definition file (see `unit_files` for the layouts)
+            cache_dir (str): Where to cache the compiled table; defaults to a
+                `__unitcache__` directory next to the file, False disables it
+
+        Returns:
+            Converter: A converter for the units, aliases and prefixed units in the file
+        """
+        from unit_files import load_units
+        return cls._from_validated(load_units(path, cache_dir))
+
+    def convert(self, value, origin_unit, final_unit, delta=False, inplace=False, errors="raise", fill=math.nan):
         """
             Converts a value or collection (number, string, dict, list, iterable) from one unit to another, optionally as a delta or in place; raises TypeError for unsupported types or invalid strings.
+
+            ``errors`` controls what happens to values that cannot be converted:
+                - "raise" (default): raise on the first bad value
+                - "coerce": write ``fill`` (NaN by default) for bad values and keep going
+                - "collect": like "coerce", but return a tuple (result, failures) where
+                  failures lists the indices (or dict keys) of the bad values; a single
+                  bad value is reported as index 0
+            Invalid units always raise ValueError before any value is converted. With
+            ``inplace`` and "raise", a bad element leaves the collection unchanged.
             """
+        if errors not in ("raise", "coerce", "collect"):
+            raise ValueError(f"errors must be 'raise', 'coerce' or 'collect', not {errors!r}")
+        failures = None if errors == "raise" else []
+        result = self._convert(value, origin_unit, final_unit, delta, inplace, fill, failures)
+        if errors == "collect":
+            return result, failures
+        return result
+
+    def _convert(self, value, origin_unit, final_unit, delta, inplace, fill, failures):
+        """
+        Dispatch a conversion on the type of `value`; `failures` is None to fail fast,
+        otherwise the list bad positions are recorded in.
+        """
         if isinstance(value,str):
             try:
                 value=float(value)
             except ValueError:
-                raise TypeError("type not supported")
+                return self._reject(value, origin_unit, final_unit, fill, failures)
+        # Equivalent units (synonyms) convert without touching the values; when bad
+        # values are being coerced or collected every element still has to be checked
+        identity = failures is None and self.equivalent(origin_unit, final_unit, delta)
         if isinstance(value, Number):
-            return self._single_convertion(value, origin_unit, final_unit, delta)
+            if identity:
+                return value
+            if failures is None:
+                return self._single_convertion(value, origin_unit, final_unit, delta)
+            convert = self._element_converter(self._pair_plan(origin_unit, final_unit, delta), fill, failures)
+            return convert(value, 0)
         elif isinstance(value, MutableMapping):
-            return self._dict_convertion(value, origin_unit, final_unit, delta,inplace)
-        elif isinstance(value, MutableSequence):
-            return self._mut_sequence_convertion(value, origin_unit, final_unit, delta,inplace)
+            if identity:
+                return value if inplace else dict(value)
+            return self._dict_convertion(value, origin_unit, final_unit, delta,inplace, fill, failures)
+        elif isinstance(value, (MutableSequence, array)):
+            # array.array is only registered as a MutableSequence from Python 3.10
+            if identity:
+                return value if inplace else list(value)
+            return self._mut_sequence_convertion(value, origin_unit, final_unit, delta,inplace, fill, failures)
         elif isinstance(value, Iterable):
-            return self._imut_iterable_convertion(value, origin_unit, final_unit, delta)
+            if identity:
+                # Immutable inputs are returned as they are; others are copied, as
+                # for non-equivalent units
+                if isinstance(value, (tuple, frozenset)):
+                    return value
+                return type(value)(list(value))
+            return self._imut_iterable_convertion(value, origin_unit, final_unit, delta, fill, failures)
         else:
+            return self._reject(value, origin_unit, final_unit, fill, failures)
+
+    def _reject(self, value, origin_unit, final_unit, fill, failures):
+        """
+        Handle a top-level value of an unsupported type.
+        """
+        if failures is None:
             raise TypeError("type not supported")
+        # Still report invalid units rather than hiding them behind the fill value
+        self._pair_plan(origin_unit, final_unit)
+        failures.append(0)
+        return fill
 
-    def _mut_sequence_convertion(self, value: Iterable, origin_unit: str, final_unit: str, delta,inplace):
+    def _element_converter(self, plan, fill, failures):
+        """
+        Return a function converting one element with `plan`, called as
+        convert(value, position). Bad elements raise when `failures` is None,
+        otherwise their position is recorded and `fill` is returned.
+        """
+        apply_plan = self._apply_plan
+        if failures is None:
+            return lambda value, position: apply_plan(value, plan)
+
+        def convert(value, position):
+            try:
+                return apply_plan(value, plan)
+            except (TypeError, ValueError, ArithmeticError):
+                failures.append(position)
+                return fill
+        return convert
+
+    def parse_quantity(self, text, default_unit=None):
+        """
+        Split a quantity string such as "12.5 ft", "-40 °F" or "1e3 nmi" into its value and unit.
+
+        Args:
+            text (str): The quantity string; space between value and unit is optional
+            default_unit (str): Unit used when the string holds a bare number
+
+        Returns:
+            tuple: (value as float, unit symbol)
+
+        Raises:
+            ValueError: If the string is not a quantity or its unit is not in the units dictionary
+        """
+        match = _QUANTITY_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"Invalid quantity: {text!r}")
+        number, unit = match.groups()
+        if not unit:
+            unit = default_unit
+        if unit not in self.units:
+            raise self._invalid_units(unit)
+        return float(number), unit
+
+    def convert_quantities(self, texts, final_unit, delta=False, default_unit=None, errors="raise", fill=math.nan):
+        """
+        Parse quantity strings that carry their own unit and convert them all to `final_unit`.
+
+        Each string is split once against the unit table and converted with the cached
+        plan of its unit pair, so a batch mixing units needs no grouping by the caller.
+
+        Args:
+            texts (Iterable[str]): Quantity strings, e.g. ["3.2 km", "98.6°F"]
+            final_unit (str): The target unit
+            delta (bool): Flag indicating whether these are delta/interval conversions
+            default_unit (str): Unit assumed for bare numbers
+            errors (str): "raise", "coerce" or "collect", as in `convert`
+            fill: Value written for strings that cannot be converted
+
+        Returns:
+            list: The converted values, or (values, failures) when errors is "collect"
+
+        Raises:
+            InvalidUnitError: If `final_unit` is invalid, or when errors is "raise" and
+                a string has a unit that is not in the units dictionary
+            ValueError: When errors is "raise" and a string cannot be parsed
+        """
+        if errors not in ("raise", "coerce", "collect"):
+            raise ValueError(f"errors must be 'raise', 'coerce' or 'collect', not {errors!r}")
+        if final_unit not in self.units:
+            raise self._invalid_units(final_unit)
+        match = _QUANTITY_PATTERN.match
+        units = self.units
+        pair_plan = self._pair_plan
+        apply_plan = self._apply_plan
+        converted = []
+        failures = []
+        for index, text in enumerate(texts):
+            found = match(text) if isinstance(text, str) else None
+            unit = (found.group(2) or default_unit) if found is not None else None
+            if unit not in units:
+                if errors == "raise":
+                    if unit is None:
+                        raise ValueError(f"Invalid quantity: {text!r}")
+                    raise self._invalid_units(unit)
+                failures.append(index)
+                converted.append(fill)
+                continue
+            converted.append(apply_plan(float(found.group(1)), pair_plan(unit, final_unit, delta)))
+        if errors == "collect":
+            return converted, failures
+        return converted
+
+    def _expression(self, text):
+        """
+        Return the compiled expression of a text, compiling and caching it on first use.
+        """
+        expression = self._expressions.get(text)
+        if expression is None:
+            from expressions import compile_expression
+            expression = compile_expression(self, text)
+            self._expressions[text] = expression
+        return expression
+
+    def evaluate(self, text, final_unit, delta=False, default_unit=None):
+        """
+        Evaluate a compound measurement such as "5 ft 3 in" or "1 mi + 200 yd" in `final_unit`.
+
+        See `expressions.py` for the syntax. Compiled expressions are cached by text.
+
+        Args:
+            text (str): The expression
+            final_unit (str): The unit of the result
+            delta (bool): Flag indicating whether this is a delta/interval conversion
+            default_unit (str): Unit of bare numbers in the expression
+
+        Returns:
+            float: The value of the expression in `final_unit`
+
+        Raises:
+            InvalidUnitError: If a unit is not in the units dictionary
+            ValueError: If the text is not a valid expression
+
+        Example:
+            >>> Converter({"m": (1, 0), "km": (0.001, 0)}).evaluate("1 km + 50 m", "m")
+            1050.0
+        """
+        if final_unit not in self.units:
+            raise self._invalid_units(final_unit)
+        default = None
+        if default_unit is not None:
+            if default_unit not in self.units:
+                raise self._invalid_units(default_unit)
+            default = self.units[default_unit]
+        base = self._expression(text).base_value(delta, default)
+        final_scale, final_offset = self.units[final_unit]
+        return base * final_scale + (0 if delta else final_offset)
+
+    def evaluate_many(self, texts, final_unit, delta=False, default_unit=None, errors="raise", fill=math.nan):
+        """
+        Evaluate many expressions in `final_unit`.
+
+        Args:
+            texts (Iterable[str]): The expressions
+            final_unit, delta, default_unit: As in `evaluate`
+            errors (str): "raise", "coerce" or "collect", as in `convert`
+            fill: Value written for expressions that cannot be evaluated
+
+        Returns:
+            list: The values, or (values, failures) when errors is "collect"
+        """
+        if errors not in ("raise", "coerce", "collect"):
+            raise ValueError(f"errors must be 'raise', 'coerce' or 'collect', not {errors!r}")
+        evaluate = self.evaluate
+        converted = []
+        failures = []
+        for index, text in enumerate(texts):
+            try:
+                converted.append(evaluate(text, final_unit, delta, default_unit))
+            except (ValueError, TypeError):
+                if errors == "raise":
+                    raise
+                failures.append(index)
+                converted.append(fill)
+        if errors == "collect":
+            return converted, failures
+        return converted
+
+    def convert_mixed(self, values, units, final_unit, delta=False, errors="raise", fill=math.nan):
+        """
+        Convert a batch where every value has its own source unit.
+
+        The unit column is mapped to one pair plan per distinct unit, then all values
+        are converted in a single pass. NumPy arrays are converted with array
+        arithmetic and give a NumPy array back.
+
+        Args:
+            values (Iterable[Number]): The values
+            units (Iterable[str]): The source unit of each value, e.g. ["ft", "m", "in"]
+            final_unit (str): The target unit
+            delta (bool): Flag indicating whether these are delta/interval conversions
+            errors (str): "raise", "coerce" or "collect", as in `convert`; unknown
+                source units count as bad values
+            fill: Value written for values that cannot be converted
+
+        Returns:
+            list: The converted values, or (values, failures) when errors is "collect"
+
+        Raises:
+            ValueError: If `final_unit` is invalid, the columns differ in length, or
+                when errors is "raise" and a value or unit is invalid
+        """
+        if errors not in ("raise", "coerce", "collect"):
+            raise ValueError(f"errors must be 'raise', 'coerce' or 'collect', not {errors!r}")
+        if final_unit not in self.units:
+            raise self._invalid_units(final_unit)
+        if hasattr(values, "__len__") and hasattr(units, "__len__") and len(values) != len(units):
+            raise ValueError(f"Got {len(values)} values but {len(units)} units")
+        if type(values).__module__ == "numpy":
+            converted, failures = self._convert_mixed_numpy(values, units, final_unit, delta, errors, fill)
+        else:
+            failures = [] if errors != "raise" else None
+            # One element converter per distinct source unit
+            by_unit = {}
+            converted = []
+            for index, (value, unit) in enumerate(zip(values, units)):
+                convert = by_unit.get(unit)
+                if convert is None:
+                    if unit not in self.units:
+                        if failures is None:
+                            raise self._invalid_units(unit)
+                        failures.append(index)
+                        converted.append(fill)
+                        continue
+                    convert = by_unit[unit] = self._element_converter(
+                        self._pair_plan(unit, final_unit, delta), fill, failures)
+                converted.append(convert(value, index))
+        if errors == "collect":
+            return converted, failures
+        return converted
+
+    def _convert_mixed_numpy(self, values, units, final_unit, delta, errors, fill):
+        """
+        NumPy version of `convert_mixed`: gather the plan factors by unit id and
+        convert with array arithmetic.
+        """
+        import numpy
+        # Ids by first appearance, from a dict rather than sorting, so None or
+        # non-string units are bad units as in the list path, not a TypeError
+        ids = {}
+        unit_ids = numpy.fromiter((ids.setdefault(unit, len(ids)) for unit in units), dtype=numpy.intp)
+        names = list(ids)
+        factors = numpy.empty((len(names), 4))
+        valid = numpy.ones(len(names), dtype=bool)
+        for unit_id, unit in enumerate(names):
+            if unit in self.units:
+                factors[unit_id] = self._pair_plan(unit, final_unit, delta)
+            elif errors == "raise":
+                raise self._invalid_units(unit)
+            else:
+                factors[unit_id] = (0, 1, 1, 0)
+                valid[unit_id] = False
+        rows = factors[unit_ids]
+        converted = (values - rows[:, 0]) / rows[:, 1] * rows[:, 2] + rows[:, 3]
+        bad_rows = ~valid[unit_ids]
+        converted[bad_rows] = fill
+        return converted, numpy.flatnonzero(bad_rows).tolist()
+
+    def _mut_sequence_convertion(self, value: Iterable, origin_unit: str, final_unit: str, delta,inplace, fill=math.nan, failures=None):
         """
         Converts each element in an mutable iterable from the origin unit to the final unit.
         Returns the iterable of the same type as the input.
+
+        With ``inplace`` every slot is written back without building a temporary list;
+        ``array.array`` of floats is written through a memoryview. When bad elements
+        raise, every element is converted once before the first slot is written, so a
+        bad element leaves the sequence unchanged.
         """
-        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta) for val in value]
-        if inplace:
-            value[:] = converted_values
+        convert = self._element_converter(self._pair_plan(origin_unit, final_unit, delta), fill, failures)
+        if not inplace:
+            return [convert(val, index) for index, val in enumerate(value)]
+        if isinstance(value, array) and value.typecode in "fd":
+            # Floats always convert, so write straight into the array buffer
+            with memoryview(value) as buffer:
+                for index in range(len(buffer)):
+                    buffer[index] = convert(buffer[index], index)
             return value
-        else:
-            return converted_values
+        if failures is None:
+            for index, val in enumerate(value):
+                convert(val, index)
+        for index in range(len(value)):
+            value[index] = convert(value[index], index)
+        return value
 
-    def _dict_convertion(self,value, origin_unit, final_unit, delta,inplace):
+    def _dict_convertion(self,value, origin_unit, final_unit, delta,inplace, fill=math.nan, failures=None):
         """
-                Converts all values in the dictionary from the origin unit to the final unit.
-                """
-        converted_dict = {key: self._single_convertion(val, origin_unit, final_unit, delta) for key, val in value.items()}
-        if inplace:
-            value.update(converted_dict)
-            return value
-        return converted_dict
+        Converts all values in the dictionary from the origin unit to the final unit.
+
+        With ``inplace`` each value is replaced under its existing key while iterating,
+        so peak memory stays at the size of the input mapping. When bad values raise,
+        every value is converted once before the first one is written, so a bad value
+        leaves the mapping unchanged.
+        """
+        convert = self._element_converter(self._pair_plan(origin_unit, final_unit, delta), fill, failures)
+        if not inplace:
+            return {key: convert(val, key) for key, val in value.items()}
+        if failures is None:
+            for key, val in value.items():
+                convert(val, key)
+        for key, val in value.items():
+            # Only existing keys are assigned, so the mapping never changes size
+            value[key] = convert(val, key)
+        return value
 
-    def _imut_iterable_convertion(self, value: Iterable, origin_unit: str, final_unit: str, delta):
+    def _imut_iterable_convertion(self, value: Iterable, origin_unit: str, final_unit: str, delta, fill=math.nan, failures=None):
         """
         Converts each element in an immutable iterable from the origin unit to the final unit.
         Returns the iterable of the same type as the input.
         """
-        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta) for val in value]
+        convert = self._element_converter(self._pair_plan(origin_unit, final_unit, delta), fill, failures)
+        converted_values = [convert(val, index) for index, val in enumerate(value)]
         return type(value)(converted_values)  # Return the iterable of the same type
 
     def _single_convertion(self, value, origin_unit, final_unit, delta=False):
@@ -117,7 +611,7 @@ class Converter:
         """
         # Check if both units are valid
         if origin_unit not in self.units.keys() or final_unit not in self.units.keys():
-            raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
+            raise self._invalid_units(origin_unit, final_unit)
 
         if delta:
             # For delta conversions, only apply scale factors (ignore offsets)
@@ -133,3 +627,430 @@ class Converter:
             final_value = base_value * self.units[final_unit][0] + self.units[final_unit][1]
 
         return final_value
+
+    def _pair_plan(self, origin_unit, final_unit, delta=False):
+        """
+        Resolve the factors of a unit pair, caching the result per converter.
+
+        Returns:
+            A tuple (origin_offset, origin_scale, final_scale, final_offset); offsets
+            are zero for delta conversions.
+
+        Raises:
+            InvalidUnitError: If either unit is not in the units dictionary
+        """
+        key = (origin_unit, final_unit, bool(delta))
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+        if origin_unit not in self.units.keys() or final_unit not in self.units.keys():
+            raise self._invalid_units(origin_unit, final_unit)
+        origin_scale, origin_offset = self.units[origin_unit]
+        final_scale, final_offset = self.units[final_unit]
+        if delta:
+            plan = (0, origin_scale, final_scale, 0)
+        else:
+            plan = (origin_offset, origin_scale, final_scale, final_offset)
+        self._plans[key] = plan
+        return plan
+
+    def affine(self, origin_unit, final_unit, delta=False):
+        """
+        Return the conversion of a unit pair as one affine map, for vectorized code.
+
+        Args:
+            origin_unit (str): The source unit
+            final_unit (str): The target unit
+            delta (bool): Flag indicating whether this is a delta/interval conversion
+
+        Returns:
+            tuple: (scale, offset) such that final_value = value * scale + offset
+
+        Raises:
+            ValueError: If either unit is not in the units dictionary
+        """
+        origin_offset, origin_scale, final_scale, final_offset = self._pair_plan(origin_unit, final_unit, delta)
+        scale = final_scale / origin_scale
+        return scale, final_offset - origin_offset * scale
+
+    def factor_matrix(self, delta=False):
+        """
+        Return the precomputed scale and offset matrices of all unit pairs.
+
+        The matrices are built on first use and cached until the units change.
+
+        Args:
+            delta (bool): Ignore offsets, as for delta/interval conversions
+
+        Returns:
+            FactorMatrix: See `factor_matrix.FactorMatrix`
+        """
+        matrix = self._factor_matrices.get(bool(delta))
+        if matrix is None:
+            from factor_matrix import FactorMatrix
+            matrix = FactorMatrix(self.units, delta)
+            self._factor_matrices[bool(delta)] = matrix
+        return matrix
+
+    def aggregate(self, values, origin_unit, final_unit, op, delta=False):
+        """
+        Compute a statistic of values and report it in another unit.
+
+        The statistic is computed in the origin unit and converted once, which gives
+        the same result as converting every value first (see `aggregate.py`).
+
+        Args:
+            values (Iterable[Number]): The values in the origin unit
+            origin_unit (str): The source unit
+            final_unit (str): The target unit
+            op (str): "sum", "mean", "min", "max" or "count"
+            delta (bool): Flag indicating whether the values are deltas/intervals
+
+        Returns:
+            The statistic in the target unit
+
+        Raises:
+            ValueError: If a unit or `op` is invalid, or mean/min/max of no values is requested
+        """
+        aggregate = self.accumulator(origin_unit, final_unit, delta)
+        aggregate.extend(values)
+        return aggregate.result(op)
+
+    def accumulator(self, origin_unit, final_unit, delta=False):
+        """
+        Return a RunningAggregate that collects values chunk by chunk.
+        """
+        from aggregate import RunningAggregate
+        return RunningAggregate(self, origin_unit, final_unit, delta)
+
+    def equivalence_classes(self, delta=False):
+        """
+        Group the units whose conversion factors are equal.
+
+        Factors are compared to 12 significant digits, so synonyms written with
+        slightly different literals (e.g. "ly/year" and "c") fall in one class.
+        The classes are computed once per unit table.
+
+        Args:
+            delta (bool): Compare scale factors only, as for delta/interval conversions
+
+        Returns:
+            dict: Unit symbols mapped to class ids; equal ids convert into each other unchanged
+        """
+        classes = self._equivalence.get(bool(delta))
+        if classes is None:
+            keys = {}
+            classes = {}
+            for unit, (scale, offset) in self.units.items():
+                key = (float(f"{scale:.12g}"), 0.0 if delta else float(f"{offset:.12g}"))
+                classes[unit] = keys.setdefault(key, len(keys))
+            self._equivalence[bool(delta)] = classes
+        return classes
+
+    def equivalent(self, unit_a, unit_b, delta=False):
+        """
+        Return True if converting between two units leaves values unchanged.
+
+        Unknown units are never equivalent to anything.
+        """
+        classes = self.equivalence_classes(delta)
+        class_a = classes.get(unit_a)
+        return class_a is not None and class_a == classes.get(unit_b)
+
+    def invalidate_caches(self):
+        """
+        Drop every cached pair plan, scale index, factor matrix, equivalence class,
+        suggestion index and compiled expression. Call this after changing `units` in place.
+        """
+        self._plans.clear()
+        self._scale_indexes.clear()
+        self._factor_matrices.clear()
+        self._equivalence.clear()
+        self._suggestion_index = None
+        self._expressions.clear()
+
+    def suggest_units(self, unit, limit=3):
+        """
+        Return up to `limit` unit symbols of this converter that resemble `unit`.
+
+        The bigram index behind it is built on first use and kept until the units change.
+
+        Example:
+            >>> Converter({"m": 1, "km": 0.001, "cm": 100}).suggest_units("kmm")
+            ['km']
+        """
+        index = self._suggestion_index
+        if index is None:
+            from suggestions import UnitIndex
+            index = self._suggestion_index = UnitIndex(self.units)
+        return index.suggest(unit, limit)
+
+    def _invalid_units(self, *units):
+        """
+        Build the InvalidUnitError of a failed unit lookup, with suggestions for the
+        units that are not in the units dictionary.
+        """
+        suggestions = {unit: self.suggest_units(unit) for unit in units
+                       if isinstance(unit, str) and unit not in self.units}
+        label = "unit" if len(units) == 1 else "units"
+        return InvalidUnitError(f"Invalid {label}: {', '.join(map(str, units))}", suggestions)
+
+    def add_family(self, name, units):
+        """
+        Register a named family of units that `autoscale` may choose from.
+
+        Args:
+            name (str): The family name, e.g. "SI"
+            units (Iterable[str]): Unit symbols of this converter without an offset
+
+        Raises:
+            ValueError: If a unit is unknown or has a non-zero offset
+        """
+        units = tuple(units)
+        self._scale_index(units)  # validate before registering
+        self.families[name] = units
+        self._scale_indexes.pop(name, None)
+
+    def _scale_index(self, family):
+        """
+        Return the family's (scale factors, unit symbols) sorted by scale factor.
+
+        The index is built once per family; `family` is a registered family name, an
+        iterable of unit symbols, or None for every unit without an offset.
+        """
+        key = family if family is None or isinstance(family, str) else tuple(family)
+        index = self._scale_indexes.get(key)
+        if index is not None:
+            return index
+        if key is None:
+            members = [unit for unit, (scale, offset) in self.units.items() if offset == 0]
+        elif isinstance(key, str):
+            if key not in self.families:
+                raise ValueError(f"Unknown unit family: {key}")
+            members = self.families[key]
+        else:
+            members = key
+        by_scale = {}
+        for unit in members:
+            if unit not in self.units:
+                raise self._invalid_units(unit)
+            scale, offset = self.units[unit]
+            if offset != 0 or scale <= 0:
+                raise ValueError(f"Unit '{unit}' cannot be used for autoscaling.")
+            # Synonyms share a scale factor; keep the first one listed
+            by_scale.setdefault(scale, unit)
+        if not by_scale:
+            raise ValueError("Cannot autoscale with an empty unit family.")
+        scales = sorted(by_scale)
+        index = (scales, [by_scale[scale] for scale in scales])
+        self._scale_indexes[key] = index
+        return index
+
+    def autoscale(self, value, unit, family=None):
+        """
+        Express a value in the family unit that gives the most readable magnitude.
+
+        The chosen unit is the largest one in which the value is at least 1 in
+        magnitude (or the smallest unit of the family for tiny values), found by
+        bisecting the family's sorted scale factors.
+
+        Args:
+            value (Number): The value to rescale
+            unit (str): The unit of `value`
+            family: A family name registered with `add_family`, an iterable of unit
+                symbols, or None for every unit of the converter without an offset
+
+        Returns:
+            tuple: (rescaled value, chosen unit)
+
+        Raises:
+            ValueError: If the unit or family is invalid
+        """
+        scales, names = self._scale_index(family)
+        if unit not in self.units:
+            raise self._invalid_units(unit)
+        return self._autoscale_one(value, unit, scales, names)
+
+    def autoscale_many(self, values, unit, family=None):
+        """
+        Autoscale every value of an iterable independently.
+
+        Returns:
+            list: (rescaled value, chosen unit) tuples in input order
+        """
+        scales, names = self._scale_index(family)
+        if unit not in self.units:
+            raise self._invalid_units(unit)
+        return [self._autoscale_one(value, unit, scales, names) for value in values]
+
+    def _autoscale_one(self, value, unit, scales, names):
+        """
+        Pick the unit for one value using a scale index from `_scale_index`.
+        """
+        origin_scale, origin_offset = self.units[unit]
+        base_value = (value - origin_offset) / origin_scale
+        magnitude = abs(base_value)
+        if magnitude == 0 or math.isinf(magnitude) or math.isnan(magnitude):
+            return value, unit
+        position = bisect_left(scales, 1 / magnitude)
+        if position == len(scales):
+            position -= 1
+        return base_value * scales[position], names[position]
+
+    @staticmethod
+    def _apply_plan(value, plan):
+        """
+        Convert a single value with a plan from `_pair_plan`.
+        """
+        origin_offset, origin_scale, final_scale, final_offset = plan
+        return (value - origin_offset) / origin_scale * final_scale + final_offset
+
+
+def _bounded_cache(limit, items=()):
+    """
+    Return a plain dict for an unlimited cache, or an LRUCache holding `limit` entries.
+    """
+    if limit is None:
+        return dict(items)
+    return LRUCache(limit, items)
+
+
+class LRUCache(OrderedDict):
+    """
+    A cache dictionary that evicts its least recently used entry when it is full.
+
+    Attributes:
+        maxsize (int): Maximum number of entries
+        evictions (int): Number of entries evicted so far
+    """
+
+    def __init__(self, maxsize, items=()):
+        self.maxsize = maxsize
+        self.evictions = 0
+        super().__init__()
+        for key, value in dict(items).items():
+            self[key] = value
+
+    def get(self, key, default=None):
+        try:
+            value = self[key]
+            self.move_to_end(key)
+        except KeyError:  # missing, or evicted by another thread meanwhile
+            return default
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        try:
+            self.move_to_end(key)
+        except KeyError:  # evicted by another thread meanwhile
+            pass
+        while len(self) > self.maxsize:
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                break
+            self.evictions += 1
+
+
+class UnitTable(dict):
+    """
+    A unit dictionary that reports every modification to its converter.
+
+    `Converter` stores its units in a UnitTable so that editing the table in place
+    (assigning, deleting, updating units) deterministically drops cached pair plans.
+    """
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, units, on_change):
+        super().__init__(units)
+        self._on_change = on_change
+
+    def __setitem__(self, unit, value):
+        super().__setitem__(unit, value)
+        self._on_change()
+
+    def __delitem__(self, unit):
+        super().__delitem__(unit)
+        self._on_change()
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def setdefault(self, unit, default=None):
+        value = super().setdefault(unit, default)
+        self._on_change()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenConverter(Converter):
+    """
+    An immutable Converter, created with `Converter.freeze()`.
+
+    Its units and families are read-only mappings, so pair plans and scale indexes
+    computed once stay valid forever and can be shared between threads (including
+    free-threaded CPython builds) without locks: concurrent cache misses at worst
+    compute the same immutable plan twice.
+
+    Attributes:
+        content_hash (str): SHA-256 digest of the unit table and families
+    """
+
+    @property
+    def units(self):
+        return self._units
+
+    @units.setter
+    def units(self, units):
+        if "_units" in self.__dict__:
+            raise TypeError("The units of a FrozenConverter cannot be changed.")
+        self._units = MappingProxyType(dict(units))
+
+    @property
+    def families(self):
+        return self._families
+
+    @families.setter
+    def families(self, families):
+        if "_families" in self.__dict__:
+            raise TypeError("The families of a FrozenConverter cannot be changed.")
+        self._families = MappingProxyType({name: tuple(units) for name, units in families.items()})
+
+    def add_family(self, name, units):
+        raise TypeError("The families of a FrozenConverter cannot be changed.")
+
+    def freeze(self):
+        return self
+
+    @property
+    def content_hash(self):
+        """
+        SHA-256 digest identifying the converter's contents; equal tables give equal hashes.
+        """
+        if "_content_hash" not in self.__dict__:
+            content = (sorted(self.units.items()), sorted(self.families.items()))
+            self._content_hash = hashlib.sha256(repr(content).encode("utf-8")).hexdigest()
+        return self._content_hash
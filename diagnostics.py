@@ -0,0 +1,237 @@
+"""
+GUI Diagnostics
+
+This module measures how the GUI spends time on the Tk main thread. It is opt-in:
+start the GUI with `--diagnostics` or set UNITCONV_DIAGNOSTICS=1.
+
+While enabled, a Profiler records:
+    - the duration of every instrumented handler (conversion, value trace callback,
+      combobox selection, ...)
+    - timestamps of input events (key presses and mouse clicks) and of result label
+      updates, so the latency from input to output can be read off a timeline
+    - late frames: a timer that should fire every 16 ms measures how late it runs,
+      which is how long the event loop was blocked
+
+A small overlay window shows live numbers. When the GUI exits the events are written
+as a Chrome trace (UNITCONV_TRACE, default "unitconv-trace.json"), which can be
+opened in chrome://tracing or https://ui.perfetto.dev.
+
+Example Usage:
+    >>> from diagnostics import Profiler
+    >>> profiler = Profiler()
+    >>> handler = profiler.wrap("handler", lambda: sum(range(1000)))
+    >>> handler()
+    499500
+    >>> profiler.summary()["handlers"]["handler"]["count"]
+    1
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+DIAGNOSTICS_VARIABLE = "UNITCONV_DIAGNOSTICS"
+TRACE_VARIABLE = "UNITCONV_TRACE"
+DEFAULT_TRACE_PATH = "unitconv-trace.json"
+
+
+def enabled(argv=()):
+    """
+    Return whether diagnostics were requested on the command line or in the environment.
+    """
+    return "--diagnostics" in argv or os.environ.get(DIAGNOSTICS_VARIABLE, "") not in ("", "0")
+
+
+class Profiler:
+    """
+    Collects handler durations, instant events and late frames for one process.
+
+    Attributes:
+        frame_interval (float): Expected seconds between frames
+        late_frames (int): Number of frames that ran late
+        dropped_frames (int): Number of whole frames missed while the loop was blocked
+    """
+
+    def __init__(self, max_events=100000, frame_interval=0.016, late_threshold=0.008):
+        """
+        Args:
+            max_events (int): Number of trace events kept; older ones are discarded
+            frame_interval (float): Expected seconds between frames
+            late_threshold (float): Seconds a frame may run late before it counts
+        """
+        self.frame_interval = frame_interval
+        self.late_threshold = late_threshold
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self._events = deque(maxlen=max_events)
+        self._handlers = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def _now(self):
+        """
+        Microseconds since the profiler was created, as Chrome traces expect.
+        """
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def record(self, name, start, duration, category="handler", args=None):
+        """
+        Record a completed span; `start` and `duration` are in microseconds.
+        """
+        event = {"name": name, "cat": category, "ph": "X", "ts": start, "dur": duration,
+                 "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            stats = self._handlers.get(name)
+            if stats is None:
+                stats = self._handlers[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            milliseconds = duration / 1000
+            stats["count"] += 1
+            stats["total_ms"] += milliseconds
+            stats["last_ms"] = milliseconds
+            stats["max_ms"] = max(stats["max_ms"], milliseconds)
+
+    def instant(self, name, category="event", args=None):
+        """
+        Record a point in time, e.g. an input event or a label update.
+        """
+        event = {"name": name, "cat": category, "ph": "i", "s": "t", "ts": self._now(),
+                 "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def wrap(self, name, function):
+        """
+        Return `function` wrapped to record the duration of every call under `name`.
+        """
+        @wraps(function)
+        def timed(*args, **kwargs):
+            start = self._now()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, start, self._now() - start)
+        return timed
+
+    def frame(self, delay):
+        """
+        Record a frame that ran `delay` seconds after it was due.
+        """
+        if delay <= self.late_threshold:
+            return
+        dropped = int(delay // self.frame_interval)
+        with self._lock:
+            self.late_frames += 1
+            self.dropped_frames += dropped
+            self._events.append({"name": "late frame", "cat": "frame", "ph": "X",
+                                 "ts": self._now() - delay * 1e6, "dur": delay * 1e6,
+                                 "pid": self._pid, "tid": threading.get_ident(),
+                                 "args": {"late_ms": round(delay * 1000, 3), "dropped": dropped}})
+            self._events.append({"name": "dropped frames", "ph": "C", "ts": self._now(),
+                                 "pid": self._pid, "args": {"dropped": self.dropped_frames}})
+
+    def summary(self):
+        """
+        Return per-handler statistics and frame counts.
+
+        Returns:
+            dict: {"handlers": {name: {"count", "total_ms", "mean_ms", "max_ms",
+            "last_ms"}}, "late_frames": int, "dropped_frames": int}
+        """
+        with self._lock:
+            handlers = {name: dict(stats, mean_ms=stats["total_ms"] / stats["count"])
+                        for name, stats in self._handlers.items()}
+            return {"handlers": handlers, "late_frames": self.late_frames,
+                    "dropped_frames": self.dropped_frames}
+
+    def export_chrome_trace(self, path):
+        """
+        Write the recorded events as a Chrome trace JSON file and return its path.
+        """
+        with self._lock:
+            events = list(self._events)
+        events.append({"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "unitconv"}})
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return path
+
+
+class FrameMonitor:
+    """
+    A Tk timer that reports how late each tick runs to a Profiler.
+    """
+
+    def __init__(self, root, profiler):
+        self.root = root
+        self.profiler = profiler
+        self._interval_ms = max(1, int(profiler.frame_interval * 1000))
+        self._due = None
+
+    def start(self):
+        self._due = time.perf_counter() + self._interval_ms / 1000
+        self.root.after(self._interval_ms, self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.profiler.frame(now - self._due)
+        self._due = now + self._interval_ms / 1000
+        self.root.after(self._interval_ms, self._tick)
+
+
+class DiagnosticsOverlay:
+    """
+    A small always-on-top window with live handler timings and frame counts.
+    """
+
+    def __init__(self, root, profiler, refresh_ms=500):
+        import tkinter as tk
+
+        self.profiler = profiler
+        self.refresh_ms = refresh_ms
+        self.window = tk.Toplevel(root)
+        self.window.title("Diagnostics")
+        self.window.attributes("-topmost", True)
+        self.text = tk.StringVar()
+        tk.Label(self.window, textvariable=self.text, justify=tk.LEFT, font=("Courier", 9)).pack(padx=6, pady=6)
+        self.window.after(self.refresh_ms, self.refresh)
+
+    def refresh(self):
+        summary = self.profiler.summary()
+        lines = [f"late frames {summary['late_frames']}  dropped {summary['dropped_frames']}"]
+        for name, stats in sorted(summary["handlers"].items()):
+            lines.append(f"{name[:28]:<28} {stats['count']:>6}x last {stats['last_ms']:7.2f} ms"
+                         f"  max {stats['max_ms']:7.2f} ms")
+        self.text.set("\n".join(lines))
+        self.window.after(self.refresh_ms, self.refresh)
+
+
+def install(root, overlay=True):
+    """
+    Start diagnostics for a Tk root window: record input events, watch for late
+    frames and optionally show the overlay.
+
+    Returns:
+        Profiler: The profiler to instrument handlers with
+    """
+    profiler = Profiler()
+    root.bind_all("<KeyPress>", lambda event: profiler.instant("key", args={"key": event.keysym}), add="+")
+    root.bind_all("<ButtonPress>", lambda event: profiler.instant("click", args={"button": event.num}), add="+")
+    FrameMonitor(root, profiler).start()
+    if overlay:
+        DiagnosticsOverlay(root, profiler)
+    return profiler
+
+
+def trace_path():
+    """
+    Return the path the trace is exported to: UNITCONV_TRACE or "unitconv-trace.json".
+    """
+    return os.environ.get(TRACE_VARIABLE) or DEFAULT_TRACE_PATH
@@ -0,0 +1,140 @@
+"""
+Compound Measurement Expressions
+
+This module parses measurements written as several quantities, such as "5 ft 3 in",
+"1 mi + 200 yd" or "20 ºC + 5 K", into a compiled Expression: a tuple of terms whose
+unit factors are resolved against one converter's unit table. Evaluating a compiled
+expression in a target unit is then a few multiplications, so converters cache
+expressions by their text (see `Converter.evaluate`).
+
+Syntax:
+    - Terms are a number optionally followed by a unit symbol; a term without a unit
+      uses the default unit given at evaluation
+    - Terms are joined by "+", "-" or only whitespace, which adds them
+    - Unit symbols are matched longest first, so symbols containing spaces or
+      hyphens ("sq ft", "ft-us") work; write "ft - 3 in" with spaces to subtract
+    - The first term is an absolute value and the following terms are deltas, so
+      "20 ºC + 5 K" is 25 ºC (with delta=True every term is a delta)
+
+Example Usage:
+    >>> from Converters import Length
+    >>> round(Length.evaluate("5 ft 3 in", "m"), 4)
+    1.6002
+"""
+
+import re
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SPACE = re.compile(r"\s*")
+
+
+class Expression:
+    """
+    A compiled compound measurement.
+
+    Attributes:
+        text (str): The source text
+        terms (tuple): (value, unit, scale_factor, offset) per term, with the sign
+            applied to value; unit, scale and offset are None for bare numbers
+    """
+
+    __slots__ = ("text", "terms", "_bases")
+
+    def __init__(self, text, terms):
+        self.text = text
+        self.terms = tuple(terms)
+        if all(unit is not None for _, unit, _, _ in self.terms):
+            self._bases = (self._base(False, None), self._base(True, None))
+        else:
+            self._bases = None
+
+    def _base(self, delta, default):
+        """
+        Sum the terms in base units.
+        """
+        total = 0.0
+        for position, (value, unit, scale, offset) in enumerate(self.terms):
+            if unit is None:
+                scale, offset = default
+            if position or delta:
+                total += value / scale
+            else:
+                total += (value - offset) / scale
+        return total
+
+    def base_value(self, delta=False, default=None):
+        """
+        Return the value of the expression in the converter's base unit.
+
+        Args:
+            delta (bool): Treat the first term as a delta too
+            default (tuple): (scale_factor, offset) of the unit of bare numbers
+
+        Raises:
+            ValueError: If the expression has bare numbers and no default unit
+        """
+        if self._bases is not None:
+            return self._bases[1 if delta else 0]
+        if default is None:
+            raise ValueError(f"No unit for the bare number in {self.text!r}")
+        return self._base(delta, default)
+
+    def __repr__(self):
+        return f"Expression({self.text!r})"
+
+
+def _match_unit(units, text, position):
+    """
+    Return the end of the longest unit symbol starting at `position` (or `position`).
+    """
+    length = len(text)
+    for end in range(length, position, -1):
+        # A symbol must end at the end of the text, at whitespace or before an operator
+        if end < length and not (text[end].isspace() or text[end] in "+-"):
+            continue
+        if text[position:end] in units:
+            return end
+    return position
+
+
+def compile_expression(converter, text):
+    """
+    Parse an expression and resolve its unit factors against a converter.
+
+    Args:
+        converter (Converter): The converter whose units the expression uses
+        text (str): The expression
+
+    Returns:
+        Expression: The compiled expression
+
+    Raises:
+        InvalidUnitError: If a unit symbol is not in the converter's units dictionary
+        ValueError: If the text is not a valid expression
+    """
+    units = converter.units
+    length = len(text)
+    position = _SPACE.match(text).end()
+    terms = []
+    while position < length:
+        sign = 1
+        if terms and text[position] in "+-":
+            sign = -1 if text[position] == "-" else 1
+            position = _SPACE.match(text, position + 1).end()
+        number = _NUMBER.match(text, position)
+        if number is None:
+            raise ValueError(f"Invalid expression: {text!r}")
+        position = _SPACE.match(text, number.end()).end()
+        end = _match_unit(units, text, position)
+        if end > position:
+            unit = text[position:end]
+            scale, offset = units[unit]
+            terms.append((sign * float(number.group()), unit, scale, offset))
+        else:
+            if position < length and not (text[position] in "+-" or text[position].isdigit() or text[position] == "."):
+                raise converter._invalid_units(text[position:].split()[0])
+            terms.append((sign * float(number.group()), None, None, None))
+        position = _SPACE.match(text, end).end()
+    if not terms:
+        raise ValueError(f"Invalid expression: {text!r}")
+    return Expression(text, terms)
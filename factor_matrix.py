@@ -0,0 +1,105 @@
+"""
+Pair-Factor Matrices
+
+This module precomputes the conversion of every unit pair of a converter as two NxN
+matrices: final_value = value * scale[i][j] + offset[i][j], where i and j are unit
+ids. The matrices are built once from the converter's scale and offset vectors and
+then serve as an O(1) lookup table in tight loops, or are exported as reference
+tables (CSV) or NumPy arrays.
+
+Example Usage:
+    >>> from Converters import Length
+    >>> matrix = Length.factor_matrix()
+    >>> m, ft = matrix.unit_id("m"), matrix.unit_id("ft")
+    >>> round(matrix.convert(10, m, ft), 3)
+    32.808
+"""
+
+import csv
+from array import array
+
+
+class FactorMatrix:
+    """
+    Scale and offset matrices for all unit pairs of a converter.
+
+    Attributes:
+        units (tuple): Unit symbols in id order
+        delta (bool): Whether offsets are ignored (delta/interval conversions)
+        scale (list): One array('d') row per origin unit id
+        offset (list): One array('d') row per origin unit id
+    """
+
+    def __init__(self, units, delta=False):
+        """
+        Build the matrices from a unit table.
+
+        Args:
+            units (dict): Unit symbols mapped to (scale_factor, offset) tuples
+            delta (bool): Ignore offsets, as for delta/interval conversions
+        """
+        self.units = tuple(units)
+        self.delta = delta
+        self._ids = {unit: unit_id for unit_id, unit in enumerate(self.units)}
+        scales = array("d", (units[unit][0] for unit in self.units))
+        offsets = array("d", (0 if delta else units[unit][1] for unit in self.units))
+        self.scale = []
+        self.offset = []
+        for origin_scale, origin_offset in zip(scales, offsets):
+            row = array("d", (final_scale / origin_scale for final_scale in scales))
+            self.scale.append(row)
+            self.offset.append(array("d", (final_offset - origin_offset * factor
+                                           for final_offset, factor in zip(offsets, row))))
+
+    def unit_id(self, unit):
+        """
+        Return the id of a unit symbol.
+
+        Raises:
+            ValueError: If the unit is not in the matrix
+        """
+        try:
+            return self._ids[unit]
+        except KeyError:
+            raise ValueError(f"Invalid unit: {unit}")
+
+    def lookup(self, origin_id, final_id):
+        """
+        Return the (scale, offset) of a pair of unit ids.
+        """
+        return self.scale[origin_id][final_id], self.offset[origin_id][final_id]
+
+    def convert(self, value, origin_id, final_id):
+        """
+        Convert a value between two unit ids.
+        """
+        return value * self.scale[origin_id][final_id] + self.offset[origin_id][final_id]
+
+    def to_csv(self, file, matrix="scale"):
+        """
+        Write one matrix as a CSV table with the unit symbols as header row and column.
+
+        Args:
+            file: A path or a text file object opened with newline=""
+            matrix (str): "scale" or "offset"
+        """
+        if matrix not in ("scale", "offset"):
+            raise ValueError(f"matrix must be 'scale' or 'offset', not {matrix!r}")
+        rows = self.scale if matrix == "scale" else self.offset
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as handle:
+                return self.to_csv(handle, matrix)
+        writer = csv.writer(file)
+        writer.writerow(("",) + self.units)
+        for unit, row in zip(self.units, rows):
+            writer.writerow([unit] + [repr(value) for value in row])
+
+    def to_numpy(self):
+        """
+        Return the (scale, offset) matrices as NumPy arrays (requires numpy).
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("Exporting factor matrices to NumPy requires the 'numpy' package")
+        return numpy.array(self.scale), numpy.array(self.offset)
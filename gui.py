@@ -6,9 +6,9 @@ It provides a user-friendly interface for converting between different units of
 with support for temperature, length, weight, and volume conversions.
 """
 
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
-import Converters
 class ConverterGUI:
     """
     A graphical user interface for the unit converter library.
@@ -23,12 +23,17 @@ class ConverterGUI:
         style (ttk.Style): Style configuration for the application
     """
     
-    def __init__(self, root, converters):
+    def __init__(self, root, converters, profiler=None):
         """
         Initialize the ConverterGUI with a root Tkinter window.
         
         Args:
             root (tk.Tk): The root Tkinter window
+            converters: A dictionary mapping names to converters, or a ConverterRegistry;
+                tabs of registry categories that are not loaded yet are built the
+                first time they are selected
+            profiler (diagnostics.Profiler): Records handler timings when diagnostics
+                are enabled; None disables instrumentation
         """
         self.root = root
         self.root.title("Unit Converter")
@@ -59,6 +64,11 @@ class ConverterGUI:
         # Set up the converters dictionary
         self.converters = converters
         
+        # Time the conversion handlers when diagnostics are enabled
+        self.profiler = profiler
+        self.convert = self.instrument("ConverterGUI.convert", self.convert)
+        self.swap_units = self.instrument("ConverterGUI.swap_units", self.swap_units)
+        
         # Create a menu bar
         self.create_menu()
         
@@ -66,14 +76,56 @@ class ConverterGUI:
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create tabs for each converter
-        for converter_name, converter in self.converters.items():
-            tab = self.create_converter_tab(converter_name, converter)
+        # Create tabs for each converter; plug-in categories get a placeholder until selected
+        self.pending_tabs = {}
+        names = converters.names() if hasattr(converters, "names") else list(converters)
+        for converter_name in names:
+            if hasattr(converters, "is_loaded") and not converters.is_loaded(converter_name):
+                tab = ttk.Frame(self.notebook, padding=10)
+                self.pending_tabs[str(tab)] = converter_name
+            else:
+                tab = self.create_converter_tab(converter_name, converters.get(converter_name))
             self.notebook.add(tab, text=converter_name)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
             
         # Set up keyboard shortcuts
         self.setup_keyboard_shortcuts()
     
+    def instrument(self, name, handler):
+        """
+        Return the handler wrapped to record its duration, or unchanged without a profiler.
+        
+        Args:
+            name (str): The name shown in the diagnostics overlay and trace
+            handler (callable): The event handler
+        """
+        if self.profiler is None:
+            return handler
+        return self.profiler.wrap(name, handler)
+    
+    def on_tab_changed(self, event):
+        """
+        Build the tab of a lazily loaded converter category the first time it is selected.
+        """
+        current_tab = self.notebook.select()
+        converter_name = self.pending_tabs.pop(current_tab, None)
+        if converter_name is None:
+            return
+        placeholder = self.notebook.nametowidget(current_tab)
+        try:
+            converter = self.converters.get(converter_name)
+        except Exception as e:
+            self.pending_tabs[current_tab] = converter_name
+            messagebox.showerror("Converter Error", f"Could not load {converter_name}: {str(e)}")
+            return
+        index = self.notebook.index(placeholder)
+        tab = self.create_converter_tab(converter_name, converter)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        self.notebook.insert(index, tab, text=converter_name)
+        self.notebook.select(tab)
+        self.bind_tab_shortcuts(tab)
+
     def create_converter_tab(self, converter_name, converter):
         """
         Create a tab for a specific converter.
@@ -122,9 +174,11 @@ class ConverterGUI:
                 from_unit.get(),
                 to_unit.get(),
                 delta_var.get(),
-                result_var
+                result_var,
+                autoscale_var.get()
             )
             
+        on_unit_change = self.instrument("ComboboxSelected", on_unit_change)
         from_dropdown.bind("<<ComboboxSelected>>", on_unit_change)
         to_dropdown.bind("<<ComboboxSelected>>", on_unit_change)
         
@@ -133,13 +187,17 @@ class ConverterGUI:
             # Get the current value
             value_str = value_var.get()
             
-            # Skip conversion if value is empty or not a valid number
+            # Skip conversion if value is empty or not a valid number or expression
             if not value_str.strip():
                 return
                 
             try:
-                # Try to convert to float to validate
-                float(value_str)
+                # Validate without error dialogs while the user is still typing;
+                # compiled expressions are cached, so convert() reuses this one
+                try:
+                    float(value_str)
+                except ValueError:
+                    converter.evaluate(value_str, from_unit.get(), delta_var.get(), default_unit=from_unit.get())
                 
                 # If valid, perform the conversion
                 self.convert(
@@ -148,14 +206,15 @@ class ConverterGUI:
                     from_unit.get(),
                     to_unit.get(),
                     delta_var.get(),
-                    result_var
+                    result_var,
+                    autoscale_var.get()
                 )
             except ValueError:
-                # If not a valid number, don't update the conversion
+                # If not a valid number or expression, don't update the conversion
                 pass
                 
         # Register the trace callback
-        value_var.trace_add("write", on_value_change)
+        value_var.trace_add("write", self.instrument("value trace_add", on_value_change))
         
         # Add a checkbox for delta conversion (for temperature)
         delta_var = tk.BooleanVar()
@@ -163,6 +222,13 @@ class ConverterGUI:
         delta_check = ttk.Checkbutton(input_frame, text="Delta/Interval Conversion", variable=delta_var)
         delta_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
         
+        # Add a checkbox to show results in the most readable unit (e.g. "Gm" instead of "m")
+        autoscale_var = tk.BooleanVar()
+        autoscale_var.set(False)
+        if converter.families:
+            autoscale_check = ttk.Checkbutton(input_frame, text="Auto-scale Result", variable=autoscale_var)
+            autoscale_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
         # Create the output section
         output_frame = ttk.LabelFrame(frame, text="Result", padding=10)
         output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -171,6 +237,9 @@ class ConverterGUI:
         result_var.set("0")
         result_label = ttk.Label(output_frame, textvariable=result_var, font=("Arial", 12))
         result_label.pack(fill=tk.BOTH, expand=True, pady=5)
+        if self.profiler is not None:
+            # Timestamp label updates so input-to-output latency shows in the trace
+            result_var.trace_add("write", lambda *args: self.profiler.instant("label update", args={"tab": converter_name}))
         
         # Create the buttons section
         button_frame = ttk.Frame(frame, padding=10)
@@ -186,7 +255,8 @@ class ConverterGUI:
                 from_unit.get(), 
                 to_unit.get(), 
                 delta_var.get(), 
-                result_var
+                result_var,
+                autoscale_var.get()
             )
         )
         convert_button.pack(side=tk.LEFT, padx=5)
@@ -201,7 +271,8 @@ class ConverterGUI:
                 from_unit,
                 to_unit,
                 delta_var.get(),
-                result_var
+                result_var,
+                autoscale_var.get()
             )
         )
         swap_button.pack(side=tk.LEFT, padx=5)
@@ -216,7 +287,7 @@ class ConverterGUI:
         
         return frame
     
-    def convert(self, converter, value_str, from_unit, to_unit, delta, result_var):
+    def convert(self, converter, value_str, from_unit, to_unit, delta, result_var, autoscale=False):
         """
         Convert a value from one unit to another.
         
@@ -227,6 +298,8 @@ class ConverterGUI:
             to_unit (str): The target unit
             delta (bool): Flag indicating whether this is a delta/interval conversion
             result_var (tk.StringVar): The StringVar to update with the result
+            autoscale (bool): Flag indicating whether to show the result in the most
+                readable unit of the target unit's family
         """
         try:
             # Validate input is not empty
@@ -234,26 +307,32 @@ class ConverterGUI:
                 messagebox.showerror("Invalid Input", "Please enter a value to convert.")
                 return
                 
-            # Validate input is a valid number
+            # Validate input is a valid number or a compound expression like "5 ft 3 in"
+            source_str = f"{value_str} {from_unit}"
             try:
                 value = float(value_str)
             except ValueError:
-                messagebox.showerror("Invalid Input", "Please enter a valid number.")
-                return
-            
-            # Validate units are not the same
-            if from_unit == to_unit:
-                # If units are the same, just format the result
-                if abs(value) < 0.001 or abs(value) > 1000:
-                    result_str = f"{value:.6e}"
-                else:
-                    result_str = f"{value:.6f}"
-                result_var.set(f"{value_str} {from_unit} = {result_str} {to_unit}")
-                return
+                try:
+                    value = converter.evaluate(value_str, from_unit, delta, default_unit=from_unit)
+                    source_str = value_str
+                except ValueError as error:
+                    messagebox.showerror("Invalid Input", f"Please enter a valid number or expression.\n\n{error}")
+                    return
             
             # Perform the conversion
             try:
-                result = converter.convert(value, from_unit, to_unit, delta)
+                if converter.equivalent(from_unit, to_unit, delta):
+                    # If units are the same or synonyms, just format the value
+                    result = value
+                else:
+                    result = converter.convert(value, from_unit, to_unit, delta)
+                
+                # Rescale to a more readable unit of the same family if requested
+                shown_unit = to_unit
+                if autoscale and not delta:
+                    family = self.find_family(converter, to_unit)
+                    if family is not None:
+                        result, shown_unit = converter.autoscale(result, to_unit, family)
                 
                 # Format the result
                 if abs(result) < 0.001 or abs(result) > 1000:
@@ -262,17 +341,18 @@ class ConverterGUI:
                     result_str = f"{result:.6f}"
                 
                 # Update the result label
-                result_var.set(f"{value_str} {from_unit} = {result_str} {to_unit}")
+                result_var.set(f"{source_str} = {result_str} {shown_unit}")
                 
             except ValueError as ve:
-                messagebox.showerror("Conversion Error", f"Invalid units: {from_unit}, {to_unit}")
+                # The message names the invalid units and any "did you mean" suggestions
+                messagebox.showerror("Conversion Error", str(ve))
             except Exception as e:
                 messagebox.showerror("Conversion Error", f"An error occurred during conversion: {str(e)}")
             
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
     
-    def swap_units(self, converter, value_str, from_unit, to_unit, delta, result_var):
+    def swap_units(self, converter, value_str, from_unit, to_unit, delta, result_var, autoscale=False):
         """
         Swap the from and to units and automatically perform the conversion.
         
@@ -283,6 +363,7 @@ class ConverterGUI:
             to_unit (tk.StringVar): The to unit StringVar
             delta (bool): Flag indicating whether this is a delta/interval conversion
             result_var (tk.StringVar): The StringVar to update with the result
+            autoscale (bool): Flag indicating whether to autoscale the result
         """
         # Swap the units
         from_value = from_unit.get()
@@ -291,7 +372,24 @@ class ConverterGUI:
         to_unit.set(from_value)
         
         # Automatically perform the conversion with the swapped units
-        self.convert(converter, value_str, from_unit.get(), to_unit.get(), delta, result_var)
+        self.convert(converter, value_str, from_unit.get(), to_unit.get(), delta, result_var, autoscale)
+
+    @staticmethod
+    def find_family(converter, unit):
+        """
+        Return the name of the first unit family of the converter containing a unit.
+        
+        Args:
+            converter (Converter): The converter object
+            unit (str): The unit to look up
+            
+        Returns:
+            str: The family name, or None if the unit belongs to no family
+        """
+        for name, members in converter.families.items():
+            if unit in members:
+                return name
+        return None
     
     def clear(self, value_entry, value_var, result_var):
         """
@@ -405,11 +503,14 @@ How to use:
 1. Select the converter tab (Temperature, Length, Weight, Volume)
 2. Enter a value to convert
    - Conversion updates automatically as you type
+   - Compound values such as "5 ft 3 in" or "1 mi + 200 yd" are accepted;
+     numbers without a unit are in the "From" unit
 3. Select the source unit from the "From" dropdown
    - Conversion updates automatically when changing units
 4. Select the target unit from the "To" dropdown
    - Conversion updates automatically when changing units
 5. For temperature, check "Delta/Interval Conversion" if needed
+   - Check "Auto-scale Result" to show the result in the most readable unit
 6. Use "Swap Units" to exchange the source and target units and automatically convert
 7. Use "Clear" to reset the input and result
 
@@ -450,23 +551,30 @@ Keyboard shortcuts:
         self.root.bind("<Alt-4>", lambda event, idx=3: self.notebook.select(idx))
         
         # Add bindings to each tab's value entry field
-        for i, tab_name in enumerate(self.converters.keys()):
-            tab = self.notebook.winfo_children()[i]
-            
-            # Find the value entry and add Enter key binding
-            for child in tab.winfo_children():
-                if isinstance(child, ttk.LabelFrame) and child.cget("text") == "Input":
-                    for widget in child.winfo_children():
-                        if isinstance(widget, ttk.Entry):
-                            # Bind Enter key to perform conversion
-                            widget.bind("<Return>", lambda event, t=tab: self.handle_enter_key(t))
-            
-            # Find the swap button and add Ctrl+S binding
-            for child in tab.winfo_children():
-                if isinstance(child, ttk.Frame):  # Button frame
-                    for button in child.winfo_children():
-                        if isinstance(button, ttk.Button) and button.cget("text") == "Swap Units":
-                            tab.bind("<Control-s>", lambda event, b=button: b.invoke())
+        for tab in self.notebook.winfo_children():
+            self.bind_tab_shortcuts(tab)
+    
+    def bind_tab_shortcuts(self, tab):
+        """
+        Bind Enter and Ctrl+S in one converter tab.
+        
+        Args:
+            tab (ttk.Frame): The converter tab
+        """
+        # Find the value entry and add Enter key binding
+        for child in tab.winfo_children():
+            if isinstance(child, ttk.LabelFrame) and child.cget("text") == "Input":
+                for widget in child.winfo_children():
+                    if isinstance(widget, ttk.Entry):
+                        # Bind Enter key to perform conversion
+                        widget.bind("<Return>", lambda event, t=tab: self.handle_enter_key(t))
+        
+        # Find the swap button and add Ctrl+S binding
+        for child in tab.winfo_children():
+            if isinstance(child, ttk.Frame):  # Button frame
+                for button in child.winfo_children():
+                    if isinstance(button, ttk.Button) and button.cget("text") == "Swap Units":
+                        tab.bind("<Control-s>", lambda event, b=button: b.invoke())
                             
     def handle_enter_key(self, tab):
         """
@@ -483,18 +591,27 @@ Keyboard shortcuts:
                         button.invoke()
                         return
 
-def main():
+def main(argv=None):
     """
     Main function to run the GUI application.
+    
+    Args:
+        argv (list): Command line arguments; `--diagnostics` (or UNITCONV_DIAGNOSTICS=1)
+            records handler timings, shows an overlay and writes a Chrome trace on exit
     """
-    converters = {
-        name: obj
-        for name, obj in vars(Converters).items()
-        if isinstance(obj, Converters.Converter)
-    }
+    argv = sys.argv[1:] if argv is None else argv
+    # Built-in categories plus plug-in packs, which are only loaded when their tab is opened
+    from registry import default_registry
+    converters = default_registry()
     root = tk.Tk()
-    app = ConverterGUI(root,converters)
+    profiler = None
+    import diagnostics
+    if diagnostics.enabled(argv):
+        profiler = diagnostics.install(root)
+    app = ConverterGUI(root,converters,profiler)
     root.mainloop()
+    if profiler is not None:
+        print(f"Diagnostics trace written to {profiler.export_chrome_trace(diagnostics.trace_path())}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
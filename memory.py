@@ -0,0 +1,168 @@
+"""
+Memory Reports
+
+This module estimates how much memory the converters take in a process, so the cost
+of running many worker processes can be planned and cache limits chosen (see
+`Converter.set_cache_limits`).
+
+Two measurements are available:
+    - `deep_sizeof` walks an object graph and sums `sys.getsizeof` of every object
+      reached once; `Converter.memory_report` uses it per table and cache
+    - `traced` runs a function under `tracemalloc` and reports the bytes it left
+      allocated and its peak; `import_footprint` does this for importing a module in
+      a fresh interpreter, which is what every worker process pays for `Converters`
+
+Run `python memory.py` for a report of the default converters.
+
+Example Usage:
+    >>> from memory import report
+    >>> sizes = report()
+    >>> sorted(sizes["converters"])[:2]
+    ['Area', 'Length']
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+# Shared by every converter or owned by the interpreter; never counted
+_SKIPPED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Return the bytes of an object and everything it references, each object counted once.
+
+    Containers (dicts, lists, tuples, sets), instance dictionaries and `__slots__` are
+    followed; classes, modules and functions are not.
+
+    Args:
+        obj: The object to measure
+        seen (set): Ids of objects already counted, to share across several calls
+
+    Returns:
+        int: The estimated size in bytes
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, _SKIPPED_TYPES) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, complex, bool)):
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for cls in type(current).__mro__:
+                for slot in getattr(cls, "__dict__", {}).get("__slots__", ()):
+                    value = getattr(current, slot, None)
+                    if not callable(value):
+                        stack.append(value)
+    return total
+
+
+def traced(function, *args, **kwargs):
+    """
+    Call a function under tracemalloc.
+
+    Returns:
+        tuple: (result, bytes still allocated afterwards, peak bytes during the call)
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        result = function(*args, **kwargs)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, after - before, max(0, peak - before)
+
+
+_FOOTPRINT_SCRIPT = """
+import json, sys, tracemalloc
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+__import__(sys.argv[1])
+after, peak = tracemalloc.get_traced_memory()
+print(json.dumps({"retained": after - before, "peak": peak - before}))
+"""
+
+
+def import_footprint(module="Converters"):
+    """
+    Measure with tracemalloc what importing a module allocates in a fresh interpreter.
+
+    Args:
+        module (str): The module to import, from this project's directory
+
+    Returns:
+        dict: {"retained": bytes still allocated after the import, "peak": bytes}
+    """
+    output = subprocess.run([sys.executable, "-c", _FOOTPRINT_SCRIPT, module], check=True,
+                            stdout=subprocess.PIPE, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return json.loads(output.stdout)
+
+
+def _loaded_converters():
+    from registry import default_registry
+    registry = default_registry()
+    return {name: registry.get(name) for name in registry.names() if registry.is_loaded(name)}
+
+
+def report(converters=None, trace=False):
+    """
+    Report the memory held by several converters.
+
+    Args:
+        converters (dict): Converters by name; defaults to the loaded categories of
+            the default registry (plug-ins that were never used are not loaded)
+        trace (bool): Also measure, with tracemalloc, what importing `Converters`
+            allocates in a fresh interpreter (see `import_footprint`)
+
+    Returns:
+        dict: {"converters": {name: Converter.memory_report()}, "total": bytes} and,
+        if trace is true, "import_converters": {"retained": bytes, "peak": bytes}
+    """
+    if converters is None:
+        converters = _loaded_converters()
+    reports = {name: converter.memory_report() for name, converter in converters.items()}
+    result = {"converters": reports, "total": sum(entry["total"] for entry in reports.values())}
+    if trace:
+        result["import_converters"] = import_footprint("Converters")
+    return result
+
+
+def format_report(result):
+    """
+    Format a `report` result as a text table in KiB.
+    """
+    parts = ("units", "families", "plans", "factor_matrices", "suggestion_index", "expressions", "total")
+    lines = [f"{'converter':<14}" + "".join(f"{part[:12]:>13}" for part in parts)]
+    for name, entry in result["converters"].items():
+        lines.append(f"{name:<14}" + "".join(f"{entry[part] / 1024:>13.1f}" for part in parts))
+    lines.append(f"{'all':<14}{result['total'] / 1024:>{13 * len(parts)}.1f}")
+    if "import_converters" in result:
+        imported = result["import_converters"]
+        lines.append(f"import Converters: {imported['retained'] / 1024:.1f} KiB retained, "
+                     f"{imported['peak'] / 1024:.1f} KiB peak (tracemalloc, fresh interpreter)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_report(report(trace=True)))
@@ -0,0 +1,130 @@
+"""
+Converter Plug-ins
+
+This module discovers converter packs outside `Converters.py` and registers them in a
+ConverterRegistry. Discovery reads metadata only (entry point names and file names);
+a pack's module is imported, or its converter built, the first time its category is
+used, so adding categories does not slow down start-up. Unit detection reads the unit
+symbols of unit files from their compiled table (see `unit_files.load_units`) without
+building a converter.
+
+Two kinds of packs are supported:
+    - Entry points in the "unitconv.converters" group of installed distributions. The
+      entry point name is the category and its object is a Converter, or a callable
+      returning one:
+
+          [project.entry-points."unitconv.converters"]
+          Pressure = "acme_units.pressure:Pressure"
+
+    - Unit files (JSON, TOML or CSV, see `unit_files.py`) in plug-in directories; the
+      file name without suffix is the category. The directories are listed in the
+      UNITCONV_PLUGIN_PATH environment variable, separated by os.pathsep.
+
+Example Usage:
+    >>> from registry import ConverterRegistry
+    >>> from plugins import discover_plugins
+    >>> registry = ConverterRegistry()
+    >>> discover_plugins(registry, paths=["site_units"])
+    ['Pressure', 'Flow']
+"""
+
+import os
+import warnings
+from functools import partial
+
+from base_class import Converter
+
+ENTRY_POINT_GROUP = "unitconv.converters"
+PLUGIN_PATH_VARIABLE = "UNITCONV_PLUGIN_PATH"
+UNIT_FILE_SUFFIXES = (".json", ".toml", ".csv")
+
+
+def _entry_points(group):
+    """
+    Return the entry points of a group, or none without importlib.metadata.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            return []
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=group))
+    return list(found.get(group, ()))  # Python 3.8 and 3.9 return a dict
+
+
+def _load_entry_point(entry_point):
+    """
+    Import an entry point and return its converter.
+    """
+    target = entry_point.load()
+    converter = target if isinstance(target, Converter) else target()
+    if not isinstance(converter, Converter):
+        raise TypeError(f"Plug-in '{entry_point.name}' did not provide a Converter")
+    return converter
+
+
+def plugin_paths(paths=None):
+    """
+    Return the plug-in directories: `paths`, or those in UNITCONV_PLUGIN_PATH.
+    """
+    if paths is None:
+        paths = os.environ.get(PLUGIN_PATH_VARIABLE, "").split(os.pathsep)
+    return [path for path in paths if path]
+
+
+def _unit_files(paths):
+    """
+    Yield (category, path) for every unit file in the plug-in directories.
+    """
+    for directory in plugin_paths(paths):
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            warnings.warn(f"Converter plug-in directory '{directory}' cannot be read")
+            continue
+        for name in names:
+            stem, suffix = os.path.splitext(name)
+            if suffix.lower() in UNIT_FILE_SUFFIXES:
+                yield stem, os.path.join(directory, name)
+
+
+def _unit_file_units(path):
+    """
+    Return the unit symbols of a unit file, from its compiled cache when it is current.
+    """
+    from unit_files import load_units
+    return tuple(load_units(path))
+
+
+def discover_plugins(registry, paths=None, group=ENTRY_POINT_GROUP):
+    """
+    Register the categories of all entry point and unit file plug-ins as lazy factories.
+
+    A category that is already registered is kept and the plug-in is skipped with a
+    warning.
+
+    Args:
+        registry (ConverterRegistry): The registry to add the categories to
+        paths (Iterable[str]): Plug-in directories; defaults to UNITCONV_PLUGIN_PATH
+        group (str): The entry point group
+
+    Returns:
+        list: Names of the registered categories
+    """
+    # (category, factory, units); entry points only reveal their units once imported
+    factories = [(entry_point.name, partial(_load_entry_point, entry_point), None)
+                 for entry_point in _entry_points(group)]
+    factories += [(name, partial(Converter.from_file, path), partial(_unit_file_units, path))
+                  for name, path in _unit_files(paths)]
+    registered = []
+    for name, factory, units in factories:
+        if name in registry:
+            warnings.warn(f"Converter plug-in '{name}' skipped: the category is already registered")
+            continue
+        registry.register(name, factory, units)
+        registered.append(name)
+    return registered
@@ -0,0 +1,154 @@
+"""
+Quantity Value Types
+
+This module implements small value types that keep a measurement together with its
+unit and converter, so callers don't have to carry units around separately.
+
+    - Quantity: a single value with its unit
+    - QuantityArray: many values in one unit, stored in a contiguous array of doubles
+
+Both reuse the converter's cached pair plans, and QuantityArray never creates a
+per-element object when converting.
+
+Example Usage:
+    >>> from Converters import Length
+    >>> from quantity import Quantity, QuantityArray
+    >>> Quantity(1, "mi", Length).to("km").unit
+    'km'
+    >>> round(Quantity(1, "mi", Length).to("km").value, 3)
+    1.609
+    >>> QuantityArray([1, 2, 3], "m", Length).to("cm").values
+    array('d', [100.0, 200.0, 300.0])
+"""
+
+import sys
+from array import array
+
+
+def _check_unit(converter, unit):
+    """
+    Validate a unit against a converter and intern its name.
+    """
+    if unit not in converter.units:
+        raise ValueError(f"Invalid unit: {unit}")
+    return sys.intern(unit)
+
+
+class Quantity:
+    """
+    A single value in a unit of a converter.
+
+    Attributes:
+        value (float): The magnitude
+        unit (str): The unit symbol (interned)
+        converter (Converter): The converter the unit belongs to
+    """
+
+    __slots__ = ("value", "unit", "converter")
+
+    def __init__(self, value, unit, converter):
+        """
+        Args:
+            value (Number): The magnitude
+            unit (str): A unit symbol of `converter`
+            converter (Converter): The converter the unit belongs to
+
+        Raises:
+            ValueError: If the unit is not in the converter's units dictionary
+        """
+        self.value = value
+        self.unit = _check_unit(converter, unit)
+        self.converter = converter
+
+    def to(self, unit, delta=False):
+        """
+        Convert to another unit of the same converter.
+
+        Args:
+            unit (str): The target unit
+            delta (bool): Flag indicating whether this is a delta/interval conversion
+
+        Returns:
+            Quantity: A new quantity in `unit`
+        """
+        converter = self.converter
+        plan = converter._pair_plan(self.unit, unit, delta)
+        return Quantity(converter._apply_plan(self.value, plan), unit, converter)
+
+    def __eq__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return (self.value, self.unit, self.converter) == (other.value, other.unit, other.converter)
+
+    def __hash__(self):
+        return hash((self.value, self.unit, id(self.converter)))
+
+    def __repr__(self):
+        return f"Quantity({self.value!r}, {self.unit!r})"
+
+
+class QuantityArray:
+    """
+    Many values sharing one unit, stored as a contiguous array of doubles.
+
+    Attributes:
+        values (array.array): The magnitudes (typecode 'd')
+        unit (str): The unit symbol (interned)
+        converter (Converter): The converter the unit belongs to
+    """
+
+    __slots__ = ("values", "unit", "converter")
+
+    def __init__(self, values, unit, converter):
+        """
+        Args:
+            values (Iterable[Number]): The magnitudes; an array('d') is used without copying
+            unit (str): A unit symbol of `converter`
+            converter (Converter): The converter the unit belongs to
+
+        Raises:
+            ValueError: If the unit is not in the converter's units dictionary
+        """
+        if not (isinstance(values, array) and values.typecode == "d"):
+            values = array("d", values)
+        self.values = values
+        self.unit = _check_unit(converter, unit)
+        self.converter = converter
+
+    def to(self, unit, delta=False, inplace=False):
+        """
+        Convert every value to another unit of the same converter.
+
+        Args:
+            unit (str): The target unit
+            delta (bool): Flag indicating whether these are delta/interval conversions
+            inplace (bool): Overwrite this array's buffer instead of allocating a new one
+
+        Returns:
+            QuantityArray: The converted array (self when `inplace` is set)
+        """
+        converter = self.converter
+        if inplace:
+            converter.convert(self.values, self.unit, unit, delta, inplace=True)
+            self.unit = sys.intern(unit)
+            return self
+        plan = converter._pair_plan(self.unit, unit, delta)
+        apply_plan = converter._apply_plan
+        return QuantityArray(array("d", (apply_plan(value, plan) for value in self.values)), unit, converter)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """
+        Return a float for an integer index, or a new QuantityArray for a slice.
+        """
+        if isinstance(index, slice):
+            return QuantityArray(self.values[index], self.unit, self.converter)
+        return self.values[index]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __repr__(self):
+        return f"QuantityArray({self.values.tolist()!r}, {self.unit!r})"
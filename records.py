@@ -0,0 +1,190 @@
+"""
+Record Conversion
+
+This module converts measurement attributes of domain objects (dataclasses,
+`__slots__` classes or any class with plain attributes). A RecordSchema declares, for
+one record type, which attribute holds which unit and which unit it is converted to.
+The declaration is compiled once into attribute getters and pair plans, and then
+applied to single records or to large lists of them, optionally in place.
+
+Example Usage:
+    >>> from dataclasses import dataclass
+    >>> from Converters import Temperature
+    >>> from records import RecordSchema
+    >>> @dataclass
+    ... class Reading:
+    ...     sensor: str
+    ...     temp: float
+    >>> schema = RecordSchema(Reading, {"temp": ("°F", "ºC")}, Temperature)
+    >>> schema.convert(Reading("a", 212.0))
+    Reading(sensor='a', temp=100.0)
+"""
+
+import copy
+import math
+from operator import attrgetter
+
+try:
+    import dataclasses
+except ImportError:  # Python < 3.7
+    dataclasses = None
+
+ERRORS = ("raise", "coerce")
+
+
+def _is_dataclass(record_type):
+    return dataclasses is not None and dataclasses.is_dataclass(record_type)
+
+
+def _attribute_names(record_type):
+    """
+    Return the attribute names a record type declares, or None if they cannot be known.
+    """
+    if _is_dataclass(record_type):
+        return {field.name for field in dataclasses.fields(record_type)}
+    names = set()
+    for cls in record_type.__mro__:
+        slots = cls.__dict__.get("__slots__")
+        if slots is None:
+            if cls is not object:
+                return None  # instances have a __dict__ and can hold any attribute
+            continue
+        names.update((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+class RecordSchema:
+    """
+    Compiled unit conversion of the measurement attributes of one record type.
+
+    Attributes:
+        record_type (type): The class of the records
+        attributes (tuple): Names of the converted attributes
+    """
+
+    def __init__(self, record_type, fields, converter=None, registry=None, delta=False):
+        """
+        Args:
+            record_type (type): The class of the records
+            fields (dict): Attribute names mapped to (origin_unit, final_unit) pairs
+            converter (Converter): Converter for all attributes; if None the category
+                of each attribute is detected with `registry`
+            registry (ConverterRegistry): Registry used for detection; defaults to
+                `registry.default_registry()`
+            delta (bool): Flag indicating whether these are delta/interval conversions
+
+        Raises:
+            AttributeError: If the record type does not declare an attribute
+            ValueError: If a unit pair is invalid or cannot be matched to one category
+        """
+        known = _attribute_names(record_type)
+        missing = [name for name in fields if known is not None and name not in known]
+        if missing:
+            raise AttributeError(f"{record_type.__name__} has no attribute {', '.join(missing)}")
+        if converter is None and registry is None:
+            from registry import default_registry
+            registry = default_registry()
+        self.record_type = record_type
+        self.attributes = tuple(fields)
+        self._getter = attrgetter(*self.attributes)
+        self._fields = []
+        for name, (origin_unit, final_unit) in fields.items():
+            field_converter = converter
+            if field_converter is None:
+                field_converter = registry.get(registry.find(origin_unit, final_unit))
+            plan = field_converter._pair_plan(origin_unit, final_unit, delta)
+            self._fields.append((name, attrgetter(name), plan))
+        self._is_dataclass = _is_dataclass(record_type)
+
+    def _values(self, record):
+        values = self._getter(record)
+        return values if len(self.attributes) > 1 else (values,)
+
+    def _converted(self, record, index, errors, fill):
+        """
+        Return the converted attribute values of one record, keyed by name.
+        """
+        changes = {}
+        for (name, getter, plan), value in zip(self._fields, self._values(record)):
+            if value is None:
+                continue
+            origin_offset, origin_scale, final_scale, final_offset = plan
+            try:
+                changes[name] = (value - origin_offset) / origin_scale * final_scale + final_offset
+            except (TypeError, ArithmeticError):
+                if errors == "raise":
+                    raise ValueError(f"Cannot convert {name}={value!r} of record {index}")
+                changes[name] = fill
+        return changes
+
+    def _copy(self, record, changes):
+        if self._is_dataclass:
+            # Goes through __init__, so frozen dataclasses work too
+            return dataclasses.replace(record, **changes)
+        record = copy.copy(record)
+        for name, value in changes.items():
+            setattr(record, name, value)
+        return record
+
+    def convert(self, record, inplace=False, errors="raise", fill=math.nan):
+        """
+        Convert the attributes of one record.
+
+        Args:
+            record: An instance of the record type
+            inplace (bool): Set the attributes of `record` instead of returning a copy
+            errors (str): "raise" to stop at a value that is not a number, or "coerce"
+                to set it to `fill`; None values are always left alone
+            fill: Replacement for values that cannot be converted
+
+        Returns:
+            The converted record (`record` itself if inplace)
+
+        Raises:
+            ValueError: On a bad value when errors is "raise"
+        """
+        return self.convert_many((record,), inplace, errors, fill)[0]
+
+    def convert_many(self, records, inplace=False, errors="raise", fill=math.nan):
+        """
+        Convert the attributes of many records.
+
+        In place, each attribute is converted across all records in one tight loop,
+        and the records are only changed once every value has converted.
+
+        Args:
+            records (Iterable): Instances of the record type
+            inplace, errors, fill: As in `convert`
+
+        Returns:
+            list: The converted records (the same objects if inplace)
+        """
+        if errors not in ERRORS:
+            raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+        records = list(records)
+        if not inplace:
+            copy_record, converted = self._copy, self._converted
+            return [copy_record(record, converted(record, index, errors, fill))
+                    for index, record in enumerate(records)]
+        # Convert every attribute before setting any, so a bad value leaves the
+        # records unchanged
+        columns = []
+        for name, getter, plan in self._fields:
+            origin_offset, origin_scale, final_scale, final_offset = plan
+            column = []
+            for index, record in enumerate(records):
+                value = getter(record)
+                if value is not None:
+                    try:
+                        value = (value - origin_offset) / origin_scale * final_scale + final_offset
+                    except (TypeError, ArithmeticError):
+                        if errors == "raise":
+                            raise ValueError(f"Cannot convert {name}={value!r} of record {index}")
+                        value = fill
+                column.append(value)
+            columns.append((name, column))
+        for name, column in columns:
+            for record, value in zip(records, column):
+                if value is not None:
+                    setattr(record, name, value)
+        return records
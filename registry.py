@@ -0,0 +1,274 @@
+"""
+Converter Registry
+
+This module keeps a registry of converter categories (Temperature, Length, ...) and a
+single index from every unit symbol to the categories that define it, so a value can
+be converted without knowing its category in advance:
+
+    >>> from registry import convert
+    >>> round(convert(1, "nmi", "km"), 3)
+    1.852
+
+Categories can be registered as ready-made converters or as factories that are only
+called when the category is first used. When the unit symbols of a factory are given
+at registration, building the index does not construct the converter either.
+
+A unit pair is first looked up in the categories whose units are already known
+(constructed converters and factories registered with their unit symbols); other
+categories are only loaded when none of those defines the pair.
+
+A unit defined by several categories (e.g. "pt" is a point in Length and a pint in
+Volume) is resolved from the other unit of the pair; if that is not enough an
+AmbiguousUnitError is raised.
+"""
+
+import threading
+import warnings
+
+from base_class import Converter, InvalidUnitError
+
+
+class AmbiguousUnitError(ValueError):
+    """
+    Raised when a unit pair matches more than one converter category.
+
+    Attributes:
+        units (tuple): The unit pair
+        categories (list): The names of the matching categories
+    """
+
+    def __init__(self, units, categories):
+        self.units = tuple(units)
+        self.categories = list(categories)
+        super().__init__(f"Ambiguous units {', '.join(self.units)}: found in {', '.join(self.categories)}")
+
+
+class ConverterRegistry:
+    """
+    A collection of named converter categories with a unit-to-category index.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._unit_names = {}
+        self._converters = {}
+        self._index = None
+        self._known_index = None
+        self._suggestions = None
+        self._lock = threading.Lock()
+
+    def register(self, name, converter, units=None):
+        """
+        Register a converter category.
+
+        Args:
+            name (str): The category name, e.g. "Length"
+            converter: A Converter, or a callable returning one on first use
+            units (Iterable[str]): The category's unit symbols, so a factory does not
+                have to be called to index them, or a callable returning them that is
+                only called when the full unit index is built
+
+        Raises:
+            ValueError: If the name is already registered
+        """
+        with self._lock:
+            if name in self._factories:
+                raise ValueError(f"Converter category '{name}' is already registered.")
+            self._factories[name] = converter
+            if isinstance(converter, Converter):
+                self._converters[name] = converter
+            if units is not None:
+                self._unit_names[name] = units if callable(units) else tuple(units)
+            self._index = None
+            self._known_index = None
+            self._suggestions = None
+
+    def names(self):
+        """
+        Return the registered category names in registration order.
+        """
+        return list(self._factories)
+
+    def get(self, name):
+        """
+        Return the converter of a category, constructing it on first use.
+
+        Raises:
+            KeyError: If the category is not registered
+        """
+        converter = self._converters.get(name)
+        if converter is None:
+            factory = self._factories[name]
+            with self._lock:
+                converter = self._converters.get(name)
+                if converter is None:
+                    converter = factory()
+                    self._converters[name] = converter
+                    self._known_index = None
+        return converter
+
+    def is_loaded(self, name):
+        """
+        Return whether the converter of a category has been constructed.
+        """
+        return name in self._converters
+
+    def __contains__(self, name):
+        return name in self._factories
+
+    def _unit_index(self):
+        """
+        Return the unit symbol -> category names index of every category, building it
+        on first use. Categories whose unit symbols are not known are loaded.
+        """
+        index = self._index
+        if index is None:
+            index = {}
+            for name in list(self._factories):
+                units = self._unit_names.get(name)
+                try:
+                    if callable(units):
+                        units = self._unit_names[name] = tuple(units())
+                    elif units is None:
+                        units = self.get(name).units
+                except Exception as error:
+                    # A broken plug-in must not stop detection of the other categories
+                    warnings.warn(f"Converter category '{name}' skipped: {error}")
+                    continue
+                for unit in units:
+                    index.setdefault(unit, []).append(name)
+            index = {unit: tuple(names) for unit, names in index.items()}
+            self._index = index
+            self._known_index = None  # unit symbols resolved above are known now
+        return index
+
+    def _known_unit_index(self):
+        """
+        Return the unit symbol -> category names index of the categories whose units
+        are known without loading anything.
+        """
+        index = self._known_index
+        if index is None:
+            index = {}
+            for name in list(self._factories):
+                units = self._unit_names.get(name)
+                if units is None or callable(units):
+                    converter = self._converters.get(name)
+                    if converter is None:
+                        continue
+                    units = converter.units
+                for unit in units:
+                    index.setdefault(unit, []).append(name)
+            index = {unit: tuple(names) for unit, names in index.items()}
+            self._known_index = index
+        return index
+
+    def categories_of(self, unit):
+        """
+        Return the names of all categories defining a unit (empty if none do).
+        """
+        return list(self._unit_index().get(unit, ()))
+
+    def suggest_units(self, unit, limit=3):
+        """
+        Return up to `limit` unit symbols of any category that resemble `unit`.
+        """
+        suggestions = self._suggestions
+        if suggestions is None:
+            from suggestions import UnitIndex
+            suggestions = self._suggestions = UnitIndex(self._unit_index())
+        return suggestions.suggest(unit, limit)
+
+    def ambiguous_units(self):
+        """
+        Return every unit symbol defined by more than one category.
+
+        Returns:
+            dict: Unit symbols mapped to the list of categories defining them
+        """
+        return {unit: list(names) for unit, names in self._unit_index().items() if len(names) > 1}
+
+    def find(self, origin_unit, final_unit):
+        """
+        Detect the category a unit pair belongs to.
+
+        Categories whose units are already known are searched first; the others are
+        only loaded if none of those defines both units.
+
+        Returns:
+            str: The category name
+
+        Raises:
+            InvalidUnitError: If a unit is not defined by any category
+            ValueError: If no category defines both units
+            AmbiguousUnitError: If several categories define both units
+        """
+        known = self._known_unit_index()
+        matches = [name for name in known.get(origin_unit, ()) if name in known.get(final_unit, ())]
+        if not matches:
+            index = self._unit_index()
+            origin_categories = index.get(origin_unit, ())
+            final_categories = index.get(final_unit, ())
+            matches = [name for name in origin_categories if name in final_categories]
+        if not matches:
+            unknown = [unit for unit in (origin_unit, final_unit) if unit not in index]
+            if unknown:
+                suggestions = {unit: self.suggest_units(unit) for unit in unknown}
+                raise InvalidUnitError(f"Invalid units: {origin_unit}, {final_unit}", suggestions)
+            raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
+        if len(matches) > 1:
+            raise AmbiguousUnitError((origin_unit, final_unit), matches)
+        return matches[0]
+
+    def convert(self, value, origin_unit, final_unit, delta=False, category=None, **kwargs):
+        """
+        Convert a value, detecting the converter category from the units.
+
+        Args:
+            value: Anything `Converter.convert` accepts
+            origin_unit (str): The source unit
+            final_unit (str): The target unit
+            delta (bool): Flag indicating whether this is a delta/interval conversion
+            category (str): Skip detection and use this category
+            **kwargs: Passed on to `Converter.convert` (inplace, errors, fill)
+
+        Raises:
+            ValueError: If no category defines both units
+            AmbiguousUnitError: If several categories define both units
+        """
+        if category is None:
+            category = self.find(origin_unit, final_unit)
+        return self.get(category).convert(value, origin_unit, final_unit, delta, **kwargs)
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def default_registry():
+    """
+    Return the registry of the converters defined in `Converters.py` and plug-ins.
+
+    The converters come from `snapshot.load_converters`, so a current snapshot
+    avoids executing `Converters.py` altogether. Plug-in categories found by
+    `plugins.discover_plugins` follow them and are constructed on first use.
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                from snapshot import load_converters
+                registry = ConverterRegistry()
+                for name, converter in load_converters().items():
+                    registry.register(name, converter)
+                from plugins import discover_plugins
+                discover_plugins(registry)
+                _default_registry = registry
+    return _default_registry
+
+
+def convert(value, origin_unit, final_unit, delta=False, category=None, **kwargs):
+    """
+    Convert a value with the default registry, detecting its category from the units.
+    """
+    return default_registry().convert(value, origin_unit, final_unit, delta, category, **kwargs)
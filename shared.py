@@ -0,0 +1,236 @@
+"""
+Shared-Memory Conversion
+
+This module converts arrays of doubles that live in `multiprocessing.shared_memory`
+blocks, so pipeline stages running in separate processes can convert large arrays
+without pickling or copying them. Values are converted in place, or written into a
+second shared block.
+
+ConversionPool keeps worker processes that receive the converter once at start-up;
+afterwards each task is just (block name, offset, length, pair id), so a block can be
+split into ranges and converted in parallel with zero data copying.
+
+Offsets and lengths count doubles (8 bytes), not bytes. NumPy is used for the
+arithmetic when it is installed. Shared memory needs Python 3.8+.
+
+Example Usage:
+    >>> from multiprocessing import shared_memory
+    >>> from Converters import Temperature
+    >>> from shared import ConversionPool
+    >>> block = shared_memory.SharedMemory(create=True, size=8 * 1_000_000)
+    >>> with ConversionPool(Temperature, [("°F", "K")], processes=4) as pool:
+    ...     pool.convert(block.name, 1_000_000, pair_id=0)
+"""
+
+import os
+import sys
+from multiprocessing import Pool
+
+ITEM_SIZE = 8  # bytes per double
+
+
+def _attach(name):
+    """
+    Attach to an existing shared memory block without taking ownership of it.
+
+    Before Python 3.13 attaching registers the block with the resource tracker, which
+    unlinks it when the tracker's processes exit. In the creator's process the block
+    is already registered, so this changes nothing; pool workers stop registering
+    blocks in `_init_worker`.
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        raise ImportError("Shared-memory conversion requires Python 3.8 or higher")
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _span(block, offset, length):
+    """
+    Validate a range of doubles in a block and return its length.
+    """
+    available = block.size // ITEM_SIZE - offset
+    if length is None:
+        length = available
+    if offset < 0 or length < 0 or length > available:
+        raise ValueError(f"Range of {length} values at {offset} exceeds block '{block.name}'")
+    return length
+
+
+def _convert_range(block, offset, length, plan, out_block, out_offset):
+    """
+    Convert `length` doubles from one block range into another (possibly the same).
+    """
+    origin_offset, origin_scale, final_scale, final_offset = plan
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        source = numpy.frombuffer(block.buf, dtype=numpy.float64, count=length, offset=offset * ITEM_SIZE)
+        target = numpy.frombuffer(out_block.buf, dtype=numpy.float64, count=length, offset=out_offset * ITEM_SIZE)
+        numpy.subtract(source, origin_offset, out=target)
+        target /= origin_scale
+        target *= final_scale
+        target += final_offset
+        del source, target  # release the buffer exports
+        return
+    source = block.buf[offset * ITEM_SIZE:(offset + length) * ITEM_SIZE].cast("d")
+    target = out_block.buf[out_offset * ITEM_SIZE:(out_offset + length) * ITEM_SIZE].cast("d")
+    try:
+        for index in range(length):
+            target[index] = (source[index] - origin_offset) / origin_scale * final_scale + final_offset
+    finally:
+        source.release()
+        target.release()
+
+
+def convert_shared(converter, name, origin_unit, final_unit, offset=0, length=None,
+                   out_name=None, out_offset=None, delta=False):
+    """
+    Convert doubles stored in a shared memory block, in this process.
+
+    Args:
+        converter (Converter): The converter both units belong to
+        name (str): Name of the shared memory block holding the values
+        origin_unit (str): The source unit
+        final_unit (str): The target unit
+        offset (int): Index of the first value in the block
+        length (int): Number of values; defaults to the rest of the block
+        out_name (str): Block to write the results to; defaults to converting in place
+        out_offset (int): Index of the first result in the output block; defaults to `offset`
+        delta (bool): Flag indicating whether these are delta/interval conversions
+
+    Returns:
+        int: The number of values converted
+
+    Raises:
+        ValueError: If a unit is invalid or a range does not fit in its block
+    """
+    if out_offset is None:
+        out_offset = offset
+    plan = converter._pair_plan(origin_unit, final_unit, delta)
+    return _convert_blocks(name, offset, length, plan, out_name, out_offset)
+
+
+def _convert_blocks(name, offset, length, plan, out_name, out_offset):
+    """
+    Attach to the blocks, convert a range with `plan` and close them again.
+    """
+    block = _attach(name)
+    out_block = block if out_name is None or out_name == name else _attach(out_name)
+    try:
+        length = _span(block, offset, length)
+        _span(out_block, out_offset, length)
+        _convert_range(block, offset, length, plan, out_block, out_offset)
+    finally:
+        block.close()
+        if out_block is not block:
+            out_block.close()
+    return length
+
+
+# Worker process state, set by _init_worker
+_worker_plans = []
+
+
+def _init_worker(plans):
+    global _worker_plans
+    _worker_plans = plans
+    if os.name == "posix" and sys.version_info < (3, 13):
+        # Blocks belong to the parent; a worker must not register (and so own) them.
+        # Initializers run before any task, while the worker is single-threaded
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+
+        def register_except_shared_memory(name, rtype):
+            if rtype != "shared_memory":
+                register(name, rtype)
+        resource_tracker.register = register_except_shared_memory
+
+
+def _worker_task(name, offset, length, pair_id, out_name, out_offset):
+    # Blocks are attached per task and closed again, so a worker never keeps a
+    # mapping of a block the parent has already unlinked
+    return _convert_blocks(name, offset, length, _worker_plans[pair_id], out_name, out_offset)
+
+
+class ConversionPool:
+    """
+    Worker processes converting shared memory ranges for a fixed set of unit pairs.
+
+    Attributes:
+        pairs (list): The (origin_unit, final_unit[, delta]) pairs; a pair's index is its id
+        processes (int): Number of worker processes
+    """
+
+    def __init__(self, converter, pairs, processes=None):
+        """
+        Args:
+            converter (Converter): The converter all pairs belong to
+            pairs (Iterable[tuple]): (origin_unit, final_unit) or (origin_unit,
+                final_unit, delta) tuples; tasks refer to them by index
+            processes (int): Number of workers; defaults to the number of CPUs
+
+        Raises:
+            ValueError: If a unit is invalid
+        """
+        self.pairs = [tuple(pair) for pair in pairs]
+        plans = [converter._pair_plan(*pair) for pair in self.pairs]
+        self.processes = processes or os.cpu_count() or 1
+        self._pool = Pool(self.processes, initializer=_init_worker, initargs=(plans,))
+
+    def submit(self, name, offset, length, pair_id, out_name=None, out_offset=None):
+        """
+        Queue the conversion of one range; returns a multiprocessing AsyncResult.
+
+        The output range defaults to the input range (in-place conversion).
+        """
+        if out_offset is None:
+            out_offset = offset
+        return self._pool.apply_async(_worker_task, (name, offset, length, pair_id, out_name, out_offset))
+
+    def convert(self, name, length, pair_id, offset=0, out_name=None, out_offset=None, chunk_size=None):
+        """
+        Convert a range split into chunks across the workers, and wait for it.
+
+        Args:
+            name (str): Name of the shared memory block holding the values
+            length (int): Number of values to convert
+            pair_id (int): Index of the unit pair in `pairs`
+            offset (int): Index of the first value in the block
+            out_name (str): Block to write the results to; defaults to converting in place
+            out_offset (int): Index of the first result in the output block
+            chunk_size (int): Values per task; defaults to an even split across workers
+
+        Returns:
+            int: The number of values converted
+        """
+        if out_offset is None:
+            out_offset = offset
+        if chunk_size is None:
+            chunk_size = max(1, -(-length // self.processes))
+        results = [
+            self.submit(name, offset + start, min(chunk_size, length - start), pair_id, out_name, out_offset + start)
+            for start in range(0, length, chunk_size)
+        ]
+        return sum(result.get() for result in results)
+
+    def close(self):
+        """
+        Stop the workers after the queued tasks have finished.
+        """
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.close()
+        else:
+            self._pool.terminate()
+            self._pool.join()
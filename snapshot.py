@@ -0,0 +1,147 @@
+"""
+Unit Table Snapshots
+
+This module serializes the unit tables of every converter defined in `Converters.py`
+into a compact, prevalidated binary snapshot, and loads them back without executing
+the module's dict literals or re-running `Converter.__init__` validation.
+
+The snapshot records a version hash of `Converters.py` and `base_class.py`; when the
+hash no longer matches the source files the loader ignores the snapshot and imports
+`Converters` normally, so a stale snapshot can never produce wrong conversions.
+
+Example Usage:
+    $ python snapshot.py            # build step, writes Converters.snapshot
+    >>> from snapshot import load_converters
+    >>> converters = load_converters()
+    >>> converters["Temperature"].convert(25, "ºC", "°F")
+    77.0
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import threading
+
+from base_class import Converter
+
+# Bump when the layout written by `build_snapshot` changes
+SNAPSHOT_FORMAT = 2
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCE = os.path.join(_HERE, "Converters.py")
+# The table layout and plan format are defined here, so it is part of the hash too
+BASE_SOURCE = os.path.join(_HERE, "base_class.py")
+DEFAULT_PATH = os.path.join(_HERE, "Converters.snapshot")
+
+
+def source_hash(source=DEFAULT_SOURCE):
+    """
+    Compute the version hash of a converters source file.
+
+    Args:
+        source (str): Path of the module the converters are defined in
+
+    Returns:
+        str: Hex digest covering the snapshot format and the contents of
+            `base_class.py` and the source file
+    """
+    digest = hashlib.sha256(str(SNAPSHOT_FORMAT).encode())
+    for path in (BASE_SOURCE, source):
+        with open(path, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def dump_payload(payload, path):
+    """
+    Atomically marshal a payload to `path`.
+
+    The payload is written to a temporary file first, so a concurrent reader never
+    sees a partially written file. The temporary name is unique per thread.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            marshal.dump(payload, file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _module_converters():
+    """
+    Import `Converters` and collect its Converter instances by name.
+    """
+    import Converters
+    return {
+        name: obj
+        for name, obj in vars(Converters).items()
+        if isinstance(obj, Converter)
+    }
+
+
+def build_snapshot(path=DEFAULT_PATH, converters=None, source=DEFAULT_SOURCE):
+    """
+    Write a prevalidated snapshot of the unit tables.
+
+    Args:
+        path (str): Destination of the snapshot file
+        converters (dict): Converters to store by name; defaults to those in `Converters`
+        source (str): Source file whose hash is recorded in the snapshot
+
+    Returns:
+        str: The path the snapshot was written to
+    """
+    if converters is None:
+        converters = _module_converters()
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "hash": source_hash(source),
+        # Tables are already normalized to (scale, offset) tuples by Converter.__init__
+        "tables": {name: dict(converter.units) for name, converter in converters.items()},
+        "families": {name: dict(converter.families) for name, converter in converters.items()},
+    }
+    dump_payload(payload, path)
+    return path
+
+
+def load_converters(path=DEFAULT_PATH, source=DEFAULT_SOURCE):
+    """
+    Load converters from a snapshot, falling back to importing `Converters`.
+
+    The snapshot is used only if its format and version hash match `source`; its
+    tables are then handed to the converters without validation.
+
+    Args:
+        path (str): Snapshot file written by `build_snapshot`
+        source (str): Source file the snapshot must match
+
+    Returns:
+        dict: Converter objects by name
+    """
+    try:
+        with open(path, "rb") as file:
+            payload = marshal.load(file)
+        valid = (
+            isinstance(payload, dict)
+            and payload.get("format") == SNAPSHOT_FORMAT
+            and payload.get("hash") == source_hash(source)
+        )
+    except (OSError, EOFError, ValueError, TypeError):
+        valid = False
+    if not valid:
+        return _module_converters()
+    return {
+        name: Converter._from_validated(units, payload["families"].get(name))
+        for name, units in payload["tables"].items()
+    }
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    print(f"Snapshot written to {build_snapshot(output)}")
@@ -0,0 +1,104 @@
+"""
+SQLite Functions
+
+This module registers unit conversion as SQL functions on a `sqlite3` connection, so
+readings can be converted inside SELECT and UPDATE statements instead of being
+fetched into Python and written back:
+
+    convert(value, from_unit, to_unit)           scalar conversion
+    convert(value, from_unit, to_unit, delta)    delta/interval conversion if delta is true
+    sum_in(value, unit, target_unit)             sum of values converted to target_unit
+    avg_in(value, unit, target_unit)             average of values converted to target_unit
+
+The converter category of each unit pair is detected with the registry, and the pair
+plan is resolved once per connection and reused for every row. NULL values give NULL
+and are skipped by the aggregates, as with SQL's own SUM and AVG.
+
+Example Usage:
+    >>> import sqlite3
+    >>> from sqlite_functions import register_functions
+    >>> connection = sqlite3.connect(":memory:")
+    >>> register_functions(connection)
+    >>> connection.execute("SELECT convert(1, 'mi', 'km')").fetchone()[0]
+    1.609344...
+"""
+
+import sqlite3
+import sys
+
+from base_class import Converter
+
+
+class _PlanCache:
+    """
+    Pair plans of one connection, resolved through a registry on first use.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.plans = {}
+
+    def convert(self, value, origin_unit, final_unit, delta=False):
+        if value is None:
+            return None
+        key = (origin_unit, final_unit, bool(delta))
+        plan = self.plans.get(key)
+        if plan is None:
+            converter = self.registry.get(self.registry.find(origin_unit, final_unit))
+            plan = converter._pair_plan(origin_unit, final_unit, delta)
+            self.plans[key] = plan
+        return Converter._apply_plan(value, plan)
+
+
+def _aggregate(plans, average):
+    """
+    Build an aggregate class summing (or averaging) converted values.
+    """
+
+    class Aggregate:
+        def __init__(self):
+            self.total = 0.0
+            self.count = 0
+
+        def step(self, value, unit, target_unit):
+            if value is not None:
+                self.total += plans.convert(value, unit, target_unit)
+                self.count += 1
+
+        def finalize(self):
+            if not self.count:
+                return None
+            return self.total / self.count if average else self.total
+
+    return Aggregate
+
+
+def _create_function(connection, name, arity, function):
+    # deterministic needs Python 3.8+ and SQLite 3.8.3+
+    if sys.version_info >= (3, 8) and sqlite3.sqlite_version_info >= (3, 8, 3):
+        connection.create_function(name, arity, function, deterministic=True)
+    else:
+        connection.create_function(name, arity, function)
+
+
+def register_functions(connection, registry=None):
+    """
+    Register convert, sum_in and avg_in on a sqlite3 connection.
+
+    Args:
+        connection (sqlite3.Connection): The connection
+        registry (ConverterRegistry): Registry used to detect converter categories;
+            defaults to `registry.default_registry()`
+
+    Note:
+        Invalid or ambiguous units make the statement fail with sqlite3.OperationalError.
+    """
+    if registry is None:
+        from registry import default_registry
+        registry = default_registry()
+    plans = _PlanCache(registry)
+    # One variable-arity function: registering arities 3 and 4 separately crashes
+    # some Python 3.7 builds; other argument counts fail in plans.convert
+    _create_function(connection, "convert", -1, plans.convert)
+    connection.create_aggregate("sum_in", 3, _aggregate(plans, average=False))
+    connection.create_aggregate("avg_in", 3, _aggregate(plans, average=True))
@@ -0,0 +1,436 @@
+"""
+Streaming Conversion
+
+This module converts measurements in newline-delimited JSON (NDJSON / JSON Lines)
+records as a stream: records are read, converted and written one at a time, so
+memory use does not depend on the size of the input. Large files can be split into
+byte ranges and converted by several processes.
+
+Plain text, one number per line or delimited columns, is converted by
+`convert_lines`, which reads and writes large blocks at a time for shell pipelines.
+
+`follow_ndjson` tails a file that instruments keep appending to: each pass converts
+only the complete records added since the last one and records the byte offset in a
+checkpoint file, so restarts and cron runs resume where the previous run stopped.
+
+The fields to convert are given as a mapping of field name to (origin unit, final
+unit). Each field is compiled once into a pair plan of its converter, either the
+converter passed in or the category detected by the registry.
+
+Example Usage:
+    >>> from streaming import convert_ndjson_file
+    >>> convert_ndjson_file("readings.ndjson", "readings_si.ndjson",
+    ...                     {"temp": ("°F", "ºC"), "depth": ("ft", "m")}, processes=4)
+    {'records': 1000000, 'converted': 2000000, 'failures': 0}
+"""
+
+import json
+import os
+import shutil
+import time
+from multiprocessing import Pool
+from numbers import Number
+
+from base_class import Converter
+
+
+def compile_fields(fields, converter=None, registry=None, delta=False):
+    """
+    Resolve the pair plan of every configured field once.
+
+    Args:
+        fields (dict): Field names mapped to (origin_unit, final_unit) pairs
+        converter (Converter): Converter for all fields; if None the category of each
+            field is detected with `registry`
+        registry (ConverterRegistry): Registry used for detection; defaults to
+            `registry.default_registry()`
+        delta (bool): Flag indicating whether these are delta/interval conversions
+
+    Returns:
+        list: (field name, pair plan) tuples
+
+    Raises:
+        ValueError: If a unit pair is invalid or cannot be matched to one category
+    """
+    if converter is None and registry is None:
+        from registry import default_registry
+        registry = default_registry()
+    compiled = []
+    for field, (origin_unit, final_unit) in fields.items():
+        field_converter = converter
+        if field_converter is None:
+            field_converter = registry.get(registry.find(origin_unit, final_unit))
+        compiled.append((field, field_converter._pair_plan(origin_unit, final_unit, delta)))
+    return compiled
+
+
+def convert_record(record, compiled):
+    """
+    Convert the configured fields of one decoded record in place.
+
+    Missing fields and nulls are left alone; numeric strings are accepted.
+
+    Args:
+        record (dict): The decoded JSON object
+        compiled (list): Output of `compile_fields`
+
+    Returns:
+        list: Names of the fields whose value could not be converted
+    """
+    apply_plan = Converter._apply_plan
+    failed = []
+    for field, plan in compiled:
+        value = record.get(field)
+        if value is None:
+            continue
+        try:
+            if isinstance(value, str):
+                value = float(value)
+            elif isinstance(value, bool) or not isinstance(value, Number):
+                raise TypeError("type not supported")
+            record[field] = apply_plan(value, plan)
+        except (TypeError, ValueError, ArithmeticError):
+            failed.append(field)
+    return failed
+
+
+def convert_ndjson(source, destination, compiled, errors="raise", start=0, end=None):
+    """
+    Stream NDJSON records from one binary file object to another.
+
+    Args:
+        source: Binary file object to read records from
+        destination: Binary file object to write records to
+        compiled (list): Output of `compile_fields`
+        errors (str): "raise" to stop at the first bad value, or "coerce" to write
+            null for it and keep going
+        start (int): Byte offset of the first record to read (must start a line)
+        end (int): Stop after the record that crosses this byte offset; None for EOF
+
+    Returns:
+        dict: Counts of "records" read, values "converted" and "failures"
+
+    Raises:
+        ValueError: On invalid JSON, or on a bad value when errors is "raise"
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    stats = {"records": 0, "converted": 0, "failures": 0}
+    if start:
+        source.seek(start)
+    position = start
+    dumps = json.dumps
+    write = destination.write
+    for line in source:
+        line_start = position
+        position += len(line)
+        if not line.strip():
+            write(line)
+        else:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise ValueError(f"Invalid JSON record at byte {line_start}")
+            if isinstance(record, dict) and compiled:
+                failed = convert_record(record, compiled)
+                if failed:
+                    if errors == "raise":
+                        raise ValueError(f"Cannot convert {', '.join(failed)} in the record at byte {line_start}")
+                    for field in failed:
+                        record[field] = None
+                stats["failures"] += len(failed)
+                stats["converted"] += sum(1 for field, _ in compiled if record.get(field) is not None)
+                write(dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+            else:
+                write(line if line.endswith(b"\n") else line + b"\n")
+            stats["records"] += 1
+        if end is not None and position >= end:
+            break
+    return stats
+
+
+BLOCK_SIZE = 1 << 20
+
+
+def _convert_text_line(line, plan, columns, delimiter, join):
+    """
+    Convert one line of text; returns (converted line, values converted, failures).
+    """
+    apply_plan = Converter._apply_plan
+    if columns is None:
+        try:
+            return repr(apply_plan(float(line), plan)), 1, 0
+        except (ValueError, ArithmeticError):
+            return None, 0, 1
+    parts = line.split(delimiter)
+    converted = failures = 0
+    for column in columns:
+        if column < len(parts):
+            try:
+                parts[column] = repr(apply_plan(float(parts[column]), plan))
+                converted += 1
+            except (ValueError, ArithmeticError):
+                parts[column] = None
+                failures += 1
+    if failures:
+        return parts, converted, failures
+    return join(parts), converted, 0
+
+
+def convert_lines(source, destination, plan, columns=None, delimiter=None, errors="raise",
+                  block_size=BLOCK_SIZE):
+    """
+    Convert numbers in lines of text, reading and writing in large blocks.
+
+    Each line holds one number, or delimited fields of which `columns` are converted
+    (other fields are copied as they are). Blank lines are copied.
+
+    Args:
+        source: Binary file object to read UTF-8 text from
+        destination: Binary file object to write to
+        plan (tuple): Pair plan of the conversion (see `Converter._pair_plan`)
+        columns (Iterable[int]): 0-based indexes of the fields to convert; None
+            converts whole lines
+        delimiter (str): Field separator; None splits on runs of whitespace and joins
+            fields with a single space, like awk
+        errors (str): "raise" to stop at the first bad value, or "coerce" to write
+            nan for it and keep going
+        block_size (int): Number of bytes read at a time
+
+    Returns:
+        dict: Counts of "lines" read, values "converted" and "failures"
+
+    Raises:
+        ValueError: On a bad value when errors is "raise"
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    if columns is not None:
+        columns = sorted(set(columns))
+    join = (delimiter if delimiter is not None else " ").join
+    origin_offset, origin_scale, final_scale, final_offset = plan
+    stats = {"lines": 0, "converted": 0, "failures": 0}
+    read, write = source.read, destination.write
+    pending = b""
+    while True:
+        block = read(block_size)
+        if block:
+            # Only complete lines are converted; the rest waits for the next block
+            cut = block.rfind(b"\n")
+            if cut < 0:
+                pending += block
+                continue
+            text, pending = (pending + block[:cut]).decode("utf-8"), block[cut + 1:]
+        elif pending:
+            text, pending = pending.decode("utf-8"), b""
+        else:
+            break
+        lines = text.split("\n")
+        if columns is None:
+            # Fast path: a block of plain numbers converts in one comprehension
+            try:
+                output = [repr((float(line) - origin_offset) / origin_scale * final_scale + final_offset)
+                          for line in lines]
+            except (ValueError, ArithmeticError):
+                pass
+            else:
+                stats["lines"] += len(lines)
+                stats["converted"] += len(lines)
+                output.append("")
+                write("\n".join(output).encode("utf-8"))
+                continue
+        output = []
+        for line in lines:
+            stats["lines"] += 1
+            if not line.strip():
+                output.append(line)
+                continue
+            result, converted, failures = _convert_text_line(line, plan, columns, delimiter, join)
+            if failures:
+                if errors == "raise":
+                    raise ValueError(f"Cannot convert line {stats['lines']}: {line!r}")
+                if columns is None:
+                    result = "nan"
+                else:
+                    result = join("nan" if part is None else part for part in result)
+            stats["converted"] += converted
+            stats["failures"] += failures
+            output.append(result)
+        output.append("")
+        write("\n".join(output).encode("utf-8"))
+    return stats
+
+
+def _shard_boundaries(path, shards):
+    """
+    Split a file into at most `shards` byte ranges that start at line boundaries.
+    """
+    size = os.path.getsize(path)
+    starts = [0]
+    with open(path, "rb") as file:
+        for shard in range(1, shards):
+            file.seek(size * shard // shards)
+            file.readline()  # skip to the start of the next full line
+            position = file.tell()
+            if position >= size:
+                break
+            if position > starts[-1]:
+                starts.append(position)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _convert_shard(args):
+    """
+    Worker process entry point: convert one byte range into its own part file.
+    """
+    source_path, part_path, compiled, errors, start, end = args
+    with open(source_path, "rb") as source, open(part_path, "wb") as destination:
+        return convert_ndjson(source, destination, compiled, errors, start, end)
+
+
+def convert_ndjson_file(source_path, destination_path, fields, converter=None, registry=None,
+                        delta=False, errors="raise", processes=1):
+    """
+    Convert an NDJSON file, optionally sharded by byte range across processes.
+
+    Args:
+        source_path (str): The input file
+        destination_path (str): The output file; records keep their input order
+        fields (dict): Field names mapped to (origin_unit, final_unit) pairs
+        converter (Converter): Converter for all fields; if None categories are detected
+        registry (ConverterRegistry): Registry used for detection
+        delta (bool): Flag indicating whether these are delta/interval conversions
+        errors (str): "raise" or "coerce", as in `convert_ndjson`
+        processes (int): Number of worker processes; 1 converts in this process
+
+    Returns:
+        dict: Counts of "records" read, values "converted" and "failures"
+    """
+    compiled = compile_fields(fields, converter, registry, delta)
+    if processes <= 1:
+        with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+            return convert_ndjson(source, destination, compiled, errors)
+
+    ranges = _shard_boundaries(source_path, processes)
+    parts = [f"{destination_path}.part{number}" for number in range(len(ranges))]
+    jobs = [(source_path, part, compiled, errors, start, end) for part, (start, end) in zip(parts, ranges)]
+    try:
+        with Pool(min(processes, len(jobs))) as pool:
+            results = pool.map(_convert_shard, jobs)
+        with open(destination_path, "wb") as destination:
+            for part in parts:
+                with open(part, "rb") as file:
+                    shutil.copyfileobj(file, destination)
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+    return {key: sum(result[key] for result in results) for key in results[0]}
+
+
+def _read_checkpoint(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_checkpoint(path, checkpoint):
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump(checkpoint, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def _last_line_end(file, start, size):
+    """
+    Return the offset just past the last newline between start and size (start if none).
+    """
+    position = size
+    while position > start:
+        block_start = max(start, position - BLOCK_SIZE)
+        file.seek(block_start)
+        newline = file.read(position - block_start).rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        position = block_start
+    return start
+
+
+def _follow_pass(source_path, destination_path, compiled, errors, checkpoint_path):
+    """
+    Convert the records appended since the checkpoint and advance it.
+    """
+    stats = {"records": 0, "converted": 0, "failures": 0}
+    try:
+        status = os.stat(source_path)
+    except FileNotFoundError:
+        return stats
+    checkpoint = _read_checkpoint(checkpoint_path)
+    offset = checkpoint.get("offset", 0)
+    if checkpoint.get("inode") != status.st_ino or status.st_size < offset:
+        offset = 0  # the file was rotated or truncated
+    with open(source_path, "rb") as source, open(destination_path, "ab") as destination:
+        # Drop output written after the last checkpoint by a run that did not finish
+        output_size = checkpoint.get("output_size")
+        if output_size is not None and destination.tell() > output_size:
+            destination.truncate(output_size)
+            destination.seek(output_size)  # truncate does not move the position
+        end = _last_line_end(source, offset, status.st_size)
+        if end > offset:
+            if output_size is None:
+                # First pass: record where its output starts, so it can be dropped if
+                # the pass does not finish
+                _write_checkpoint(checkpoint_path, {"offset": offset, "inode": status.st_ino,
+                                                    "output_size": destination.tell()})
+            source.seek(offset)
+            stats = convert_ndjson(source, destination, compiled, errors, offset, end)
+        destination.flush()
+        os.fsync(destination.fileno())
+        output_size = destination.tell()
+    _write_checkpoint(checkpoint_path, {"offset": end, "inode": status.st_ino, "output_size": output_size})
+    return stats
+
+
+def follow_ndjson(source_path, destination_path, fields, converter=None, registry=None, delta=False,
+                  errors="raise", checkpoint_path=None, once=False, interval=1.0):
+    """
+    Convert records appended to an NDJSON file, resuming from a checkpoint.
+
+    Only complete (newline-terminated) records are converted; a partly written last
+    record waits for the next pass. Converted records are appended to the output
+    file. The checkpoint stores the input byte offset and output size, so output of
+    an interrupted pass is discarded and converted again instead of duplicated.
+    A rotated or truncated input file is read again from the start.
+
+    Args:
+        source_path (str): The growing input file
+        destination_path (str): The output file records are appended to
+        fields (dict): Field names mapped to (origin_unit, final_unit) pairs
+        converter (Converter): Converter for all fields; if None categories are detected
+        registry (ConverterRegistry): Registry used for detection
+        delta (bool): Flag indicating whether these are delta/interval conversions
+        errors (str): "raise" or "coerce", as in `convert_ndjson`
+        checkpoint_path (str): The checkpoint file; defaults to the output path
+            with a ".checkpoint" suffix
+        once (bool): Make a single pass and return (e.g. from cron); otherwise poll
+            the file every `interval` seconds until interrupted
+        interval (float): Seconds between passes
+
+    Returns:
+        dict: Counts of "records" read, values "converted" and "failures" (once only)
+    """
+    compiled = compile_fields(fields, converter, registry, delta)
+    if checkpoint_path is None:
+        checkpoint_path = f"{destination_path}.checkpoint"
+    totals = {"records": 0, "converted": 0, "failures": 0}
+    while True:
+        stats = _follow_pass(source_path, destination_path, compiled, errors, checkpoint_path)
+        for key in totals:
+            totals[key] += stats[key]
+        if once:
+            return totals
+        time.sleep(interval)
@@ -0,0 +1,89 @@
+"""
+Unit Name Suggestions
+
+This module suggests valid unit symbols for a misspelled one ("did you mean ...?").
+A UnitIndex is built once per unit table: an inverted index from the character
+bigrams of every (case-folded) unit symbol to the units containing them. A lookup
+counts shared bigrams to pick a few candidates and ranks only those by edit
+distance, so it stays fast with hundreds of units.
+
+Example Usage:
+    >>> from suggestions import UnitIndex
+    >>> UnitIndex(["m", "km", "cm", "mi", "ft"]).suggest("kmm")
+    ['km']
+"""
+
+from collections import Counter
+
+
+def _grams(text):
+    """
+    Return the character bigrams of a case-folded name, padded so its ends count.
+    """
+    padded = f" {text} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def edit_distance(a, b):
+    """
+    Optimal string alignment distance: insertions, deletions, substitutions and
+    transpositions of adjacent characters each cost 1.
+    """
+    previous2, previous = None, list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, previous2[j - 2] + 1)
+            current.append(cost)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class UnitIndex:
+    """
+    Bigram index over unit symbols for ranked spelling suggestions.
+
+    Attributes:
+        names (tuple): The indexed unit symbols
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names (Iterable[str]): Unit symbols (including aliases) to index
+        """
+        self.names = tuple(names)
+        self._folded = [name.casefold() for name in self.names]
+        self._postings = {}
+        for unit_id, folded in enumerate(self._folded):
+            for gram in _grams(folded):
+                self._postings.setdefault(gram, []).append(unit_id)
+
+    def suggest(self, name, limit=3, candidates=20):
+        """
+        Return up to `limit` indexed symbols close to `name`, best first.
+
+        A symbol qualifies if it differs only in letter case, or if its edit distance
+        from `name` is at most 1 for names of up to 3 characters (2 for longer ones).
+
+        Args:
+            name (str): The misspelled unit symbol
+            limit (int): Maximum number of suggestions
+            candidates (int): Number of bigram matches ranked by edit distance
+        """
+        folded = name.casefold()
+        shared = Counter()
+        for gram in _grams(folded):
+            shared.update(self._postings.get(gram, ()))
+        threshold = 1 if len(folded) <= 3 else 2
+        ranked = []
+        for unit_id, count in shared.most_common(candidates):
+            candidate = self._folded[unit_id]
+            distance = 0 if candidate == folded else edit_distance(folded, candidate)
+            if distance <= threshold:
+                # Prefer an exact case-insensitive match, then closeness, then overlap
+                ranked.append((distance, -count, len(candidate), self.names[unit_id]))
+        ranked.sort()
+        return [entry[-1] for entry in ranked[:limit]]
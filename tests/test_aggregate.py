@@ -0,0 +1,63 @@
+import pytest
+
+from base_class import Converter
+
+
+@pytest.fixture
+def temperature():
+    return Converter({"ºC": (1, 0), "°F": (1.8, 32), "ºD": (-1.5, 150), "K": (1, 273.15)})
+
+
+VALUES = [12.5, -3.0, 40.0, 7.25]
+
+
+@pytest.mark.parametrize("final", ["°F", "ºD", "K"])
+@pytest.mark.parametrize("delta", [False, True])
+def test_aggregate_matches_converting_each_value(temperature, final, delta):
+    converted = temperature.convert(VALUES, "ºC", final, delta)
+    assert temperature.aggregate(VALUES, "ºC", final, "sum", delta) == pytest.approx(sum(converted))
+    assert temperature.aggregate(VALUES, "ºC", final, "mean", delta) == pytest.approx(sum(converted) / 4)
+    assert temperature.aggregate(VALUES, "ºC", final, "min", delta) == pytest.approx(min(converted))
+    assert temperature.aggregate(VALUES, "ºC", final, "max", delta) == pytest.approx(max(converted))
+    assert temperature.aggregate(iter(VALUES), "ºC", final, "count", delta) == 4
+
+
+def test_running_aggregate_chunks_and_merge(temperature):
+    first = temperature.accumulator("ºC", "ºD")
+    first.extend(VALUES[:2])
+    first.add(VALUES[2])
+    second = temperature.accumulator("ºC", "ºD")
+    second.extend(VALUES[3:])
+    first.merge(second)
+    assert first.count == 4
+    assert first.min() == pytest.approx(min(temperature.convert(VALUES, "ºC", "ºD")))
+    with pytest.raises(ValueError):
+        first.merge(temperature.accumulator("ºC", "K"))
+
+
+def test_aggregate_empty(temperature):
+    assert temperature.aggregate([], "ºC", "°F", "sum") == 0
+    with pytest.raises(ValueError):
+        temperature.aggregate([], "ºC", "°F", "mean")
+
+
+@pytest.mark.parametrize("units, op", [(("ºC", "R"), "sum"), (("ºC", "°F"), "median")])
+def test_aggregate_invalid_arguments(temperature, units, op):
+    with pytest.raises(ValueError):
+        temperature.aggregate(VALUES, units[0], units[1], op)
+
+
+def test_aggregate_streams_generators_in_bounded_memory(temperature):
+    import tracemalloc
+    count = 200000
+    tracemalloc.start()
+    try:
+        total = temperature.aggregate((float(i) for i in range(count)), "ºC", "K", "sum", delta=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert total == pytest.approx(count * (count - 1) / 2)
+    # A list of every value would take several megabytes
+    assert peak < 1024 * 1024
+    assert temperature.aggregate(iter([]), "ºC", "K", "count") == 0
+    assert temperature.aggregate(iter(VALUES * 5000), "ºC", "K", "max", delta=True) == 40.0
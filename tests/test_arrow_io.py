@@ -0,0 +1,37 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+arrow_io = pytest.importorskip("arrow_io")
+
+
+def test_convert_array_keeps_nulls_and_type(converter):
+    values = pa.array([0.0, None, 100.0], type=pa.float32())
+    result = arrow_io.convert_array(values, converter, "°C", "°F")
+    assert result.type == pa.float32()
+    assert result.to_pylist() == [pytest.approx(32.0), None, pytest.approx(212.0)]
+
+
+def test_convert_table_keeps_schema(converter):
+    schema = pa.schema([pa.field("d", pa.float64()), pa.field("id", pa.string())], metadata={b"k": b"v"})
+    table = pa.table({"d": [1.0, 2.0], "id": ["a", "b"]}, schema=schema)
+    result = arrow_io.convert_table(table, {"d": ("km", "m")}, converter)
+    assert result.schema.equals(schema, check_metadata=True)
+    assert result.column("d").to_pylist() == [1000.0, 2000.0]
+
+
+def test_convert_table_rejects_non_float(converter):
+    table = pa.table({"d": pa.array([1, 2], type=pa.int64())})
+    with pytest.raises(TypeError):
+        arrow_io.convert_table(table, {"d": ("km", "m")}, converter)
+
+
+def test_convert_parquet_by_row_group(converter, tmp_path):
+    source = str(tmp_path / "in.parquet")
+    destination = str(tmp_path / "out.parquet")
+    table = pa.table({"d": [float(i) for i in range(10)]})
+    pq.write_table(table, source, row_group_size=4)
+    assert arrow_io.convert_parquet(source, destination, {"d": ("km", "m")}, converter) == 10
+    result = pq.ParquetFile(destination)
+    assert result.num_row_groups == 3
+    assert result.read().column("d").to_pylist() == [i * 1000.0 for i in range(10)]
@@ -0,0 +1,59 @@
+import pytest
+
+from base_class import Converter
+
+
+@pytest.fixture
+def length():
+    conv = Converter({
+        "mm": (1000, 0),
+        "m": (1, 0),
+        "metre": (1, 0),
+        "km": (0.001, 0),
+        "Gm": (1e-9, 0),
+        "ft": (3.2808399, 0),
+        "°C": (1, 0),
+        "K": (1, 273.15),
+    })
+    conv.add_family("SI", ["mm", "m", "km", "Gm"])
+    return conv
+
+
+@pytest.mark.parametrize("value, unit, expected", [
+    (1.5e9, "m", (1.5, "Gm")),
+    (2500, "m", (2.5, "km")),
+    (0.25, "m", (250.0, "mm")),
+    (1e-6, "m", (0.001, "mm")),
+    (3, "km", (3.0, "km")),
+])
+def test_autoscale_family(length, value, unit, expected):
+    result, chosen = length.autoscale(value, unit, "SI")
+    assert chosen == expected[1]
+    assert result == pytest.approx(expected[0])
+
+
+def test_autoscale_zero_keeps_unit(length):
+    assert length.autoscale(0, "km", "SI") == (0, "km")
+
+
+def test_autoscale_explicit_family(length):
+    result, chosen = length.autoscale(3000, "mm", ["m", "ft"])
+    assert chosen == "m"
+    assert result == pytest.approx(3.0)
+
+
+def test_autoscale_default_family_skips_offset_units(length):
+    _, chosen = length.autoscale(1e10, "m")
+    assert chosen == "Gm"
+
+
+def test_autoscale_many(length):
+    results = length.autoscale_many([2000, 0.5], "m", "SI")
+    assert [unit for _, unit in results] == ["km", "mm"]
+    assert [value for value, _ in results] == pytest.approx([2.0, 500.0])
+
+
+@pytest.mark.parametrize("family", ["imperial", ["K"], ["parsec"]])
+def test_autoscale_invalid_family(length, family):
+    with pytest.raises(ValueError):
+        length.autoscale(1, "m", family)
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_convert_dict_copy(converter):
     data = {"a": 1000, "b": 2000}
     result = converter.convert(data, "m", "km")
@@ -12,3 +15,40 @@ def test_convert_list_inplace(converter):
 def test_convert_tuple_returns_iterable(converter):
     result = converter.convert((1, 2), "m", "cm")
     assert list(result) == [100, 200]
+
+def test_convert_dict_inplace_keeps_identity(converter):
+    data = {"a": 1000, "b": 2000}
+    result = converter.convert(data, "m", "km", inplace=True)
+    assert result is data
+    assert data == {"a": 1, "b": 2}
+
+def test_convert_float_array_inplace(converter):
+    from array import array
+    values = array("d", [1.0, 2.0])
+    result = converter.convert(values, "m", "cm", inplace=True)
+    assert result is values
+    assert list(values) == [100.0, 200.0]
+
+def test_convert_dict_inplace_peak_memory_is_flat(converter):
+    import sys
+    import tracemalloc
+    data = {i: float(i) for i in range(100000)}
+    tracemalloc.start()
+    try:
+        converter.convert(data, "m", "cm", inplace=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # A temporary copy would need at least as much memory as the dict itself
+    assert peak < sys.getsizeof(data) / 10
+    assert data[5] == 500.0
+
+def test_convert_inplace_bad_element_leaves_collection_unchanged(converter):
+    values = [1, "x", 3]
+    data = {"a": 1, "b": None}
+    with pytest.raises((TypeError, ValueError)):
+        converter.convert(values, "m", "cm", inplace=True)
+    with pytest.raises((TypeError, ValueError)):
+        converter.convert(data, "m", "cm", inplace=True)
+    assert values == [1, "x", 3]
+    assert data == {"a": 1, "b": None}
@@ -0,0 +1,59 @@
+import json
+import time
+
+import pytest
+
+from diagnostics import Profiler, enabled
+
+
+def test_wrap_records_durations():
+    profiler = Profiler()
+    handler = profiler.wrap("convert", lambda value: time.sleep(0.002) or value)
+    assert handler(5) == 5
+    handler(6)
+    stats = profiler.summary()["handlers"]["convert"]
+    assert stats["count"] == 2
+    assert stats["max_ms"] >= 2 and stats["mean_ms"] == pytest.approx(stats["total_ms"] / 2)
+
+
+def test_wrap_records_failing_handlers():
+    profiler = Profiler()
+    with pytest.raises(ZeroDivisionError):
+        profiler.wrap("broken", lambda: 1 / 0)()
+    assert profiler.summary()["handlers"]["broken"]["count"] == 1
+
+
+def test_late_frames():
+    profiler = Profiler(frame_interval=0.016, late_threshold=0.008)
+    profiler.frame(0.001)
+    profiler.frame(0.050)
+    summary = profiler.summary()
+    assert summary["late_frames"] == 1 and summary["dropped_frames"] == 3
+
+
+def test_chrome_trace_export(tmp_path):
+    profiler = Profiler()
+    profiler.instant("key", args={"key": "5"})
+    profiler.wrap("convert", lambda: None)()
+    profiler.frame(0.1)
+    path = profiler.export_chrome_trace(str(tmp_path / "trace.json"))
+    with open(path, encoding="utf-8") as file:
+        trace = json.load(file)
+    phases = [event["ph"] for event in trace["traceEvents"]]
+    assert phases.count("X") == 2 and "i" in phases and "C" in phases and "M" in phases
+    assert all("ts" in event for event in trace["traceEvents"] if event["ph"] != "M")
+
+
+def test_events_are_bounded():
+    profiler = Profiler(max_events=10)
+    for _ in range(50):
+        profiler.instant("key")
+    assert len(profiler._events) == 10
+
+
+def test_enabled(monkeypatch):
+    monkeypatch.delenv("UNITCONV_DIAGNOSTICS", raising=False)
+    assert not enabled([])
+    assert enabled(["--diagnostics"])
+    monkeypatch.setenv("UNITCONV_DIAGNOSTICS", "1")
+    assert enabled([])
@@ -0,0 +1,53 @@
+import pytest
+
+from base_class import Converter
+
+
+@pytest.fixture
+def length():
+    return Converter({
+        "m": (1, 0),
+        "metre": (1, 0),
+        "km": (0.001, 0),
+        "ly/year": (299792458.00000006, 0),
+        "c": (299792458, 0),
+        "°C": (1, 0),
+        "K": (1, 273.15),
+    })
+
+
+def test_equivalent_units(length):
+    assert length.equivalent("m", "metre")
+    assert length.equivalent("c", "ly/year")
+    assert not length.equivalent("m", "km")
+    assert not length.equivalent("m", "parsec")
+    assert not length.equivalent("°C", "K")
+    assert length.equivalent("°C", "K", delta=True)
+
+
+def test_identity_conversion_returns_input(length):
+    values = [1, 2, 3]
+    assert length.convert(values, "m", "metre", inplace=True) is values
+    copy = length.convert(values, "m", "metre")
+    assert copy == values and copy is not values
+    data = {"a": 1}
+    assert length.convert(data, "metre", "m") == data
+    assert length.convert(data, "metre", "m") is not data
+    for values in ((1, 2), frozenset((1, 2))):
+        assert length.convert(values, "m", "metre") is values
+    values = {1, 2}
+    copy = length.convert(values, "m", "metre")
+    assert copy == values and copy is not values and type(copy) is set
+    assert length.convert(5, "c", "ly/year") == 5
+
+
+def test_identity_conversion_still_validates_with_coerce(length):
+    result, failures = length.convert([1, "x"], "m", "metre", errors="collect", fill=None)
+    assert result == [1, None]
+    assert failures == [1]
+
+
+def test_equivalence_classes_follow_unit_changes(length):
+    assert length.equivalent("m", "metre")
+    length.units["metre"] = (2, 0)
+    assert not length.equivalent("m", "metre")
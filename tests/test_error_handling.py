@@ -8,3 +8,35 @@ def test_invalid_unit_raises_value_error(converter):
 def test_convert_invalid_input_raises(converter, bad_value):
     with pytest.raises(TypeError):
         converter.convert(bad_value, "m", "km")
+
+def test_coerce_fills_nan_for_bad_elements(converter):
+    import math
+    result = converter.convert([1, "x", None, 3], "m", "cm", errors="coerce")
+    assert result[0] == 100 and result[3] == 300
+    assert math.isnan(result[1]) and math.isnan(result[2])
+
+def test_collect_reports_failing_positions(converter):
+    values = [1, "x", 3]
+    result, failures = converter.convert(values, "m", "cm", inplace=True, errors="collect", fill=None)
+    assert result is values
+    assert values == [100, None, 300]
+    assert failures == [1]
+
+def test_collect_reports_failing_dict_keys(converter):
+    result, failures = converter.convert({"a": 1, "b": "?"}, "m", "cm", errors="collect")
+    assert result["a"] == 100
+    assert failures == ["b"]
+
+def test_collect_single_value(converter):
+    assert converter.convert("abc", "m", "km", errors="collect", fill=None) == (None, [0])
+    assert converter.convert(1, "m", "cm", errors="collect") == (100, [])
+
+def test_invalid_units_raise_before_converting(converter):
+    values = [1, 2]
+    with pytest.raises(ValueError):
+        converter.convert(values, "m", "unknown", inplace=True, errors="coerce")
+    assert values == [1, 2]
+
+def test_unknown_errors_mode_raises(converter):
+    with pytest.raises(ValueError):
+        converter.convert(1, "m", "km", errors="ignore")
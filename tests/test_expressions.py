@@ -0,0 +1,57 @@
+import math
+
+import pytest
+
+from base_class import Converter, InvalidUnitError
+
+
+@pytest.fixture
+def length():
+    return Converter({"m": (1, 0), "ft": (3.28084, 0), "in": (39.3701, 0), "sq m": (1, 0), "ft-us": (3.2808333, 0)})
+
+
+def test_compound_terms_add(length):
+    assert length.evaluate("5 ft 3 in", "in") == pytest.approx(63, rel=1e-5)
+    assert length.evaluate("5ft+3in", "in") == pytest.approx(63, rel=1e-5)
+    assert length.evaluate("10 ft - 3 in", "in") == pytest.approx(117, rel=1e-5)
+    assert length.evaluate("1 m + -50 in", "in") == pytest.approx(39.3701 - 50)
+
+
+def test_longest_unit_symbol_wins(length):
+    assert length.evaluate("2 sq m", "m") == 2
+    assert length.evaluate("1 ft-us", "ft") == pytest.approx(3.28084 / 3.2808333)
+
+
+def test_later_terms_are_deltas(converter):
+    assert converter.evaluate("20 °C + 9 °F", "°C") == pytest.approx(25)
+    assert converter.evaluate("20 °C + 9 °F", "°C", delta=True) == pytest.approx(25)
+    assert converter.evaluate("0 °C + 10 K", "°F") == pytest.approx(50)
+
+
+def test_bare_numbers_use_default_unit(converter):
+    assert converter.evaluate("2 km 300", "m", default_unit="m") == 2300
+    with pytest.raises(ValueError):
+        converter.evaluate("2 km 300", "m")
+
+
+def test_invalid_expressions(converter):
+    with pytest.raises(InvalidUnitError):
+        converter.evaluate("3 kmm", "m")
+    for text in ("", "km", "3 km +"):
+        with pytest.raises(ValueError):
+            converter.evaluate(text, "m")
+
+
+def test_compiled_expressions_are_cached(converter):
+    converter.evaluate("1 km 20 m", "m")
+    expression = converter._expressions["1 km 20 m"]
+    assert converter.evaluate("1 km 20 m", "cm") == 102000
+    assert converter._expressions["1 km 20 m"] is expression
+    converter.units["km"] = (0.002, 0)
+    assert converter.evaluate("1 km 20 m", "m") == 520
+
+
+def test_evaluate_many(converter):
+    values, failures = converter.evaluate_many(["1 km", "bad", "5 m 20 cm"], "m", errors="collect")
+    assert values[0] == 1000 and math.isnan(values[1]) and values[2] == pytest.approx(5.2)
+    assert failures == [1]
@@ -0,0 +1,47 @@
+import csv
+import io
+
+import pytest
+
+
+def test_factor_matrix_matches_convert(converter):
+    matrix = converter.factor_matrix()
+    for origin in converter.units:
+        for final in converter.units:
+            i, j = matrix.unit_id(origin), matrix.unit_id(final)
+            assert matrix.convert(37, i, j) == pytest.approx(converter.convert(37, origin, final))
+
+
+def test_factor_matrix_delta(converter):
+    matrix = converter.factor_matrix(delta=True)
+    assert matrix.lookup(matrix.unit_id("°C"), matrix.unit_id("°F")) == pytest.approx((1.8, 0))
+
+
+def test_factor_matrix_is_cached_until_units_change(converter):
+    matrix = converter.factor_matrix()
+    assert converter.factor_matrix() is matrix
+    converter.units["mm"] = (1000, 0)
+    assert converter.factor_matrix() is not matrix
+    assert "mm" in converter.factor_matrix().units
+
+
+def test_factor_matrix_invalid_unit(converter):
+    with pytest.raises(ValueError):
+        converter.factor_matrix().unit_id("parsec")
+
+
+def test_factor_matrix_csv(converter):
+    output = io.StringIO()
+    matrix = converter.factor_matrix()
+    matrix.to_csv(output)
+    rows = list(csv.reader(io.StringIO(output.getvalue())))
+    assert rows[0] == [""] + list(matrix.units)
+    m, cm = matrix.unit_id("m"), matrix.unit_id("cm")
+    assert rows[m + 1][0] == "m"
+    assert float(rows[m + 1][cm + 1]) == 100.0
+
+
+def test_factor_matrix_numpy(converter):
+    pytest.importorskip("numpy")
+    scale, offset = converter.factor_matrix().to_numpy()
+    assert scale.shape == offset.shape == (len(converter.units),) * 2
@@ -0,0 +1,61 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from base_class import Converter, FrozenConverter
+
+
+def test_init_does_not_modify_callers_dict():
+    units = {"m": 1, "cm": [100, 0]}
+    Converter(units)
+    assert units == {"m": 1, "cm": [100, 0]}
+
+
+def test_changing_units_invalidates_cached_plans(converter):
+    assert converter.convert([1], "m", "cm") == [100]
+    converter.units["cm"] = (1000, 0)
+    assert converter.convert([1], "m", "cm") == [1000]
+    converter.units.update({"cm": (10, 0)})
+    assert converter.convert([1], "m", "cm") == [10]
+
+
+def test_freeze_is_immutable(converter):
+    frozen = converter.freeze()
+    assert isinstance(frozen, FrozenConverter)
+    assert frozen.freeze() is frozen
+    with pytest.raises(TypeError):
+        frozen.units["m"] = (2, 0)
+    with pytest.raises(TypeError):
+        frozen.units = {"m": (1, 0)}
+    with pytest.raises(TypeError):
+        frozen.add_family("SI", ["m"])
+    assert frozen.convert(25, "°C", "°F") == pytest.approx(77.0)
+
+
+def test_freeze_is_independent_of_original(converter):
+    frozen = converter.freeze()
+    converter.units["cm"] = (1000, 0)
+    assert frozen.convert(1, "m", "cm") == 100
+
+
+def test_content_hash(converter):
+    first = converter.freeze()
+    assert first.content_hash == Converter(dict(converter.units)).freeze().content_hash
+    converter.units["mm"] = (1000, 0)
+    assert converter.freeze().content_hash != first.content_hash
+
+
+def test_frozen_converter_pickles(converter):
+    frozen = pickle.loads(pickle.dumps(converter.freeze()))
+    assert isinstance(frozen, FrozenConverter)
+    assert frozen.convert(1, "km", "m") == 1000
+    with pytest.raises(TypeError):
+        frozen.units["m"] = (2, 0)
+
+
+def test_frozen_converter_shared_between_threads(converter):
+    frozen = converter.freeze()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda i: frozen.convert([i] * 100, "km", "m"), range(50)))
+    assert all(result == [i * 1000] * 100 for i, result in enumerate(results))
@@ -0,0 +1,85 @@
+import pickle
+
+import pytest
+
+from base_class import Converter, LRUCache
+from memory import deep_sizeof, report, traced
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    shared = list(range(100))
+    seen = set()
+    first = deep_sizeof({"a": shared}, seen)
+    assert first > deep_sizeof(shared)
+    assert deep_sizeof({"b": shared}, seen) < first
+
+
+def test_memory_report_includes_caches(converter):
+    empty = converter.memory_report()
+    converter.convert([1, 2], "m", "km")
+    converter.factor_matrix()
+    converter.suggest_units("kmm")
+    grown = converter.memory_report()
+    assert grown["entries"]["plans"] == 1
+    for part in ("plans", "factor_matrices", "suggestion_index"):
+        assert grown[part] > empty[part]
+    assert grown["total"] == sum(value for key, value in grown.items() if isinstance(value, int) and key != "total")
+
+
+def test_plan_cache_limit_evicts_least_recently_used(converter):
+    converter.set_cache_limits(plans=2)
+    converter.convert([1], "m", "km")
+    converter.convert([1], "m", "cm")
+    converter.convert([1], "m", "km")
+    converter.convert([1], "km", "m")
+    assert list(converter._plans) == [("m", "km", False), ("km", "m", False)]
+    assert converter.memory_report()["evictions"]["plans"] == 1
+    assert converter.convert([1], "m", "cm") == [100]
+
+
+def test_matrix_and_scale_index_caches_are_bounded(converter):
+    converter.set_cache_limits(factor_matrices=1, scale_indexes=2)
+    converter.factor_matrix()
+    converter.factor_matrix(delta=True)
+    for family in (["m", "km"], ["m", "cm"], ["km", "cm"]):
+        converter.autoscale(1500, "m", family)
+    report = converter.memory_report()
+    assert report["entries"]["factor_matrices"] == 1 and report["evictions"]["factor_matrices"] == 1
+    assert report["entries"]["scale_indexes"] == 2 and report["evictions"]["scale_indexes"] == 1
+
+
+def test_cache_limits_validation_and_pickling(converter):
+    with pytest.raises(ValueError):
+        converter.set_cache_limits(matrices=3)
+    with pytest.raises(ValueError):
+        converter.set_cache_limits(plans=0)
+    converter.set_cache_limits(expressions=5)
+    copy = pickle.loads(pickle.dumps(converter))
+    assert copy.cache_limits["expressions"] == 5 and copy._expressions.maxsize == 5
+    assert Converter.cache_limits["expressions"] == 1024
+
+
+def test_lru_cache():
+    cache = LRUCache(2, {"a": 1, "b": 2})
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"] and cache.evictions == 1
+    assert cache.get("b") is None
+
+
+def test_lru_cache_set_survives_concurrent_eviction():
+    class EvictingCache(LRUCache):
+        def move_to_end(self, key, last=True):
+            self.pop(key, None)  # another thread evicted the key
+            super().move_to_end(key, last)
+
+    cache = EvictingCache(2)
+    cache["a"] = 1
+    assert "a" not in cache
+
+
+def test_module_report(converter):
+    result = report({"Test": converter})
+    assert result["total"] == result["converters"]["Test"]["total"]
+    value, retained, peak = traced(lambda: [0.0] * 10000)
+    assert len(value) == 10000 and retained >= 80000 and peak >= retained
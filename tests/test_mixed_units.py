@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+
+def test_convert_mixed(converter):
+    result = converter.convert_mixed([1, 250, 3], ["km", "cm", "m"], "m")
+    assert result == pytest.approx([1000.0, 2.5, 3.0])
+
+
+def test_convert_mixed_delta(converter):
+    assert converter.convert_mixed([10, 10], ["°C", "K"], "°F", delta=True) == pytest.approx([18.0, 18.0])
+
+
+def test_convert_mixed_collect(converter):
+    result, failures = converter.convert_mixed([1, 2, "x"], ["km", "parsec", "m"], "m", errors="collect")
+    assert result[0] == pytest.approx(1000.0)
+    assert math.isnan(result[1]) and math.isnan(result[2])
+    assert failures == [1, 2]
+
+
+def test_convert_mixed_invalid(converter):
+    with pytest.raises(ValueError):
+        converter.convert_mixed([1], ["parsec"], "m")
+    with pytest.raises(ValueError):
+        converter.convert_mixed([1, 2], ["m"], "m")
+    with pytest.raises(ValueError):
+        converter.convert_mixed([1], ["m"], "parsec")
+
+
+def test_convert_mixed_numpy(converter):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([1.0, 250.0, 3.0, 4.0])
+    result, failures = converter.convert_mixed(values, ["km", "cm", "m", "parsec"], "m", errors="collect")
+    assert isinstance(result, numpy.ndarray)
+    assert result[:3].tolist() == pytest.approx([1000.0, 2.5, 3.0])
+    assert math.isnan(result[3])
+    assert failures == [3]
+    with pytest.raises(ValueError):
+        converter.convert_mixed(values, ["km", "cm", "m", "parsec"], "m")
+
+
+def test_convert_mixed_numpy_bad_unit_types(converter):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array([1.0, 2.0, 3.0])
+    units = ["km", None, 5]
+    result, failures = converter.convert_mixed(values, units, "m", errors="collect")
+    expected, expected_failures = converter.convert_mixed(values.tolist(), units, "m", errors="collect")
+    assert failures == expected_failures == [1, 2]
+    assert result[0] == expected[0] == pytest.approx(1000.0)
+    assert all(math.isnan(value) for value in result[1:])
+    with pytest.raises(ValueError):
+        converter.convert_mixed(values, units, "m")
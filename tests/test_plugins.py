@@ -0,0 +1,94 @@
+import json
+import sys
+
+import pytest
+
+registry = pytest.importorskip("registry")
+plugins = pytest.importorskip("plugins")
+from base_class import Converter
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    directory = tmp_path / "packs"
+    directory.mkdir()
+    (directory / "Pressure.json").write_text(json.dumps({"units": {"Pa": 1, "bar": 1e-5, "psi": 1.450377e-4}}),
+                                             encoding="utf-8")
+    (directory / "notes.txt").write_text("not a unit file", encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def installed_pack(tmp_path, monkeypatch):
+    # A minimal installed distribution exposing one converter through an entry point
+    site = tmp_path / "site"
+    (site / "flow_pack-1.0.dist-info").mkdir(parents=True)
+    (site / "flow_pack-1.0.dist-info" / "METADATA").write_text("Name: flow-pack\nVersion: 1.0\n")
+    (site / "flow_pack-1.0.dist-info" / "entry_points.txt").write_text(
+        f"[{plugins.ENTRY_POINT_GROUP}]\nFlow = flow_pack:make_flow\n")
+    (site / "flow_pack.py").write_text(
+        "from base_class import Converter\n"
+        "def make_flow():\n"
+        "    return Converter({'m³/s': (1, 0), 'L/s': (1000, 0)})\n")
+    monkeypatch.syspath_prepend(str(site))
+    yield
+    sys.modules.pop("flow_pack", None)
+
+
+def test_unit_file_plugins_load_on_first_use(plugin_dir):
+    reg = registry.ConverterRegistry()
+    assert plugins.discover_plugins(reg, paths=[str(plugin_dir)], group="none") == ["Pressure"]
+    assert not reg.is_loaded("Pressure")
+    assert reg.convert(1, "bar", "Pa") == pytest.approx(1e5)
+    assert reg.is_loaded("Pressure")
+
+
+def test_plugin_path_variable(plugin_dir, monkeypatch):
+    monkeypatch.setenv(plugins.PLUGIN_PATH_VARIABLE, str(plugin_dir))
+    assert plugins.plugin_paths() == [str(plugin_dir)]
+
+
+def test_entry_point_plugins(installed_pack):
+    pytest.importorskip("importlib.metadata")
+    reg = registry.ConverterRegistry()
+    assert plugins.discover_plugins(reg, paths=[]) == ["Flow"]
+    assert "flow_pack" not in sys.modules
+    assert reg.convert(1, "m³/s", "L/s") == pytest.approx(1000)
+
+
+def test_registered_categories_are_kept(plugin_dir):
+    reg = registry.ConverterRegistry()
+    builtin = Converter({"Pa": (1, 0), "kPa": (0.001, 0)})
+    reg.register("Pressure", builtin)
+    with pytest.warns(UserWarning):
+        assert plugins.discover_plugins(reg, paths=[str(plugin_dir)], group="none") == []
+    assert reg.get("Pressure") is builtin
+
+
+def test_broken_plugin_does_not_block_detection(tmp_path):
+    reg = registry.ConverterRegistry()
+    reg.register("Length", Converter({"m": (1, 0), "km": (0.001, 0)}))
+    (tmp_path / "Broken.json").write_text("{", encoding="utf-8")
+    (tmp_path / "Pressure.json").write_text(json.dumps({"units": {"Pa": 1, "bar": 1e-5}}), encoding="utf-8")
+    plugins.discover_plugins(reg, paths=[str(tmp_path)], group="none")
+    with pytest.warns(UserWarning):
+        assert reg.convert(1, "bar", "Pa") == pytest.approx(1e5)
+
+
+def test_builtin_pairs_load_no_plugins(plugin_dir, installed_pack, monkeypatch):
+    pytest.importorskip("importlib.metadata")
+    reg = registry.ConverterRegistry()
+    reg.register("Length", Converter({"m": (1, 0), "km": (0.001, 0)}))
+    assert plugins.discover_plugins(reg, paths=[str(plugin_dir)]) == ["Flow", "Pressure"]
+
+    def fail(path, *args, **kwargs):
+        raise AssertionError("unit file loaded")
+    with monkeypatch.context() as patch:
+        patch.setattr("unit_files.load_units", fail)
+        assert reg.convert(1, "km", "m") == pytest.approx(1000)
+    assert not reg.is_loaded("Pressure") and not reg.is_loaded("Flow")
+    assert "flow_pack" not in sys.modules
+    # A plug-in pair loads only the category that defines it; the unit file's
+    # symbols come from its compiled table, not from a constructed converter
+    assert reg.convert(1, "bar", "Pa") == pytest.approx(1e5)
+    assert reg.is_loaded("Pressure")
@@ -0,0 +1,49 @@
+from array import array
+
+import pytest
+
+quantity = pytest.importorskip("quantity")
+Quantity = quantity.Quantity
+QuantityArray = quantity.QuantityArray
+
+
+def test_quantity_to(converter):
+    result = Quantity(25, "°C", converter).to("°F")
+    assert result.unit == "°F"
+    assert result.value == pytest.approx(77.0)
+    assert Quantity(10, "°C", converter).to("°F", delta=True).value == pytest.approx(18.0)
+
+
+def test_quantity_invalid_unit(converter):
+    with pytest.raises(ValueError):
+        Quantity(1, "parsec", converter)
+    with pytest.raises(ValueError):
+        Quantity(1, "m", converter).to("parsec")
+
+
+def test_quantity_has_no_instance_dict(converter):
+    with pytest.raises(AttributeError):
+        Quantity(1, "m", converter).extra = 1
+
+
+def test_quantity_array_to(converter):
+    values = QuantityArray([1, 2, 3], "m", converter)
+    result = values.to("cm")
+    assert isinstance(result.values, array)
+    assert list(result) == [100.0, 200.0, 300.0]
+    assert list(values) == [1.0, 2.0, 3.0]
+
+
+def test_quantity_array_to_inplace(converter):
+    buffer = array("d", [1.0, 2.0])
+    values = QuantityArray(buffer, "km", converter)
+    assert values.to("m", inplace=True) is values
+    assert values.values is buffer
+    assert values.unit == "m"
+    assert list(buffer) == [1000.0, 2000.0]
+
+
+def test_quantity_array_slicing(converter):
+    values = QuantityArray([1, 2, 3], "m", converter)
+    assert values[1] == 2.0
+    assert list(values[1:].to("cm")) == [200.0, 300.0]
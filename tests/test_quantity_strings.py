@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12.5 km", (12.5, "km")),
+    ("-40 °F", (-40.0, "°F")),
+    ("98.6°F", (98.6, "°F")),
+    ("1e3 m", (1000.0, "m")),
+    ("  .5cm ", (0.5, "cm")),
+])
+def test_parse_quantity(converter, text, expected):
+    assert converter.parse_quantity(text) == expected
+
+
+def test_parse_quantity_default_unit(converter):
+    assert converter.parse_quantity("3", default_unit="m") == (3.0, "m")
+    with pytest.raises(ValueError):
+        converter.parse_quantity("3")
+
+
+@pytest.mark.parametrize("text", ["abc", "3 furlongs", ""])
+def test_parse_quantity_invalid(converter, text):
+    with pytest.raises(ValueError):
+        converter.parse_quantity(text)
+
+
+def test_convert_quantities_mixed_units(converter):
+    result = converter.convert_quantities(["1 km", "250 cm", "-40 °F"], "m")
+    assert result == pytest.approx([1000.0, 2.5, -40.0])
+
+
+def test_convert_quantities_collect(converter):
+    result, failures = converter.convert_quantities(["1 km", "bad", None, "2 parsec"], "m", errors="collect")
+    assert result[0] == pytest.approx(1000.0)
+    assert all(math.isnan(value) for value in result[1:])
+    assert failures == [1, 2, 3]
+
+
+def test_convert_quantities_raises_on_bad_string(converter):
+    with pytest.raises(ValueError):
+        converter.convert_quantities(["1 km", "bad"], "m")
+
+
+def test_convert_quantities_unknown_unit_suggests(converter):
+    from base_class import InvalidUnitError
+    with pytest.raises(InvalidUnitError) as error:
+        converter.convert_quantities(["1 km", "2 kmm"], "m")
+    assert error.value.suggestions == {"kmm": ["km"]}
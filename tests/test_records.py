@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+dataclass = pytest.importorskip("dataclasses").dataclass
+
+from records import RecordSchema  # noqa: E402
+
+
+@dataclass
+class Reading:
+    sensor: str
+    temp: float
+    depth: float
+
+
+@dataclass(frozen=True)
+class FrozenReading:
+    temp: float
+
+
+class SlotReading:
+    __slots__ = ("temp", "depth")
+
+    def __init__(self, temp, depth):
+        self.temp = temp
+        self.depth = depth
+
+
+FIELDS = {"temp": ("°C", "°F"), "depth": ("km", "m")}
+
+
+def test_convert_copies_dataclass(converter):
+    schema = RecordSchema(Reading, FIELDS, converter)
+    record = Reading("a", 100, 1.5)
+    converted = schema.convert(record)
+    assert converted == Reading("a", pytest.approx(212.0), pytest.approx(1500.0))
+    assert record.temp == 100
+
+
+def test_convert_frozen_dataclass(converter):
+    schema = RecordSchema(FrozenReading, {"temp": ("°C", "K")}, converter)
+    assert schema.convert(FrozenReading(0)).temp == pytest.approx(273.15)
+
+
+def test_convert_many_in_place_slots(converter):
+    schema = RecordSchema(SlotReading, FIELDS, converter)
+    records = [SlotReading(t, None) for t in range(5)]
+    assert schema.convert_many(records, inplace=True) == records
+    assert [record.temp for record in records] == pytest.approx([32, 33.8, 35.6, 37.4, 39.2])
+    assert all(record.depth is None for record in records)
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_convert_many_errors(converter, inplace):
+    schema = RecordSchema(Reading, FIELDS, converter)
+    records = [Reading("a", 1, 1), Reading("b", "hot", 1)]
+    with pytest.raises(ValueError):
+        schema.convert_many(records, inplace)
+    assert records == [Reading("a", 1, 1), Reading("b", "hot", 1)]
+    records = schema.convert_many([Reading("b", "hot", 2)], inplace, errors="coerce")
+    assert math.isnan(records[0].temp) and records[0].depth == pytest.approx(2000.0)
+
+
+def test_schema_validates_attributes(converter):
+    with pytest.raises(AttributeError):
+        RecordSchema(SlotReading, {"pressure": ("m", "km")}, converter)
+    with pytest.raises(ValueError):
+        RecordSchema(Reading, {"temp": ("°C", "parsec")}, converter)
+
+
+def test_schema_detects_categories():
+    schema = RecordSchema(Reading, {"temp": ("°F", "K"), "depth": ("mi", "km")})
+    converted = schema.convert(Reading("a", 32, 1))
+    assert converted.temp == pytest.approx(273.15)
+    assert converted.depth == pytest.approx(1.609344, rel=1e-6)
@@ -0,0 +1,65 @@
+import pytest
+
+registry = pytest.importorskip("registry")
+from base_class import Converter
+
+
+@pytest.fixture
+def reg():
+    reg = registry.ConverterRegistry()
+    reg.register("Length", Converter({"m": (1, 0), "km": (0.001, 0), "pt": (2834.6, 0)}))
+    reg.register("Volume", Converter({"L": (1, 0), "mL": (1000, 0), "pt": (2.1134, 0)}))
+    return reg
+
+
+def test_convert_detects_category(reg):
+    assert reg.convert(1, "km", "m") == pytest.approx(1000)
+    assert reg.convert(1000, "mL", "L") == pytest.approx(1)
+
+
+def test_shared_unit_resolved_by_other_unit(reg):
+    assert reg.find("pt", "L") == "Volume"
+    assert reg.find("m", "pt") == "Length"
+
+
+def test_ambiguous_pair_raises(reg):
+    with pytest.raises(registry.AmbiguousUnitError) as excinfo:
+        reg.convert(1, "pt", "pt")
+    assert excinfo.value.categories == ["Length", "Volume"]
+    assert isinstance(excinfo.value, ValueError)
+    assert reg.convert(1, "pt", "pt", category="Volume") == pytest.approx(1)
+
+
+def test_unknown_or_mismatched_units_raise_value_error(reg):
+    with pytest.raises(ValueError):
+        reg.convert(1, "m", "L")
+    with pytest.raises(ValueError):
+        reg.convert(1, "m", "parsec")
+
+
+def test_ambiguous_units_report(reg):
+    assert reg.ambiguous_units() == {"pt": ["Length", "Volume"]}
+
+
+def test_factories_with_unit_names_are_not_constructed(reg):
+    calls = []
+
+    def make_weight():
+        calls.append(1)
+        return Converter({"kg": (1, 0), "g": (1000, 0)})
+    reg.register("Weight", make_weight, units=["kg", "g"])
+    assert reg.categories_of("g") == ["Weight"]
+    reg.convert(1, "km", "m")
+    assert calls == []
+    assert reg.convert(1, "kg", "g") == pytest.approx(1000)
+    assert calls == [1]
+
+
+def test_duplicate_category_raises(reg):
+    with pytest.raises(ValueError):
+        reg.register("Length", Converter({"m": (1, 0)}))
+
+
+def test_default_registry_covers_converters_module():
+    assert registry.convert(1, "mi", "km") == pytest.approx(1.609344, rel=1e-6)
+    assert "Temperature" in registry.default_registry()
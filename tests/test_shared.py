@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+
+from shared import ConversionPool, convert_shared  # noqa: E402
+
+
+@pytest.fixture
+def block():
+    values = array("d", range(100))
+    memory = shared_memory.SharedMemory(create=True, size=len(values) * values.itemsize)
+    memory.buf[:len(values) * values.itemsize] = values.tobytes()
+    yield memory
+    memory.close()
+    memory.unlink()
+
+
+def read(memory, count=100):
+    return array("d", bytes(memory.buf[:count * 8]))
+
+
+def test_convert_shared_in_place(converter, block):
+    assert convert_shared(converter, block.name, "°C", "°F", offset=10, length=5) == 5
+    values = read(block)
+    assert list(values[10:15]) == pytest.approx([converter.convert(v, "°C", "°F") for v in range(10, 15)])
+    assert values[9] == 9 and values[15] == 15
+
+
+def test_convert_shared_into_second_block(converter, block):
+    out = shared_memory.SharedMemory(create=True, size=100 * 8)
+    try:
+        convert_shared(converter, block.name, "km", "m", out_name=out.name)
+        assert list(read(out)) == pytest.approx([v * 1000 for v in range(100)])
+        assert list(read(block)) == list(range(100))
+    finally:
+        out.close()
+        out.unlink()
+
+
+def test_convert_shared_range_overflow(converter, block):
+    with pytest.raises(ValueError):
+        convert_shared(converter, block.name, "m", "km", offset=90, length=20)
+
+
+def test_pool_converts_chunks_in_place(converter, block):
+    with ConversionPool(converter, [("m", "km"), ("°C", "K", True)], processes=2) as pool:
+        assert pool.convert(block.name, 100, pair_id=0, chunk_size=7) == 100
+        pool.convert(block.name, 10, pair_id=1)
+    values = read(block)
+    assert list(values[:10]) == pytest.approx([v / 1000 for v in range(10)])
+    assert list(values[10:]) == pytest.approx([v / 1000 for v in range(10, 100)])
+
+
+def test_pool_rejects_invalid_pair(converter):
+    with pytest.raises(ValueError):
+        ConversionPool(converter, [("m", "parsec")], processes=1)
+
+
+_TRACKER_SCRIPT = """
+from multiprocessing import shared_memory
+from Converters import Length
+from shared import ConversionPool, convert_shared
+
+if __name__ == "__main__":
+    block = shared_memory.SharedMemory(create=True, size=8 * 100)
+    convert_shared(Length, block.name, "m", "km")
+    with ConversionPool(Length, [("m", "km")], processes=2) as pool:
+        pool.convert(block.name, 100, pair_id=0, chunk_size=10)
+    block.close()
+    block.unlink()
+"""
+
+
+def test_blocks_are_unlinked_once_without_tracker_errors(tmp_path):
+    script = tmp_path / "tracker_script.py"
+    script.write_text(_TRACKER_SCRIPT, encoding="utf-8")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run([sys.executable, str(script)], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            env=environment, timeout=120)
+    assert result.returncode == 0, result.stderr.decode()
+    assert b"Traceback" not in result.stderr and b"leaked" not in result.stderr, result.stderr.decode()
@@ -11,3 +11,15 @@ def test_convert_length_scaling(converter):
 
 def test_convert_same_unit_returns_same_value(converter):
     assert converter.convert(123, "m", "m") == 123
+
+def test_invalidate_caches_after_changing_units(converter):
+    assert converter.convert([1], "m", "cm") == [100]
+    converter.units["cm"] = (1000, 0)
+    converter.invalidate_caches()
+    assert converter.convert([1], "m", "cm") == [1000]
+
+def test_affine_matches_convert(converter):
+    scale, offset = converter.affine("°C", "°F")
+    assert (scale, offset) == pytest.approx((1.8, 32))
+    assert converter.affine("°C", "°F", delta=True) == pytest.approx((1.8, 0))
+    assert 300 * converter.affine("K", "°C")[0] + converter.affine("K", "°C")[1] == pytest.approx(26.85)
@@ -0,0 +1,44 @@
+import shutil
+
+import pytest
+
+snapshot = pytest.importorskip("snapshot")
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "units.snapshot")
+    snapshot.build_snapshot(path)
+    converters = snapshot.load_converters(path)
+    import Converters
+    assert converters["Length"].units == Converters.Length.units
+    assert converters["Length"] is not Converters.Length
+    assert converters["Temperature"].convert(25, "ºC", "°F") == pytest.approx(77.0)
+
+
+def test_stale_snapshot_falls_back_to_module(tmp_path):
+    source = str(tmp_path / "Converters.py")
+    shutil.copy(snapshot.DEFAULT_SOURCE, source)
+    path = str(tmp_path / "units.snapshot")
+    snapshot.build_snapshot(path, source=source)
+    with open(source, "a") as file:
+        file.write("\n# edited\n")
+    import Converters
+    assert snapshot.load_converters(path, source=source)["Length"] is Converters.Length
+
+
+def test_base_class_change_makes_snapshot_stale(tmp_path, monkeypatch):
+    base = str(tmp_path / "base_class.py")
+    shutil.copy(snapshot.BASE_SOURCE, base)
+    monkeypatch.setattr(snapshot, "BASE_SOURCE", base)
+    path = str(tmp_path / "units.snapshot")
+    snapshot.build_snapshot(path)
+    with open(base, "a") as file:
+        file.write("\n# edited\n")
+    import Converters
+    assert snapshot.load_converters(path)["Length"] is Converters.Length
+
+
+def test_missing_snapshot_falls_back_to_module(tmp_path):
+    import Converters
+    converters = snapshot.load_converters(str(tmp_path / "missing"))
+    assert converters["Speed"] is Converters.Speed
@@ -0,0 +1,46 @@
+import sqlite3
+
+import pytest
+
+sqlite_functions = pytest.importorskip("sqlite_functions")
+from registry import ConverterRegistry
+
+
+@pytest.fixture
+def connection(converter):
+    registry = ConverterRegistry()
+    registry.register("Test", converter)
+    connection = sqlite3.connect(":memory:")
+    sqlite_functions.register_functions(connection, registry)
+    connection.execute("CREATE TABLE readings (value REAL, unit TEXT)")
+    connection.executemany("INSERT INTO readings VALUES (?, ?)",
+                           [(1, "km"), (250, "cm"), (None, "m"), (500, "m")])
+    yield connection
+    connection.close()
+
+
+def test_convert_in_select_and_update(connection):
+    assert connection.execute("SELECT convert(25, '°C', '°F')").fetchone()[0] == pytest.approx(77.0)
+    assert connection.execute("SELECT convert(10, '°C', '°F', 1)").fetchone()[0] == pytest.approx(18.0)
+    connection.execute("UPDATE readings SET value = convert(value, unit, 'm'), unit = 'm'")
+    values = [row[0] for row in connection.execute("SELECT value FROM readings")]
+    assert values == [pytest.approx(1000.0), pytest.approx(2.5), None, pytest.approx(500.0)]
+
+
+def test_aggregates(connection):
+    total, average = connection.execute(
+        "SELECT sum_in(value, unit, 'm'), avg_in(value, unit, 'km') FROM readings").fetchone()
+    assert total == pytest.approx(1502.5)
+    assert average == pytest.approx(1502.5 / 3 / 1000)
+    assert connection.execute("SELECT sum_in(value, unit, 'm') FROM readings WHERE 0").fetchone()[0] is None
+
+
+def test_invalid_unit_fails_statement(connection):
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("SELECT convert(1, 'm', 'parsec')").fetchone()
+
+
+def test_convert_rejects_other_argument_counts(connection):
+    for statement in ("SELECT convert(1, 'm')", "SELECT convert(1, 'm', 'km', 0, 0)"):
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute(statement).fetchone()
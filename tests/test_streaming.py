@@ -0,0 +1,158 @@
+import io
+import json
+import math
+
+import pytest
+
+streaming = pytest.importorskip("streaming")
+
+
+def _records(data):
+    return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+
+
+def test_convert_ndjson_stream(converter):
+    compiled = streaming.compile_fields({"t": ("°C", "°F"), "d": ("km", "m")}, converter)
+    source = io.BytesIO(b'{"t": 25, "d": "1.5", "id": "a"}\n{"id": "b", "t": null}\n\n')
+    destination = io.BytesIO()
+    stats = streaming.convert_ndjson(source, destination, compiled)
+    records = _records(destination.getvalue())
+    assert records[0] == {"t": pytest.approx(77.0), "d": pytest.approx(1500.0), "id": "a"}
+    assert records[1] == {"id": "b", "t": None}
+    assert stats == {"records": 2, "converted": 2, "failures": 0}
+
+
+def test_convert_ndjson_errors(converter):
+    compiled = streaming.compile_fields({"t": ("°C", "°F")}, converter)
+    data = b'{"t": "warm"}\n{"t": 0}\n'
+    with pytest.raises(ValueError):
+        streaming.convert_ndjson(io.BytesIO(data), io.BytesIO(), compiled)
+    destination = io.BytesIO()
+    stats = streaming.convert_ndjson(io.BytesIO(data), destination, compiled, errors="coerce")
+    assert _records(destination.getvalue()) == [{"t": None}, {"t": pytest.approx(32.0)}]
+    assert stats["failures"] == 1
+
+
+def test_compile_fields_detects_category():
+    compiled = streaming.compile_fields({"d": ("mi", "km")})
+    record = {"d": 1}
+    streaming.convert_record(record, compiled)
+    assert record["d"] == pytest.approx(1.609344, rel=1e-6)
+
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_convert_ndjson_file_sharded(converter, tmp_path, processes):
+    source = tmp_path / "in.ndjson"
+    source.write_bytes(b"".join(json.dumps({"i": i, "d": i}).encode() + b"\n" for i in range(500)))
+    destination = tmp_path / "out.ndjson"
+    stats = streaming.convert_ndjson_file(str(source), str(destination), {"d": ("km", "m")}, converter,
+                                          processes=processes)
+    records = _records(destination.read_bytes())
+    assert [record["i"] for record in records] == list(range(500))
+    assert all(math.isclose(record["d"], record["i"] * 1000) for record in records)
+    assert stats["records"] == 500
+    assert not list(tmp_path.glob("*.part*"))
+
+
+def test_cli_ndjson(tmp_path):
+    unitconv = pytest.importorskip("unitconv")
+    source = tmp_path / "in.ndjson"
+    source.write_text('{"d": 2}\n', encoding="utf-8")
+    destination = tmp_path / "out.ndjson"
+    assert unitconv.main(["ndjson", str(source), str(destination), "--field", "d:km:m",
+                          "--converter", "Length"]) == 0
+    assert _records(destination.read_bytes()) == [{"d": pytest.approx(2000.0)}]
+
+
+def test_convert_lines_numbers(converter):
+    plan = converter._pair_plan("°C", "°F", False)
+    destination = io.BytesIO()
+    stats = streaming.convert_lines(io.BytesIO(b"0\n100\n\n-40"), destination, plan, block_size=3)
+    assert destination.getvalue() == b"32.0\n212.0\n\n-40.0\n"
+    assert stats == {"lines": 4, "converted": 3, "failures": 0}
+
+
+def test_convert_lines_columns(converter):
+    plan = converter._pair_plan("km", "m", False)
+    destination = io.BytesIO()
+    streaming.convert_lines(io.BytesIO(b"a,1,2\nb,3\n"), destination, plan, columns=[1, 2], delimiter=",")
+    assert destination.getvalue() == b"a,1000.0,2000.0\nb,3000.0\n"
+    destination = io.BytesIO()
+    streaming.convert_lines(io.BytesIO(b"x   1\n"), destination, plan, columns=[1])
+    assert destination.getvalue() == b"x 1000.0\n"
+
+
+def test_convert_lines_errors(converter):
+    plan = converter._pair_plan("km", "m", False)
+    with pytest.raises(ValueError):
+        streaming.convert_lines(io.BytesIO(b"1\nwarm\n"), io.BytesIO(), plan)
+    destination = io.BytesIO()
+    stats = streaming.convert_lines(io.BytesIO(b"1 warm\n"), destination, plan, columns=[0, 1], errors="coerce")
+    assert destination.getvalue() == b"1000.0 nan\n"
+    assert stats["failures"] == 1
+
+
+def test_cli_filter(monkeypatch, capsysbinary):
+    unitconv = pytest.importorskip("unitconv")
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO("32\n212\n".encode())))
+    assert unitconv.main(["filter", "--converter", "Temperature", "--from", "°F", "--to", "K"]) == 0
+    values = [float(line) for line in capsysbinary.readouterr().out.split()]
+    assert values == pytest.approx([273.15, 373.15])
+
+
+def test_follow_ndjson_resumes_from_checkpoint(converter, tmp_path):
+    source, destination = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    source.write_bytes(b'{"d": 1}\n{"d": 2}\n{"d": ')
+    follow = lambda: streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter,
+                                             once=True)
+    assert follow()["records"] == 2
+    assert follow()["records"] == 0
+    with open(source, "ab") as file:
+        file.write(b'3}\n{"d": 4}\n')
+    assert follow()["records"] == 2
+    assert [record["d"] for record in _records(destination.read_bytes())] == pytest.approx([1000, 2000, 3000, 4000])
+
+
+def test_follow_ndjson_discards_unfinished_output(converter, tmp_path):
+    source, destination = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    source.write_bytes(b'{"d": 1}\n')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    with open(destination, "ab") as file:
+        file.write(b'{"partial": ')
+    with open(source, "ab") as file:
+        file.write(b'{"d": 2}\n')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    assert [record["d"] for record in _records(destination.read_bytes())] == pytest.approx([1000, 2000])
+
+
+def test_follow_ndjson_discards_output_of_interrupted_first_pass(converter, tmp_path):
+    source, destination = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    source.write_bytes(b'{"d": 1}\n{"d": "x"}\n')
+    with pytest.raises(ValueError):
+        streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    with open(source, "r+b") as file:  # fix the bad record in place, keeping the inode
+        file.seek(15)
+        file.write(b'2  ')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    assert [record["d"] for record in _records(destination.read_bytes())] == pytest.approx([1000, 2000])
+
+
+def test_follow_ndjson_discards_unfinished_output_without_new_input(converter, tmp_path):
+    source, destination = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    source.write_bytes(b'{"d": 1}\n')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    size = destination.stat().st_size
+    with open(destination, "ab") as file:
+        file.write(b'{"partial": ')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    checkpoint = json.loads((tmp_path / "out.ndjson.checkpoint").read_text())
+    assert destination.stat().st_size == checkpoint["output_size"] == size
+
+
+def test_follow_ndjson_restarts_truncated_file(converter, tmp_path):
+    source, destination = tmp_path / "in.ndjson", tmp_path / "out.ndjson"
+    source.write_bytes(b'{"d": 1}\n{"d": 2}\n')
+    streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter, once=True)
+    source.write_bytes(b'{"d": 3}\n')
+    assert streaming.follow_ndjson(str(source), str(destination), {"d": ("km", "m")}, converter,
+                                   once=True)["records"] == 1
@@ -0,0 +1,48 @@
+import pytest
+
+from base_class import Converter, InvalidUnitError
+from suggestions import UnitIndex, edit_distance
+
+
+def test_edit_distance():
+    assert edit_distance("km", "km") == 0
+    assert edit_distance("mk", "km") == 1
+    assert edit_distance("kmm", "km") == 1
+    assert edit_distance("feet", "ft") == 2
+
+
+def test_unit_index_ranks_suggestions():
+    index = UnitIndex(["m", "km", "cm", "mm", "mi", "ft", "yd", "nmi", "Mm"])
+    assert index.suggest("MI")[0] == "mi"
+    assert index.suggest("kmm")[0] == "km"
+    assert index.suggest("nm1") == ["nmi"]
+    assert index.suggest("parsec") == []
+
+
+def test_invalid_units_carry_suggestions(converter):
+    with pytest.raises(InvalidUnitError) as info:
+        converter.convert(1, "kmm", "m")
+    assert info.value.suggestions == {"kmm": ["km"]}
+    assert "did you mean 'km'" in str(info.value)
+    with pytest.raises(ValueError, match="Invalid unit: °G"):
+        converter.parse_quantity("3 °G")
+
+
+def test_suggestion_index_follows_unit_changes(converter):
+    assert converter.suggest_units("mmm") == []
+    converter.units["mm"] = (1000, 0)
+    assert converter.suggest_units("mmm")[0] == "mm"
+
+
+def test_registry_suggestions():
+    registry = pytest.importorskip("registry")
+    with pytest.raises(InvalidUnitError) as info:
+        registry.convert(1, "kmm", "m")
+    assert "km" in info.value.suggestions["kmm"]
+
+
+def test_suggestion_index_is_built_once():
+    converter = Converter({f"unit{i}": i + 1 for i in range(500)})
+    assert converter.suggest_units("uint42")[0] == "unit42"
+    index = converter._suggestion_index
+    assert converter.suggest_units("unti7")[0] == "unit7" and converter._suggestion_index is index
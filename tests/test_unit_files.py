@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+unit_files = pytest.importorskip("unit_files")
+from base_class import Converter
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    path = tmp_path / "plant.json"
+    path.write_text(json.dumps({
+        "units": {"m": 1, "ft": [3.2808399, 0], "K": {"scale": 1, "offset": 273.15}},
+        "aliases": {"metre": "m"},
+        "prefixed": {"m": ["k", "c"], "K": ["m"]},
+    }), encoding="utf-8")
+    return path
+
+
+def test_load_json_with_aliases_and_prefixes(json_file, tmp_path):
+    conv = Converter.from_file(str(json_file), cache_dir=str(tmp_path / "cache"))
+    assert conv.units["m"] == (1, 0)
+    assert conv.units["metre"] == (1, 0)
+    assert conv.convert(1, "km", "cm") == pytest.approx(100000.0)
+    assert conv.units["mK"] == pytest.approx((1e3, 273.15e3))
+
+
+def test_load_csv(tmp_path):
+    path = tmp_path / "units.csv"
+    path.write_text("unit,scale,offset,aliases,prefixes\nm,1,0,metre,*\nft,3.2808399,0,foot,\n", encoding="utf-8")
+    conv = Converter.from_file(str(path), cache_dir=False)
+    assert conv.convert(1, "foot", "mm") == pytest.approx(304.8, rel=1e-6)
+
+
+def test_compiled_cache_skips_parsing(json_file, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    first = unit_files.load_units(str(json_file), cache_dir)
+    unit_files._memory_cache.clear()
+
+    def fail(data):
+        raise AssertionError("parsed again")
+    monkeypatch.setitem(unit_files._PARSERS, ".json", fail)
+    assert unit_files.load_units(str(json_file), cache_dir) == first
+
+
+def test_changed_file_is_recompiled(json_file, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    unit_files.load_units(str(json_file), cache_dir)
+    json_file.write_text(json.dumps({"units": {"m": 1, "yd": 1.0936133}}), encoding="utf-8")
+    assert set(unit_files.load_units(str(json_file), cache_dir)) == {"m", "yd"}
+
+
+def test_unwritable_cache_dir_still_loads(json_file, tmp_path, monkeypatch):
+    def deny(*args, **kwargs):
+        raise PermissionError("read-only share")
+    monkeypatch.setattr(unit_files.os, "makedirs", deny)
+    units = unit_files.load_units(str(json_file), str(tmp_path / "cache"))
+    assert units["km"] == (0.001, 0)
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.parametrize("definitions", [
+    {"units": {"m": "one"}},
+    {"units": {"m": 1}, "aliases": {"metre": "meter"}},
+    {"units": {"m": 1, "km": 0.001}, "prefixed": ["m"]},
+])
+def test_invalid_definitions_raise_value_error(definitions):
+    with pytest.raises(ValueError):
+        unit_files.compile_units(definitions)
@@ -0,0 +1,231 @@
+"""
+External Unit Definition Files
+
+This module loads unit definitions from JSON, TOML or CSV files, so site-specific
+units can be added without editing `Converters.py`. A file is compiled once into the
+(scale_factor, offset) table used by `Converter`, and the compiled table is cached
+on disk keyed by the file's modification time, size and content hash, so later loads
+(in this or any other worker process) skip parsing.
+
+JSON / TOML layout:
+    {
+        "units": {"m": 1, "ft": [3.2808399, 0], "°F": {"scale": 1.8, "offset": 32}},
+        "aliases": {"metre": "m", "foot": "ft"},
+        "prefixes": {"k": 1e3, "c": 1e-2},    # optional, defaults to SI_PREFIXES
+        "prefixed": ["m"]                      # or {"m": ["k", "c"]}
+    }
+
+CSV layout (header required, `aliases` and `prefixes` are space separated, a
+`prefixes` value of `*` applies every SI prefix):
+    unit,scale,offset,aliases,prefixes
+    m,1,0,metre,k c m
+    ft,3.2808399,0,foot,
+
+As everywhere in the project, scale factors express how many of the unit make one
+base unit. A single number is a scale factor with a zero offset. A prefix multiplies
+the size of the unit, so prefixing divides both its scale factor and its offset.
+
+Example Usage:
+    >>> from base_class import Converter
+    >>> plant_units = Converter.from_file("plant_units.json")
+"""
+
+import csv
+import hashlib
+import io
+import json
+import marshal
+import os
+from numbers import Number
+
+from snapshot import dump_payload
+
+# Bump when the layout of the compiled cache changes
+CACHE_FORMAT = 1
+
+SI_PREFIXES = {
+    "da": 1e1, "h": 1e2, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15,
+    "E": 1e18, "Z": 1e21, "Y": 1e24, "R": 1e27, "Q": 1e30,
+    "d": 1e-1, "c": 1e-2, "m": 1e-3, "µ": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15,
+    "a": 1e-18, "z": 1e-21, "y": 1e-24, "r": 1e-27, "q": 1e-30,
+}
+
+# Compiled tables already loaded by this process, keyed by (path, mtime_ns, size)
+_memory_cache = {}
+
+
+def _parse_json(data):
+    return json.loads(data.decode("utf-8"))
+
+
+def _parse_toml(data):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("Reading TOML unit files requires Python 3.11+ or the 'tomli' package")
+    return tomllib.loads(data.decode("utf-8"))
+
+
+def _parse_csv(data):
+    """
+    Turn the rows of a CSV unit file into the JSON/TOML layout.
+    """
+    definitions = {"units": {}, "aliases": {}, "prefixed": {}}
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    for row in reader:
+        unit = (row.get("unit") or "").strip()
+        if not unit:
+            continue
+        try:
+            scale = float(row["scale"])
+            offset = float(row.get("offset") or 0)
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"The row for '{unit}' must have a numeric scale and offset.")
+        definitions["units"][unit] = (scale, offset)
+        for alias in (row.get("aliases") or "").split():
+            definitions["aliases"][alias] = unit
+        prefixes = (row.get("prefixes") or "").split()
+        if prefixes == ["*"]:
+            definitions["prefixed"][unit] = list(SI_PREFIXES)
+        elif prefixes:
+            definitions["prefixed"][unit] = prefixes
+    return definitions
+
+
+_PARSERS = {".json": _parse_json, ".toml": _parse_toml, ".csv": _parse_csv}
+
+
+def _unit_value(unit, value):
+    """
+    Normalize one unit definition to a (scale_factor, offset) tuple.
+    """
+    if isinstance(value, Number) and not isinstance(value, bool):
+        return (value, 0)
+    if isinstance(value, dict) and "scale" in value:
+        value = (value["scale"], value.get("offset", 0))
+    if isinstance(value, (list, tuple)) and len(value) == 2 and all(
+        isinstance(i, Number) and not isinstance(i, bool) for i in value
+    ):
+        return tuple(value)
+    raise ValueError(f"The value for '{unit}' must be a number, a pair of numbers or a scale/offset table.")
+
+
+def compile_units(definitions):
+    """
+    Compile parsed unit definitions into a Converter table.
+
+    Args:
+        definitions (dict): Mapping with "units" and optional "aliases",
+            "prefixes" and "prefixed" entries (see the module docstring)
+
+    Returns:
+        dict: Unit symbols mapped to (scale_factor, offset) tuples
+
+    Raises:
+        ValueError: If a definition is malformed, an alias or prefix is unknown, or
+            two definitions produce the same unit name
+    """
+    if not isinstance(definitions, dict) or not isinstance(definitions.get("units"), dict):
+        raise ValueError("A unit file must define a 'units' table.")
+    table = {unit: _unit_value(unit, value) for unit, value in definitions["units"].items()}
+
+    def add(name, value):
+        if name in table:
+            raise ValueError(f"The unit '{name}' is defined more than once.")
+        table[name] = value
+
+    prefixes = definitions.get("prefixes", SI_PREFIXES)
+    prefixed = definitions.get("prefixed", {})
+    if isinstance(prefixed, list):
+        prefixed = {unit: list(prefixes) for unit in prefixed}
+    for unit, names in prefixed.items():
+        if unit not in table:
+            raise ValueError(f"Cannot prefix unknown unit '{unit}'.")
+        scale, offset = table[unit]
+        for prefix in names:
+            if prefix not in prefixes:
+                raise ValueError(f"Unknown prefix '{prefix}' for unit '{unit}'.")
+            factor = prefixes[prefix]
+            add(prefix + unit, (scale / factor, offset / factor))
+
+    for alias, unit in definitions.get("aliases", {}).items():
+        if unit not in table:
+            raise ValueError(f"The alias '{alias}' refers to unknown unit '{unit}'.")
+        add(alias, table[unit])
+    return table
+
+
+def _default_cache_path(path):
+    directory, name = os.path.split(path)
+    return os.path.join(directory, "__unitcache__", f"{name}.units")
+
+
+def load_units(path, cache_dir=None):
+    """
+    Load and compile a unit definition file, reusing a cached compilation if possible.
+
+    Args:
+        path (str): A .json, .toml or .csv unit file
+        cache_dir (str): Directory for the compiled cache; defaults to a
+            `__unitcache__` directory next to the file, False disables the disk cache
+
+    Returns:
+        dict: Unit symbols mapped to (scale_factor, offset) tuples
+
+    Raises:
+        ValueError: If the file type is not supported or its definitions are invalid
+    """
+    path = os.path.abspath(path)
+    parser = _PARSERS.get(os.path.splitext(path)[1].lower())
+    if parser is None:
+        raise ValueError(f"Unsupported unit file type: {path}")
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key in _memory_cache:
+        return dict(_memory_cache[key])
+
+    if cache_dir is False:
+        cache_path = None
+    elif cache_dir is None:
+        cache_path = _default_cache_path(path)
+    else:
+        cache_path = os.path.join(cache_dir, hashlib.sha256(path.encode()).hexdigest()[:16] + ".units")
+
+    cached = None
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as file:
+                cached = marshal.load(file)
+            if not isinstance(cached, dict) or cached.get("format") != CACHE_FORMAT:
+                cached = None
+        except (OSError, EOFError, ValueError, TypeError):
+            cached = None
+
+    if cached is not None and (cached["mtime_ns"], cached["size"]) == key[1:]:
+        table = cached["table"]
+    else:
+        with open(path, "rb") as file:
+            data = file.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if cached is not None and cached["hash"] == digest:
+            # Touched but unchanged, e.g. freshly checked out on another worker
+            table = cached["table"]
+        else:
+            table = compile_units(parser(data))
+        if cache_path is not None:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                dump_payload({
+                    "format": CACHE_FORMAT,
+                    "mtime_ns": key[1],
+                    "size": key[2],
+                    "hash": digest,
+                    "table": table,
+                }, cache_path)
+            except OSError:
+                pass  # e.g. a read-only share; the table is still used, just not cached
+    _memory_cache[key] = table
+    return dict(table)
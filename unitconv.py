@@ -0,0 +1,199 @@
+"""
+Unit Converter Command Line
+
+This module implements the scripting entry point of the unit converter. Run it with
+`python -m unitconv <command> ...`; `python -m unitconv --help` lists the commands.
+
+Commands:
+    - ndjson: Convert fields of newline-delimited JSON records
+    - filter: Convert numbers (or delimited columns) from stdin to stdout
+    - follow: Convert records appended to a growing NDJSON file
+
+Example Usage:
+    $ python -m unitconv ndjson readings.ndjson out.ndjson --field temp:°F:ºC --processes 4
+    $ cut -d, -f3 readings.csv | python -m unitconv filter --converter Temperature --from °F --to K
+"""
+
+import argparse
+import os
+import sys
+
+
+def _parse_field(spec):
+    """
+    Parse a "name:origin_unit:final_unit" field specification.
+    """
+    parts = spec.rsplit(":", 2)
+    if len(parts) != 3 or not all(parts):
+        raise argparse.ArgumentTypeError(f"expected NAME:FROM:TO, got {spec!r}")
+    return parts[0], (parts[1], parts[2])
+
+
+def _converter_arg(name):
+    """
+    Look up a converter category of the default registry by name (None for auto-detection).
+    """
+    if name is None:
+        return None
+    from registry import default_registry
+    registry = default_registry()
+    if name not in registry:
+        raise SystemExit(f"Unknown converter: {name} (choose from {', '.join(registry.names())})")
+    return registry.get(name)
+
+
+def _parse_columns(spec):
+    """
+    Parse a comma-separated list of 1-based column numbers into 0-based indexes.
+    """
+    try:
+        columns = [int(part) - 1 for part in spec.split(",")]
+    except ValueError:
+        columns = [-1]
+    if min(columns) < 0:
+        raise argparse.ArgumentTypeError(f"expected column numbers like 2 or 2,5, got {spec!r}")
+    return columns
+
+
+def _pair_plan(converter, origin_unit, final_unit, delta):
+    """
+    Resolve the pair plan of a conversion, detecting the category if no converter is given.
+    """
+    if converter is None:
+        from registry import default_registry
+        registry = default_registry()
+        converter = registry.get(registry.find(origin_unit, final_unit))
+    return converter._pair_plan(origin_unit, final_unit, delta)
+
+
+def run_filter(args):
+    """
+    Run the `filter` command.
+    """
+    from streaming import convert_lines
+
+    plan = _pair_plan(_converter_arg(args.converter), args.from_unit, args.to_unit, args.delta)
+    try:
+        stats = convert_lines(sys.stdin.buffer, sys.stdout.buffer, plan, args.fields, args.delimiter,
+                              args.errors, args.block_size)
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other filters
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    if stats["failures"]:
+        print(f"{stats['failures']} value(s) could not be converted", file=sys.stderr)
+    return 0
+
+
+def run_ndjson(args):
+    """
+    Run the `ndjson` command.
+    """
+    from streaming import compile_fields, convert_ndjson, convert_ndjson_file
+
+    fields = dict(args.field)
+    converter = _converter_arg(args.converter)
+    if args.input == "-" or args.output == "-":
+        if args.processes > 1:
+            raise SystemExit("--processes needs file paths for both input and output")
+        compiled = compile_fields(fields, converter, delta=args.delta)
+        source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+        destination = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        try:
+            stats = convert_ndjson(source, destination, compiled, args.errors)
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+            if destination is not sys.stdout.buffer:
+                destination.close()
+            else:
+                destination.flush()
+    else:
+        stats = convert_ndjson_file(args.input, args.output, fields, converter, delta=args.delta,
+                                    errors=args.errors, processes=args.processes)
+    if stats["failures"]:
+        print(f"{stats['failures']} value(s) could not be converted", file=sys.stderr)
+    return 0
+
+
+def run_follow(args):
+    """
+    Run the `follow` command.
+    """
+    from streaming import follow_ndjson
+
+    try:
+        stats = follow_ndjson(args.input, args.output, dict(args.field), _converter_arg(args.converter),
+                              delta=args.delta, errors=args.errors, checkpoint_path=args.checkpoint,
+                              once=args.once, interval=args.interval)
+    except KeyboardInterrupt:
+        return 0
+    if stats["failures"]:
+        print(f"{stats['failures']} value(s) could not be converted", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    """
+    Build the argument parser with one subcommand per mode.
+    """
+    parser = argparse.ArgumentParser(prog="unitconv", description="Unit converter command line tools.")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    ndjson = commands.add_parser("ndjson", help="convert fields of newline-delimited JSON records")
+    ndjson.add_argument("input", help="input file, or - for stdin")
+    ndjson.add_argument("output", help="output file, or - for stdout")
+    ndjson.add_argument("--field", action="append", type=_parse_field, required=True,
+                        metavar="NAME:FROM:TO", help="field to convert (repeatable)")
+    ndjson.add_argument("--converter", help="converter category, e.g. Temperature (default: detect from units)")
+    ndjson.add_argument("--delta", action="store_true", help="convert values as deltas/intervals")
+    ndjson.add_argument("--errors", choices=("raise", "coerce"), default="raise",
+                        help="stop on bad values, or write null for them")
+    ndjson.add_argument("--processes", type=int, default=1, help="worker processes for file input")
+    ndjson.set_defaults(handler=run_ndjson)
+
+    filter_ = commands.add_parser("filter", help="convert numbers from stdin to stdout")
+    filter_.add_argument("--from", dest="from_unit", required=True, help="unit of the input values")
+    filter_.add_argument("--to", dest="to_unit", required=True, help="unit of the output values")
+    filter_.add_argument("--converter", help="converter category, e.g. Temperature (default: detect from units)")
+    filter_.add_argument("--fields", type=_parse_columns, metavar="N[,N...]",
+                         help="1-based columns to convert (default: each line is one number)")
+    filter_.add_argument("-d", "--delimiter", help="column separator (default: runs of whitespace)")
+    filter_.add_argument("--delta", action="store_true", help="convert values as deltas/intervals")
+    filter_.add_argument("--errors", choices=("raise", "coerce"), default="raise",
+                         help="stop on bad values, or write nan for them")
+    filter_.add_argument("--block-size", type=int, default=1 << 20, help="bytes read at a time")
+    filter_.set_defaults(handler=run_filter)
+
+    follow = commands.add_parser("follow", help="convert records appended to a growing NDJSON file")
+    follow.add_argument("input", help="input file that is being appended to")
+    follow.add_argument("output", help="output file converted records are appended to")
+    follow.add_argument("--field", action="append", type=_parse_field, required=True,
+                        metavar="NAME:FROM:TO", help="field to convert (repeatable)")
+    follow.add_argument("--converter", help="converter category, e.g. Temperature (default: detect from units)")
+    follow.add_argument("--delta", action="store_true", help="convert values as deltas/intervals")
+    follow.add_argument("--errors", choices=("raise", "coerce"), default="raise",
+                        help="stop on bad values, or write null for them")
+    follow.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.checkpoint)")
+    follow.add_argument("--once", action="store_true", help="convert new records once and exit, e.g. from cron")
+    follow.add_argument("--interval", type=float, default=1.0, help="seconds between polls")
+    follow.set_defaults(handler=run_follow)
+    return parser
+
+
+def main(argv=None):
+    """
+    Main function of the command line interface.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except ValueError as error:
+        print(f"unitconv: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())